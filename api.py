@@ -8,6 +8,7 @@ Permite integração fácil com sistemas externos e testes via curl/Postman.
 Endpoints:
     - POST /detect: Detecta dados pessoais em texto
     - POST /detect/batch: Processa múltiplos textos
+    - POST /detect/stream: Detecta em texto enviado em streaming (NDJSON)
     - POST /mask: Mascara dados pessoais no texto
     - POST /anonymize: Anonimiza texto
     - GET /health: Verificação de saúde da API
@@ -20,25 +21,54 @@ Autor: Aviahub
 Versão: 1.0.0
 """
 
+import asyncio
+import codecs
+import json
+import threading
 import time
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from hashlib import blake2b
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
-from fastapi import FastAPI, HTTPException, Query, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Query, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.requests import ClientDisconnect
 from pydantic import BaseModel, Field, validator
 
 from src.detector import PIIGuardian, DetectionMode
 from src.utils import (
-    mask_pii,
-    anonymize_text,
     normalize_text,
+    StreamingTextNormalizer,
     format_result_json,
     format_result_markdown,
     PerformanceMetrics
 )
 
+# Flag para verificar se orjson está disponível (opcional)
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    pass
+
+
+class _ORJSONResponse(JSONResponse):
+    """JSONResponse serializada com orjson (em C, direto para bytes)."""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Classe de resposta JSON da API. Os endpoints de detecção a instanciam
+# direto com o dicionário do resultado: o FastAPI não revalida a resposta
+# com os modelos Pydantic (mantidos apenas para a documentação OpenAPI).
+_JSON_RESPONSE_CLASS = _ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+
 
 # ============================================================================
 # CONFIGURAÇÃO DA API
@@ -70,6 +100,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=_JSON_RESPONSE_CLASS,
     contact={
         "name": "Equipe PIIGuardian",
         "email": "contato@piiguardian.com.br"
@@ -93,6 +124,138 @@ app.add_middleware(
 detector: Optional[PIIGuardian] = None
 metrics = PerformanceMetrics()
 
+# Modos de detecção aceitos pela API (tupla para listagem, frozenset para validação)
+DETECTION_MODES = ('strict', 'balanced', 'precise')
+_DETECTION_MODE_SET = frozenset(DETECTION_MODES)
+
+# Detectores por modo, construídos no startup (compartilham o modelo BERT)
+detectors: Dict[str, PIIGuardian] = {}
+
+# Cache LRU de textos normalizados: o mesmo documento costuma passar por
+# /detect, /mask e /anonymize. A chave é um digest do texto original, para
+# não manter em memória o texto recebido, só o normalizado.
+NORMALIZE_CACHE_SIZE = 1024
+_normalize_cache: "OrderedDict[bytes, str]" = OrderedDict()
+_normalize_cache_lock = threading.Lock()
+
+
+# Timestamp do /health, reaproveitado por até 1 segundo: o endpoint é
+# consultado com frequência pelos balanceadores de carga.
+_LAST_TS: Tuple[float, str] = (0.0, "")
+
+
+def _now_iso() -> str:
+    """Data/hora atual em ISO 8601, com resolução de 1 segundo."""
+    global _LAST_TS
+    now = time.time()
+    last = _LAST_TS
+    if now - last[0] > 1.0:
+        last = _LAST_TS = (now, datetime.fromtimestamp(now).isoformat())
+    return last[1]
+
+
+def _text_digest(text: str) -> bytes:
+    """Digest (16 bytes) do texto recebido: chave do cache e base do ETag."""
+    return blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+def _detect_etag(key: bytes, mode_detector: PIIGuardian) -> str:
+    """
+    ETag do /detect: digest do texto, versão da API e configuração do detector.
+    
+    Mudar thresholds, modo ou modelo gera outro ETag para o mesmo texto.
+    """
+    version = repr((app.version, mode_detector.config_fingerprint())).encode('utf-8')
+    return f'"{blake2b(key + version, digest_size=16).hexdigest()}"'
+
+
+def _normalize(text: str, key: Optional[bytes] = None) -> str:
+    """normalize_text com cache LRU indexado pelo digest do texto."""
+    if key is None:
+        key = _text_digest(text)
+    
+    with _normalize_cache_lock:
+        normalized = _normalize_cache.get(key)
+        if normalized is not None:
+            _normalize_cache.move_to_end(key)
+            return normalized
+    
+    normalized = normalize_text(text)
+    
+    with _normalize_cache_lock:
+        _normalize_cache[key] = normalized
+        if len(_normalize_cache) > NORMALIZE_CACHE_SIZE:
+            _normalize_cache.popitem(last=False)
+    
+    return normalized
+
+
+# Pool de processos do /detect/batch (fases de regex e validação),
+# criado no startup e reutilizado entre requisições
+worker_pool: Optional[ProcessPoolExecutor] = None
+
+
+# /detect/stream: janela de detecção e sobreposição entre janelas (caracteres).
+# A sobreposição evita perder um dado cortado entre duas janelas.
+STREAM_WINDOW_SIZE = 4096
+STREAM_WINDOW_OVERLAP = 128
+
+# Tamanho máximo do corpo do /detect/stream (bytes)
+STREAM_MAX_BYTES = 10 * 1024 * 1024
+
+
+def _ndjson_line(item: Dict[str, Any]) -> bytes:
+    """Serializa um objeto como uma linha NDJSON (orjson, se disponível)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(item, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+class _RequestStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse cujo gerador lê o corpo da própria requisição.
+    
+    Com ASGI < 2.4, o Starlette escuta desconexões chamando ``receive()``
+    em paralelo ao gerador, o que descartaria partes do corpo. A escuta só
+    começa depois que o gerador leu o corpo inteiro (``body_read``); antes
+    disso, uma desconexão interrompe o próprio ``request.stream()``.
+    """
+    
+    def __init__(self, content, body_read: asyncio.Event, **kwargs):
+        super().__init__(content, **kwargs)
+        self.body_read = body_read
+    
+    async def listen_for_disconnect(self, receive):
+        await self.body_read.wait()
+        await super().listen_for_disconnect(receive)
+
+
+def _stream_window_end(buffer: str) -> int:
+    """
+    Posição de corte da próxima janela do /detect/stream.
+    
+    Prefere o último fim de linha ou de frase (depois, o último espaço)
+    da janela; o corte fica sempre após duas sobreposições, para que a
+    janela seguinte avance no texto.
+    """
+    lower = 2 * STREAM_WINDOW_OVERLAP
+    
+    cut = buffer.rfind('\n', lower, STREAM_WINDOW_SIZE)
+    if cut < 0:
+        cut = max(buffer.rfind(end, lower, STREAM_WINDOW_SIZE) for end in ('. ', '! ', '? '))
+    if cut < 0:
+        cut = buffer.rfind(' ', lower, STREAM_WINDOW_SIZE)
+    
+    return cut + 1 if cut >= 0 else STREAM_WINDOW_SIZE
+
+
+def _get_detector(mode: str) -> PIIGuardian:
+    """Retorna o detector pré-construído do modo (cria se ainda não existir)."""
+    mode_detector = detectors.get(mode)
+    if mode_detector is None:
+        mode_detector = detectors[mode] = detector.with_mode(mode)
+    return mode_detector
+
 
 # ============================================================================
 # MODELOS PYDANTIC
@@ -115,7 +278,7 @@ class DetectRequest(BaseModel):
     
     @validator('mode')
     def validate_mode(cls, v):
-        if v not in ['strict', 'balanced', 'precise']:
+        if v not in _DETECTION_MODE_SET:
             raise ValueError("Modo deve ser 'strict', 'balanced' ou 'precise'")
         return v
 
@@ -129,6 +292,12 @@ class BatchDetectRequest(BaseModel):
         max_items=1000
     )
     mode: Optional[str] = Field(default="balanced")
+    
+    @validator('mode')
+    def validate_mode(cls, v):
+        if v not in _DETECTION_MODE_SET:
+            raise ValueError("Modo deve ser 'strict', 'balanced' ou 'precise'")
+        return v
 
 
 class MaskRequest(BaseModel):
@@ -229,7 +398,7 @@ class InfoResponse(BaseModel):
 @app.on_event("startup")
 async def startup_event():
     """Inicializa recursos na inicialização."""
-    global detector
+    global detector, worker_pool
     
     print("=" * 60)
     print("PIIGuardian API - Inicializando...")
@@ -238,6 +407,14 @@ async def startup_event():
     # Inicializa detector
     detector = PIIGuardian(mode='balanced')
     
+    # Pré-constrói os detectores dos demais modos
+    detectors.clear()
+    for mode in DETECTION_MODES:
+        detectors[mode] = detector if mode == 'balanced' else detector.with_mode(mode)
+    
+    # Um processo por núcleo, com um detector (sem BERT) por modo
+    worker_pool = PIIGuardian.create_worker_pool(detectors.values())
+    
     print("✅ Detector inicializado com sucesso")
     print(f"   Modo: {detector.config.mode.value}")
     print(f"   BERT disponível: {detector.bert_model is not None}")
@@ -247,8 +424,12 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Limpa recursos no encerramento."""
-    global detector
+    global detector, worker_pool
+    if worker_pool is not None:
+        worker_pool.shutdown()
+        worker_pool = None
     detector = None
+    detectors.clear()
     print("PIIGuardian API - Encerrado")
 
 
@@ -277,7 +458,7 @@ async def health_check():
     return HealthResponse(
         status="healthy",
         version="1.0.0",
-        timestamp=datetime.now().isoformat(),
+        timestamp=_now_iso(),
         detector_ready=detector is not None,
         bert_available=detector.bert_model is not None if detector else False
     )
@@ -300,12 +481,17 @@ async def get_info():
             "CARTAO_CREDITO", "NOME_PESSOA", "ENDERECO",
             "DATA_NASCIMENTO", "PLACA_VEICULO", "PASSAPORTE"
         ],
-        detection_modes=["strict", "balanced", "precise"],
+        detection_modes=list(DETECTION_MODES),
         metrics=metrics.get_summary()
     )
 
 
-@app.post("/detect", response_model=DetectResponse, tags=["Detecção"])
+@app.post(
+    "/detect",
+    response_model=None,
+    responses={200: {"model": DetectResponse}},
+    tags=["Detecção"]
+)
 async def detect_pii(request: DetectRequest):
     """
     Detecta dados pessoais em um texto.
@@ -325,27 +511,41 @@ async def detect_pii(request: DetectRequest):
         "mode": "balanced"
     }
     ```
+    
+    A resposta traz um `ETag` que identifica o texto, a versão da API e
+    a configuração do detector usado (modo, thresholds, modelo).
     """
     if detector is None:
         raise HTTPException(status_code=503, detail="Detector não inicializado")
     
+    key = _text_digest(request.text)
+    mode_detector = _get_detector(request.mode)
+    # Resultado contém dados pessoais: só o cliente pode guardá-lo.
+    # POST não tem revalidação condicional (If-None-Match), só o ETag.
+    cache_headers = {
+        'ETag': _detect_etag(key, mode_detector),
+        'Cache-Control': 'private, no-cache'
+    }
+    
     # Normaliza texto
-    text = normalize_text(request.text)
+    text = _normalize(request.text, key)
     
-    # Configura detector para o modo solicitado
-    if request.mode != detector.config.mode.value:
-        temp_detector = PIIGuardian(mode=request.mode)
-        result = temp_detector.detect(text)
-    else:
-        result = detector.detect(text)
+    # Usa o detector pré-construído do modo solicitado
+    result = mode_detector.detect(text)
+    result_dict = result.to_dict()
     
     # Atualiza métricas
-    metrics.update(result.to_dict())
+    metrics.update(result_dict)
     
-    return result.to_dict()
+    return _JSON_RESPONSE_CLASS(result_dict, headers=cache_headers)
 
 
-@app.post("/detect/batch", response_model=BatchDetectResponse, tags=["Detecção"])
+@app.post(
+    "/detect/batch",
+    response_model=None,
+    responses={200: {"model": BatchDetectResponse}},
+    tags=["Detecção"]
+)
 async def detect_pii_batch(request: BatchDetectRequest):
     """
     Detecta dados pessoais em múltiplos textos.
@@ -362,29 +562,139 @@ async def detect_pii_batch(request: BatchDetectRequest):
     results = []
     total_with_pii = 0
     
-    for text in request.texts:
-        normalized = normalize_text(text)
-        result = detector.detect(normalized)
+    # Detecção em vários processos; roda fora do event loop para não
+    # bloquear as demais requisições
+    normalized = [_normalize(text) for text in request.texts]
+    detections = await asyncio.get_running_loop().run_in_executor(
+        None,
+        partial(_get_detector(request.mode).detect_many, normalized, executor=worker_pool)
+    )
+    
+    for result in detections:
         result_dict = result.to_dict()
         results.append(result_dict)
         
         if result_dict['has_pii']:
             total_with_pii += 1
-        
-        # Atualiza métricas
-        metrics.update(result_dict)
+    
+    # Atualiza métricas do lote inteiro de uma vez
+    metrics.update_many(results)
     
     processing_time = (time.time() - start_time) * 1000
     
-    return BatchDetectResponse(
-        total_processed=len(request.texts),
-        total_with_pii=total_with_pii,
-        results=results,
-        processing_time_ms=round(processing_time, 2)
-    )
+    return _JSON_RESPONSE_CLASS({
+        'total_processed': len(request.texts),
+        'total_with_pii': total_with_pii,
+        'results': results,
+        'processing_time_ms': round(processing_time, 2)
+    })
 
 
-@app.post("/mask", response_model=MaskResponse, tags=["Transformação"])
+@app.post("/detect/stream", tags=["Detecção"])
+async def detect_pii_stream(
+    request: Request,
+    mode: str = Query("balanced", description="Modo de detecção: strict, balanced, precise")
+):
+    """
+    Detecta dados pessoais em um texto enviado em streaming.
+    
+    O corpo da requisição é o texto puro (UTF-8), lido em partes,
+    normalizado à medida que chega (como no `/detect`) e analisado em
+    janelas de ~4 KB com sobreposição, cortadas em fins de frase. As
+    entidades são devolvidas em NDJSON (uma por linha) assim que cada
+    janela é processada, sem manter o documento inteiro em memória.
+    
+    **Limite:** corpo de até 10 MB (`413` acima disso).
+    
+    **Observação:** as posições (`start`/`end`) se referem ao texto
+    normalizado.
+    """
+    if detector is None:
+        raise HTTPException(status_code=503, detail="Detector não inicializado")
+    if mode not in _DETECTION_MODE_SET:
+        raise HTTPException(
+            status_code=400,
+            detail="Modo deve ser 'strict', 'balanced' ou 'precise'"
+        )
+    
+    too_large = HTTPException(status_code=413, detail="Texto excede o limite de 10 MB")
+    content_length = request.headers.get('content-length', '')
+    if content_length.isdigit() and int(content_length) > STREAM_MAX_BYTES:
+        raise too_large
+    
+    mode_detector = _get_detector(mode)
+    loop = asyncio.get_running_loop()
+    body_read = asyncio.Event()
+    
+    async def detect_window(window: str, offset: int, emit_before: Optional[int], skip_before: int):
+        """Detecta em uma janela e retorna as entidades novas, em posições absolutas."""
+        result = await loop.run_in_executor(None, mode_detector.detect, window)
+        metrics.update(result.to_dict())
+        
+        entities = []
+        for entity in result.entities:
+            # Entidades na sobreposição ficam para a próxima janela; as que
+            # começam antes do fim de uma já emitida são pedaços dela
+            if emit_before is not None and entity.start >= emit_before:
+                continue
+            if offset + entity.start < skip_before:
+                continue
+            
+            entity_dict = entity.to_dict()
+            entity_dict['start'] += offset
+            entity_dict['end'] += offset
+            entities.append(entity_dict)
+        
+        return entities
+    
+    async def generate():
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        normalizer = StreamingTextNormalizer()
+        buffer = ''
+        offset = 0          # posição de buffer[0] no texto normalizado
+        emitted_end = 0     # fim da última entidade emitida
+        received = 0
+        
+        try:
+            async for chunk in request.stream():
+                # Sem Content-Length (chunked), o limite é verificado na
+                # leitura; a resposta já começou, então a conexão é abortada
+                received += len(chunk)
+                if received > STREAM_MAX_BYTES:
+                    raise too_large
+                
+                buffer += normalizer.feed(decoder.decode(chunk))
+                
+                while len(buffer) >= STREAM_WINDOW_SIZE:
+                    cut = _stream_window_end(buffer)
+                    keep_from = cut - STREAM_WINDOW_OVERLAP
+                    
+                    entities = await detect_window(buffer[:cut], offset, keep_from, emitted_end)
+                    for entity_dict in entities:
+                        emitted_end = max(emitted_end, entity_dict['end'])
+                        yield _ndjson_line(entity_dict)
+                    
+                    buffer = buffer[keep_from:]
+                    offset += keep_from
+        except ClientDisconnect:
+            return
+        
+        body_read.set()
+        buffer += normalizer.feed(decoder.decode(b'', final=True)) + normalizer.flush()
+        
+        if buffer and not await request.is_disconnected():
+            for entity_dict in await detect_window(buffer, offset, None, emitted_end):
+                yield _ndjson_line(entity_dict)
+    
+    return _RequestStreamingResponse(generate(), body_read, media_type="application/x-ndjson")
+
+
+@app.post(
+    "/mask",
+    response_model=None,
+    responses={200: {"model": MaskResponse}},
+    tags=["Transformação"]
+)
 async def mask_pii_endpoint(request: MaskRequest):
     """
     Mascara dados pessoais no texto.
@@ -399,20 +709,22 @@ async def mask_pii_endpoint(request: MaskRequest):
     if detector is None:
         raise HTTPException(status_code=503, detail="Detector não inicializado")
     
-    text = normalize_text(request.text)
-    result = detector.detect(text)
+    text = _normalize(request.text)
+    result, masked_text = detector.detect_and_transform(text, 'mask', request.mask_char)
     
-    entities = [e.to_dict() for e in result.entities]
-    masked_text = mask_pii(text, entities, request.mask_char)
-    
-    return MaskResponse(
-        original_text=text,
-        masked_text=masked_text,
-        entities_masked=len(entities)
-    )
+    return _JSON_RESPONSE_CLASS({
+        'original_text': text,
+        'masked_text': masked_text,
+        'entities_masked': len(result.entities)
+    })
 
 
-@app.post("/anonymize", response_model=AnonymizeResponse, tags=["Transformação"])
+@app.post(
+    "/anonymize",
+    response_model=None,
+    responses={200: {"model": AnonymizeResponse}},
+    tags=["Transformação"]
+)
 async def anonymize_text_endpoint(request: AnonymizeRequest):
     """
     Anonimiza texto substituindo dados pessoais por placeholders.
@@ -426,17 +738,14 @@ async def anonymize_text_endpoint(request: AnonymizeRequest):
     if detector is None:
         raise HTTPException(status_code=503, detail="Detector não inicializado")
     
-    text = normalize_text(request.text)
-    result = detector.detect(text)
+    text = _normalize(request.text)
+    result, anonymized = detector.detect_and_transform(text, 'anonymize')
     
-    entities = [e.to_dict() for e in result.entities]
-    anonymized = anonymize_text(text, entities)
-    
-    return AnonymizeResponse(
-        original_text=text,
-        anonymized_text=anonymized,
-        entities_anonymized=len(entities)
-    )
+    return _JSON_RESPONSE_CLASS({
+        'original_text': text,
+        'anonymized_text': anonymized,
+        'entities_anonymized': len(result.entities)
+    })
 
 
 @app.get("/metrics", tags=["Sistema"])
@@ -18,10 +18,30 @@ import json
 import random
 import string
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Tuple, Optional
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+# orjson é opcional: serialização mais rápida do dataset gerado
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    pass
+
+# pyarrow é opcional: saída colunar (--format parquet/feather)
+PYARROW_AVAILABLE = False
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pass
 
 
 # ============================================================================
@@ -29,27 +49,27 @@ from dataclasses import dataclass, asdict
 # ============================================================================
 
 # Nomes comuns brasileiros
-FIRST_NAMES_MALE = [
+FIRST_NAMES_MALE = (
     "João", "Pedro", "Lucas", "Gabriel", "Rafael", "Mateus", "Bruno", "Carlos",
     "Daniel", "Felipe", "Gustavo", "Henrique", "Igor", "José", "Leonardo",
     "Marcos", "Nicolas", "Paulo", "Ricardo", "Thiago", "Victor", "William"
-]
+)
 
-FIRST_NAMES_FEMALE = [
+FIRST_NAMES_FEMALE = (
     "Maria", "Ana", "Juliana", "Fernanda", "Camila", "Amanda", "Bruna", "Carolina",
     "Daniela", "Eduarda", "Fabiana", "Gabriela", "Helena", "Isabela", "Julia",
     "Larissa", "Leticia", "Mariana", "Natalia", "Patricia", "Raquel", "Vanessa"
-]
+)
 
-LAST_NAMES = [
+LAST_NAMES = (
     "Silva", "Santos", "Oliveira", "Souza", "Rodrigues", "Ferreira", "Alves",
     "Pereira", "Lima", "Gomes", "Costa", "Ribeiro", "Martins", "Carvalho",
     "Almeida", "Lopes", "Soares", "Fernandes", "Vieira", "Barbosa", "Rocha",
     "Dias", "Nascimento", "Andrade", "Moreira", "Nunes", "Marques", "Machado"
-]
+)
 
 # DDDs válidos
-VALID_DDDS = [
+VALID_DDDS = (
     11, 12, 13, 14, 15, 16, 17, 18, 19,  # SP
     21, 22, 24, 27, 28,                   # RJ/ES
     31, 32, 33, 34, 35, 37, 38,          # MG
@@ -59,13 +79,22 @@ VALID_DDDS = [
     71, 73, 74, 75, 77, 79,              # BA/SE
     81, 82, 83, 84, 85, 86, 87, 88, 89,  # Nordeste
     91, 92, 93, 94, 95, 96, 97, 98, 99   # Norte
-]
+)
 
 # Domínios de email comuns
-EMAIL_DOMAINS = [
+EMAIL_DOMAINS = (
     "gmail.com", "hotmail.com", "yahoo.com.br", "outlook.com", "uol.com.br",
     "terra.com.br", "bol.com.br", "ig.com.br", "globo.com", "live.com"
-]
+)
+
+# Parte local do email: remove acentos e troca espaços por pontos, com a
+# mesma sequência de str.replace de antes. Não usa str.translate: em texto
+# não ASCII ele consulta a tabela caractere a caractere e ficou mais lento
+# (por nome e, principalmente, sobre os nomes de um lote unidos)
+_EMAIL_LOCAL_REPLACEMENTS = (
+    (' ', '.'), ('á', 'a'), ('é', 'e'), ('í', 'i'), ('ó', 'o'),
+    ('ú', 'u'), ('ã', 'a'), ('õ', 'o'), ('ç', 'c'),
+)
 
 # Templates de pedidos de acesso à informação
 TEMPLATES_WITH_PII = [
@@ -102,6 +131,15 @@ TEMPLATES_WITHOUT_PII = [
 # GERADORES DE DADOS
 # ============================================================================
 
+# Pesos dos dígitos verificadores do CPF
+CPF_WEIGHTS_FIRST = np.arange(10, 1, -1, dtype=np.int64)
+CPF_WEIGHTS_SECOND = np.arange(11, 1, -1, dtype=np.int64)
+
+# Pesos dos dígitos verificadores do CNPJ
+CNPJ_WEIGHTS_FIRST = np.array([5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2], dtype=np.int64)
+CNPJ_WEIGHTS_SECOND = np.array([6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2], dtype=np.int64)
+
+
 def generate_cpf(valid: bool = True) -> Tuple[str, str]:
     """
     Gera um CPF (válido ou inválido).
@@ -126,37 +164,115 @@ def generate_cpf(valid: bool = True) -> Tuple[str, str]:
         # CPF inválido
         digits = [random.randint(0, 9) for _ in range(11)]
     
+    return _format_cpf(digits)
+
+
+def _format_cpf(digits: List[int]) -> Tuple[str, str]:
+    """Tupla (cpf_formatado, cpf_raw) a partir dos 11 dígitos."""
     cpf_raw = ''.join(str(d) for d in digits)
     cpf_formatted = f"{cpf_raw[:3]}.{cpf_raw[3:6]}.{cpf_raw[6:9]}-{cpf_raw[9:]}"
     
     return cpf_formatted, cpf_raw
 
 
+# Colunas dos dígitos no CPF formatado (XXX.XXX.XXX-XX)
+_CPF_DIGIT_COLUMNS = [0, 1, 2, 4, 5, 6, 8, 9, 10, 12, 13]
+
+
+def _digits_to_strings(digits: np.ndarray) -> np.ndarray:
+    """Converte uma matriz (n, k) de dígitos em um vetor de n strings."""
+    # Strings do NumPy são UCS-4: cada linha de códigos uint32 vira uma string
+    chars = (digits + ord('0')).astype(np.uint32)
+    return np.ascontiguousarray(chars).view(f'U{digits.shape[1]}').ravel()
+
+
+def _format_digits(values: np.ndarray, mask: str) -> np.ndarray:
+    """
+    Formata inteiros não negativos com a máscara ('#' = dígito), em lote.
+    
+    Os dígitos saem por divisão inteira para uma matriz de caracteres,
+    convertida em strings de uma vez por _digits_to_strings.
+    """
+    columns = [i for i, char in enumerate(mask) if char == '#']
+    powers = 10 ** np.arange(len(columns) - 1, -1, -1, dtype=np.int64)
+    
+    chars = np.empty((len(values), len(mask)), dtype=np.int64)
+    chars[:] = [ord(char) - ord('0') for char in mask]
+    chars[:, columns] = np.asarray(values, dtype=np.int64)[:, None] // powers % 10
+    
+    return _digits_to_strings(chars)
+
+
+def _default_rng(rng: Optional[np.random.Generator]) -> np.random.Generator:
+    """Gerador NumPy recebido ou um novo, semeado a partir do módulo random."""
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+    return rng
+
+
+def generate_cpfs_batch(
+    n: int,
+    valid: bool = True,
+    rng: Optional[np.random.Generator] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gera n CPFs de uma vez (versão vetorizada de generate_cpf).
+    
+    Os dígitos ficam em uma matriz (n, 11) e os verificadores são
+    calculados com um produto matriz-vetor por dígito.
+    
+    Returns:
+        Tupla (cpfs_formatados, cpfs_raw), vetores NumPy de strings
+    """
+    rng = _default_rng(rng)
+    
+    digits = np.empty((n, 11), dtype=np.int64)
+    if valid:
+        digits[:, :9] = rng.integers(0, 10, (n, 9))
+        digits[:, 9] = (digits[:, :9] @ CPF_WEIGHTS_FIRST * 10 % 11) % 10
+        digits[:, 10] = (digits[:, :10] @ CPF_WEIGHTS_SECOND * 10 % 11) % 10
+    else:
+        # CPFs inválidos
+        digits[:] = rng.integers(0, 10, (n, 11))
+    
+    formatted = np.empty((n, 14), dtype=np.int64)
+    formatted[:, _CPF_DIGIT_COLUMNS] = digits
+    formatted[:, [3, 7]] = ord('.') - ord('0')
+    formatted[:, 11] = ord('-') - ord('0')
+    
+    return _digits_to_strings(formatted), _digits_to_strings(digits)
+
+
 def generate_phone(mobile: bool = True, formatted: bool = True) -> str:
     """Gera um número de telefone brasileiro."""
     ddd = random.choice(VALID_DDDS)
     
     if mobile:
         # Celular: 9XXXX-XXXX
-        number = f"9{random.randint(1000, 9999)}{random.randint(1000, 9999)}"
+        number = f"{900000000 + random.randrange(10**8)}"
+        split = 5
     else:
         # Fixo: [2-5]XXX-XXXX
-        first = random.randint(2, 5)
-        number = f"{first}{random.randint(100, 999)}{random.randint(1000, 9999)}"
+        number = f"{random.randrange(2 * 10**7, 6 * 10**7)}"
+        split = 4
     
     if formatted:
-        if mobile:
-            return f"({ddd}) {number[:5]}-{number[5:]}"
-        else:
-            return f"({ddd}) {number[:4]}-{number[4:]}"
-    else:
-        return f"{ddd}{number}"
+        return f"({ddd}) {number[:split]}-{number[split:]}"
+    return f"{ddd}{number}"
+
+
+def _email_local(name: str) -> str:
+    """Parte local do email derivada do nome (sem acentos, com pontos)."""
+    local = name.lower()
+    for old, new in _EMAIL_LOCAL_REPLACEMENTS:
+        local = local.replace(old, new)
+    return local
 
 
 def generate_email(name: str = None) -> str:
     """Gera um endereço de email."""
     if name:
-        local = name.lower().replace(' ', '.').replace('á', 'a').replace('é', 'e').replace('í', 'i').replace('ó', 'o').replace('ú', 'u').replace('ã', 'a').replace('õ', 'o').replace('ç', 'c')
+        local = _email_local(name)
     else:
         local = ''.join(random.choices(string.ascii_lowercase, k=random.randint(5, 10)))
     
@@ -171,9 +287,7 @@ def generate_email(name: str = None) -> str:
 def generate_cep(formatted: bool = True) -> str:
     """Gera um CEP brasileiro."""
     # Primeiro dígito indica a região
-    first = random.randint(0, 9)
-    rest = random.randint(1000000, 9999999)
-    cep = f"{first}{rest:07d}"[:8]
+    cep = f"{random.randrange(10**8):08d}"
     
     if formatted:
         return f"{cep[:5]}-{cep[5:]}"
@@ -194,6 +308,95 @@ def generate_name() -> str:
     return f"{first} {' '.join(last_names)}"
 
 
+def generate_names_batch(n: int, rng: Optional[np.random.Generator] = None) -> List[str]:
+    """Gera n nomes completos (versão em lote de generate_name)."""
+    rng = _default_rng(rng)
+    
+    male = rng.random(n) < 0.5
+    male_idx = rng.integers(0, len(FIRST_NAMES_MALE), n)
+    female_idx = rng.integers(0, len(FIRST_NAMES_FEMALE), n)
+    
+    # 1 a 3 sobrenomes distintos: linhas com índices repetidos são
+    # sorteadas de novo (amostragem por rejeição, sem viés)
+    num_last = rng.integers(1, 4, n)
+    last_idx = rng.integers(0, len(LAST_NAMES), (n, 3))
+    while True:
+        repeated = (
+            (last_idx[:, 0] == last_idx[:, 1])
+            | (last_idx[:, 0] == last_idx[:, 2])
+            | (last_idx[:, 1] == last_idx[:, 2])
+        )
+        count = int(repeated.sum())
+        if not count:
+            break
+        last_idx[repeated] = rng.integers(0, len(LAST_NAMES), (count, 3))
+    
+    return [
+        f"{FIRST_NAMES_MALE[m] if is_male else FIRST_NAMES_FEMALE[f]} "
+        f"{' '.join(LAST_NAMES[j] for j in idx[:k])}"
+        for is_male, m, f, k, idx in zip(
+            male.tolist(), male_idx.tolist(), female_idx.tolist(),
+            num_last.tolist(), last_idx.tolist()
+        )
+    ]
+
+
+def generate_phones_batch(
+    mobile: np.ndarray,
+    rng: Optional[np.random.Generator] = None
+) -> List[str]:
+    """Gera um telefone formatado por item de mobile (celular ou fixo)."""
+    rng = _default_rng(rng)
+    n = len(mobile)
+    
+    mobile = np.asarray(mobile, dtype=bool)
+    
+    ddds = np.array(VALID_DDDS, dtype=np.int64)[rng.integers(0, len(VALID_DDDS), n)]
+    # Celular: 9XXXX-XXXX; fixo: [2-5]XXX-XXXX
+    numbers = np.where(
+        mobile,
+        900000000 + rng.integers(0, 10**8, n),
+        rng.integers(2 * 10**7, 6 * 10**7, n)
+    )
+    
+    phones = np.empty(n, dtype=object)
+    phones[mobile] = _format_digits(ddds[mobile] * 10**9 + numbers[mobile], '(##) #####-####')
+    phones[~mobile] = _format_digits(ddds[~mobile] * 10**8 + numbers[~mobile], '(##) ####-####')
+    
+    return phones.tolist()
+
+
+def generate_emails_batch(
+    names: List[str],
+    rng: Optional[np.random.Generator] = None
+) -> List[str]:
+    """Gera um email por nome (versão em lote de generate_email)."""
+    rng = _default_rng(rng)
+    n = len(names)
+    
+    # Adiciona números aleatórios às vezes
+    add_number = rng.random(n) < 0.3
+    numbers = rng.integers(1, 1000, n)
+    domains = rng.integers(0, len(EMAIL_DOMAINS), n)
+    
+    # Partes locais de todos os nomes em uma única passada por substituição
+    locals_ = _email_local('\n'.join(names)).split('\n') if n else []
+    
+    return [
+        f"{local}{number if add else ''}@{EMAIL_DOMAINS[domain]}"
+        for local, add, number, domain in zip(
+            locals_, add_number.tolist(), numbers.tolist(), domains.tolist()
+        )
+    ]
+
+
+def generate_ceps_batch(n: int, rng: Optional[np.random.Generator] = None) -> List[str]:
+    """Gera n CEPs formatados (versão em lote de generate_cep)."""
+    rng = _default_rng(rng)
+    
+    return _format_digits(rng.integers(0, 10**8, n), '#####-###').tolist()
+
+
 def generate_cnpj(valid: bool = True) -> Tuple[str, str]:
     """Gera um CNPJ."""
     if valid:
@@ -213,12 +416,53 @@ def generate_cnpj(valid: bool = True) -> Tuple[str, str]:
     else:
         base = [random.randint(0, 9) for _ in range(14)]
     
-    cnpj_raw = ''.join(str(d) for d in base)
+    return _format_cnpj(base)
+
+
+def _format_cnpj(digits: List[int]) -> Tuple[str, str]:
+    """Tupla (cnpj_formatado, cnpj_raw) a partir dos 14 dígitos."""
+    cnpj_raw = ''.join(str(d) for d in digits)
     cnpj_formatted = f"{cnpj_raw[:2]}.{cnpj_raw[2:5]}.{cnpj_raw[5:8]}/{cnpj_raw[8:12]}-{cnpj_raw[12:]}"
     
     return cnpj_formatted, cnpj_raw
 
 
+# Colunas dos dígitos no CNPJ formatado (XX.XXX.XXX/XXXX-XX)
+_CNPJ_DIGIT_COLUMNS = [0, 1, 3, 4, 5, 7, 8, 9, 11, 12, 13, 14, 16, 17]
+
+
+def generate_cnpjs_batch(
+    n: int,
+    valid: bool = True,
+    rng: Optional[np.random.Generator] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gera n CNPJs de uma vez (versão vetorizada de generate_cnpj).
+    
+    Returns:
+        Tupla (cnpjs_formatados, cnpjs_raw), vetores NumPy de strings
+    """
+    rng = _default_rng(rng)
+    
+    base = np.empty((n, 14), dtype=np.int64)
+    if valid:
+        base[:, :8] = rng.integers(0, 10, (n, 8))
+        base[:, 8:12] = [0, 0, 0, 1]
+        for column, weights in ((12, CNPJ_WEIGHTS_FIRST), (13, CNPJ_WEIGHTS_SECOND)):
+            remainder = base[:, :column] @ weights % 11
+            base[:, column] = np.where(remainder < 2, 0, 11 - remainder)
+    else:
+        base[:] = rng.integers(0, 10, (n, 14))
+    
+    formatted = np.empty((n, 18), dtype=np.int64)
+    formatted[:, _CNPJ_DIGIT_COLUMNS] = base
+    formatted[:, [2, 6]] = ord('.') - ord('0')
+    formatted[:, 10] = ord('/') - ord('0')
+    formatted[:, 15] = ord('-') - ord('0')
+    
+    return _digits_to_strings(formatted), _digits_to_strings(base)
+
+
 def generate_date(min_year: int = 1950, max_year: int = 2005) -> str:
     """Gera uma data de nascimento."""
     year = random.randint(min_year, max_year)
@@ -237,7 +481,77 @@ def generate_date(min_year: int = 1950, max_year: int = 2005) -> str:
 # GERADOR DE REGISTROS
 # ============================================================================
 
-@dataclass
+# Tipo de entidade de cada campo dos templates
+FIELD_ENTITY_TYPES = {
+    'cpf': 'CPF',
+    'phone': 'TELEFONE',
+    'email': 'EMAIL',
+    'cep': 'CEP',
+    'name': 'NOME_PESSOA',
+}
+
+
+@lru_cache(maxsize=256)
+def _parse_template(
+    template: str
+) -> Tuple[Tuple[str, Optional[str], Optional[str], Optional[str]], ...]:
+    """Partes (literal, campo, formato, conversão) do template, analisadas uma vez."""
+    return tuple(string.Formatter().parse(template))
+
+
+class TrackingFormatter(string.Formatter):
+    """
+    Formatter que registra a posição de cada campo ao montar o texto.
+    
+    vformat devolve (texto, entidades): as posições saem da própria
+    substituição, sem buscar os valores no texto depois. A análise de
+    cada template fica em cache.
+    """
+    
+    def parse(self, format_string):
+        return _parse_template(format_string)
+    
+    def vformat(self, format_string, args, kwargs) -> Tuple[str, List[Dict[str, Any]]]:
+        parts = []
+        entities = []
+        position = 0
+        
+        for literal, field_name, format_spec, conversion in self.parse(format_string):
+            parts.append(literal)
+            position += len(literal)
+            if field_name is None:
+                continue
+            
+            obj, _ = self.get_field(field_name, args, kwargs)
+            if conversion is not None:
+                obj = self.convert_field(obj, conversion)
+            value = self.format_field(obj, format_spec) if format_spec else str(obj)
+            parts.append(value)
+            
+            entity_type = FIELD_ENTITY_TYPES.get(field_name)
+            if entity_type is not None:
+                entities.append({
+                    'type': entity_type,
+                    'value': value,
+                    'start': position,
+                    'end': position + len(value)
+                })
+            position += len(value)
+        
+        return ''.join(parts), entities
+
+
+# __slots__ no SyntheticRecord (Python 3.10+)
+_DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+_FORMATTER = TrackingFormatter()
+
+# Registros com PII sorteados por vez em generate_record_with_pii
+RECORD_BATCH_SIZE = 256
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class SyntheticRecord:
     """Registro sintético para teste."""
     id: str
@@ -246,7 +560,13 @@ class SyntheticRecord:
     entities: List[Dict[str, Any]]
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # As entidades já são dicts simples: sem a cópia profunda do asdict
+        return {
+            'id': self.id,
+            'text': self.text,
+            'has_pii': self.has_pii,
+            'entities': self.entities
+        }
 
 
 class SyntheticDataGenerator:
@@ -255,82 +575,59 @@ class SyntheticDataGenerator:
     def __init__(self, seed: int = None):
         if seed:
             random.seed(seed)
+        # default_rng só aceita inteiros não negativos: seeds negativas
+        # (aceitas por random.seed) são levadas a 64 bits sem sinal
+        self.rng = np.random.default_rng(None if seed is None else seed & (2**64 - 1))
         self.counter = 0
+        # Dados sorteados em lote para generate_record_with_pii
+        self._pending_pii = iter(())
+    
+    def _prepare_batch(self, size: int) -> Tuple[List[str], ...]:
+        """
+        Sorteia de uma vez os dados de `size` registros com PII.
+        
+        Returns:
+            Colunas (templates, nomes, CPFs, telefones, emails, CEPs)
+        """
+        rng = self.rng
+        
+        template_indices = rng.integers(0, len(TEMPLATES_WITH_PII), size).tolist()
+        templates = [TEMPLATES_WITH_PII[i] for i in template_indices]
+        names = generate_names_batch(size, rng)
+        cpfs = generate_cpfs_batch(size, rng=rng)[0].tolist()
+        phones = generate_phones_batch(rng.random(size) < 0.7, rng)
+        emails = generate_emails_batch(names, rng)
+        ceps = generate_ceps_batch(size, rng)
+        
+        return templates, names, cpfs, phones, emails, ceps
     
     def generate_record_with_pii(self) -> SyntheticRecord:
         """Gera um registro COM dados pessoais."""
+        fields = next(self._pending_pii, None)
+        if fields is None:
+            # Sorteia os próximos RECORD_BATCH_SIZE registros de uma vez
+            self._pending_pii = zip(*self._prepare_batch(RECORD_BATCH_SIZE))
+            fields = next(self._pending_pii)
+        return self._build_record_with_pii(*fields)
+    
+    def _build_record_with_pii(
+        self,
+        template: str,
+        name: str,
+        cpf: str,
+        phone: str,
+        email: str,
+        cep: str
+    ) -> SyntheticRecord:
+        """Monta o registro COM dados pessoais a partir dos dados sorteados."""
         self.counter += 1
         
-        # Gera dados
-        name = generate_name()
-        cpf, cpf_raw = generate_cpf(valid=True)
-        phone = generate_phone(mobile=random.random() < 0.7)
-        email = generate_email(name)
-        cep = generate_cep()
-        
-        # Escolhe template
-        template = random.choice(TEMPLATES_WITH_PII)
-        text = template.format(
-            name=name,
-            cpf=cpf,
-            phone=phone,
-            email=email,
-            cep=cep
+        text, entities = _FORMATTER.vformat(
+            template,
+            (),
+            {'name': name, 'cpf': cpf, 'phone': phone, 'email': email, 'cep': cep}
         )
         
-        # Monta entidades esperadas
-        entities = []
-        
-        if '{cpf}' in template:
-            start = text.find(cpf)
-            if start >= 0:
-                entities.append({
-                    'type': 'CPF',
-                    'value': cpf,
-                    'start': start,
-                    'end': start + len(cpf)
-                })
-        
-        if '{phone}' in template:
-            start = text.find(phone)
-            if start >= 0:
-                entities.append({
-                    'type': 'TELEFONE',
-                    'value': phone,
-                    'start': start,
-                    'end': start + len(phone)
-                })
-        
-        if '{email}' in template:
-            start = text.find(email)
-            if start >= 0:
-                entities.append({
-                    'type': 'EMAIL',
-                    'value': email,
-                    'start': start,
-                    'end': start + len(email)
-                })
-        
-        if '{cep}' in template:
-            start = text.find(cep)
-            if start >= 0:
-                entities.append({
-                    'type': 'CEP',
-                    'value': cep,
-                    'start': start,
-                    'end': start + len(cep)
-                })
-        
-        if '{name}' in template:
-            start = text.find(name)
-            if start >= 0:
-                entities.append({
-                    'type': 'NOME_PESSOA',
-                    'value': name,
-                    'start': start,
-                    'end': start + len(name)
-                })
-        
         return SyntheticRecord(
             id=f"pii_{self.counter:06d}",
             text=text,
@@ -340,10 +637,13 @@ class SyntheticDataGenerator:
     
     def generate_record_without_pii(self) -> SyntheticRecord:
         """Gera um registro SEM dados pessoais."""
+        text = TEMPLATES_WITHOUT_PII[self.rng.integers(0, len(TEMPLATES_WITHOUT_PII))]
+        return self._build_record_without_pii(text)
+    
+    def _build_record_without_pii(self, text: str) -> SyntheticRecord:
+        """Monta o registro SEM dados pessoais."""
         self.counter += 1
         
-        text = random.choice(TEMPLATES_WITHOUT_PII)
-        
         return SyntheticRecord(
             id=f"clean_{self.counter:06d}",
             text=text,
@@ -359,6 +659,9 @@ class SyntheticDataGenerator:
         """
         Gera dataset sintético.
         
+        Os dados aleatórios de todos os registros são sorteados em lote
+        antes do laço, que só monta os textos.
+        
         Args:
             size: Número total de registros
             pii_ratio: Proporção de registros com PII (0.0 a 1.0)
@@ -366,23 +669,163 @@ class SyntheticDataGenerator:
         Returns:
             Lista de registros sintéticos
         """
-        records = []
         num_with_pii = int(size * pii_ratio)
         
-        # Gera registros com PII
-        for _ in range(num_with_pii):
-            records.append(self.generate_record_with_pii())
+        # Posições dos registros com PII sorteadas de uma vez: a lista já
+        # sai embaralhada, com exatamente num_with_pii registros com PII
+        with_pii = (self.rng.permutation(size) < num_with_pii).tolist()
         
-        # Gera registros sem PII
-        for _ in range(size - num_with_pii):
-            records.append(self.generate_record_without_pii())
+        pii_fields = zip(*self._prepare_batch(num_with_pii))
+        clean_texts = (
+            TEMPLATES_WITHOUT_PII[i]
+            for i in self.rng.integers(0, len(TEMPLATES_WITHOUT_PII), size - num_with_pii).tolist()
+        )
         
-        # Embaralha
-        random.shuffle(records)
+        records = [
+            self._build_record_with_pii(*next(pii_fields)) if has_pii
+            else self._build_record_without_pii(next(clean_texts))
+            for has_pii in with_pii
+        ]
         
         return records
 
 
+# Registros serializados por chamada ao orjson ao salvar o dataset
+WRITE_CHUNK_SIZE = 10000
+
+
+def _gen_shard(seed: Optional[int], size: int, pii_ratio: float, first_id: int) -> List[Tuple]:
+    """
+    Gera uma fatia do dataset em um processo (ids a partir de first_id + 1).
+    
+    Devolve os campos dos registros em tuplas, que o pickle transfere
+    mais rápido que os dataclasses com __slots__.
+    """
+    generator = SyntheticDataGenerator(seed=seed)
+    generator.counter = first_id
+    return [
+        (record.id, record.text, record.has_pii, record.entities)
+        for record in generator.generate_dataset(size, pii_ratio)
+    ]
+
+
+def generate_dataset_parallel(
+    size: int,
+    pii_ratio: float = 0.7,
+    seed: Optional[int] = None,
+    workers: int = 1
+) -> List[SyntheticRecord]:
+    """
+    Gera o dataset dividido em fatias independentes, uma por processo.
+    
+    A fatia i usa a seed `seed ^ i`, então o resultado é reprodutível
+    para o mesmo número de workers. Com um worker, equivale a
+    SyntheticDataGenerator(seed).generate_dataset(size, pii_ratio).
+    """
+    if workers <= 1 or size < workers:
+        return SyntheticDataGenerator(seed=seed).generate_dataset(size, pii_ratio)
+    
+    bounds = [size * i // workers for i in range(workers + 1)]
+    seeds = [None if seed is None else seed ^ i for i in range(workers)]
+    sizes = [end - start for start, end in zip(bounds, bounds[1:])]
+    
+    # Método de início padrão da plataforma: as fatias só dependem da seed
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        shards = executor.map(_gen_shard, seeds, sizes, [pii_ratio] * workers, bounds[:-1])
+        return [SyntheticRecord(*fields) for shard in shards for fields in shard]
+
+
+def write_json(path: str, data: Dict[str, Any]):
+    """
+    Salva o dataset em JSON (indentação de 2 espaços, UTF-8).
+    
+    Com orjson, a lista 'data' (último campo) é gravada em blocos de
+    WRITE_CHUNK_SIZE registros, sem montar o JSON inteiro em memória;
+    sem orjson, usa json.dump com to_dict. A saída é a mesma nos dois casos.
+    """
+    if not ORJSON_AVAILABLE:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, default=SyntheticRecord.to_dict)
+        return
+    
+    records = data['data']
+    header = {key: value for key, value in data.items() if key != 'data'}
+    
+    with open(path, 'wb') as f:
+        # Cabeçalho sem o '\n}' final; a lista 'data' fecha o objeto
+        f.write(orjson.dumps(header, option=orjson.OPT_INDENT_2)[:-2])
+        f.write(b',\n  "data": [' if header else b'{\n  "data": [')
+        
+        if not records:
+            f.write(b']\n}')
+            return
+        
+        for offset in range(0, len(records), WRITE_CHUNK_SIZE):
+            chunk = orjson.dumps(
+                records[offset:offset + WRITE_CHUNK_SIZE],
+                option=orjson.OPT_INDENT_2
+            )
+            # Sem os colchetes do bloco, com um nível a mais de indentação
+            # (quebras de linha dentro de strings saem escapadas como \\n)
+            f.write(b',' if offset else b'')
+            f.write(chunk[1:-2].replace(b'\n', b'\n  '))
+        f.write(b'\n  ]\n}')
+
+
+def write_arrow(path: str, data: Dict[str, Any], file_format: str = 'parquet'):
+    """
+    Salva o dataset em formato colunar Arrow (Parquet ou Feather).
+    
+    Colunas: id, text, has_pii e entities (lista de structs
+    type/value/start/end). Os demais campos de `data` (metadata,
+    statistics) vão em JSON nos metadados do schema. Os registros são
+    gravados em blocos de WRITE_CHUNK_SIZE.
+    """
+    entity_type = pa.struct([
+        ('type', pa.string()),
+        ('value', pa.string()),
+        ('start', pa.int32()),
+        ('end', pa.int32()),
+    ])
+    header = {key: value for key, value in data.items() if key != 'data'}
+    schema = pa.schema(
+        [
+            ('id', pa.string()),
+            ('text', pa.string()),
+            ('has_pii', pa.bool_()),
+            ('entities', pa.list_(entity_type)),
+        ],
+        metadata={'piiguardian': json.dumps(header, ensure_ascii=False)}
+    )
+    
+    def batches():
+        records = data['data']
+        for offset in range(0, len(records), WRITE_CHUNK_SIZE):
+            chunk = records[offset:offset + WRITE_CHUNK_SIZE]
+            yield pa.RecordBatch.from_arrays(
+                [
+                    pa.array([r.id for r in chunk], type=pa.string()),
+                    pa.array([r.text for r in chunk], type=pa.string()),
+                    pa.array([r.has_pii for r in chunk], type=pa.bool_()),
+                    pa.array([r.entities for r in chunk], type=pa.list_(entity_type)),
+                ],
+                schema=schema
+            )
+    
+    if file_format == 'parquet':
+        import pyarrow.parquet as pq
+        
+        with pq.ParquetWriter(path, schema) as writer:
+            for batch in batches():
+                writer.write_table(pa.Table.from_batches([batch], schema=schema))
+    else:
+        # Feather v2 é o formato de arquivo IPC do Arrow
+        with pa.OSFile(path, 'wb') as sink:
+            with pa.ipc.new_file(sink, schema) as writer:
+                for batch in batches():
+                    writer.write_batch(batch)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Gera dados sintéticos para teste do PIIGuardian'
@@ -396,7 +839,13 @@ def main():
     parser.add_argument(
         '--output', '-o',
         required=True,
-        help='Arquivo de saída (JSON)'
+        help='Arquivo de saída (JSON, Parquet ou Feather; ver --format)'
+    )
+    parser.add_argument(
+        '--format', '-f',
+        choices=['json', 'parquet', 'feather'],
+        default='json',
+        help='Formato do arquivo de saída (parquet/feather requerem pyarrow)'
     )
     parser.add_argument(
         '--pii-ratio', '-r',
@@ -409,6 +858,12 @@ def main():
         type=int,
         help='Seed para reprodutibilidade'
     )
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=1,
+        help='Número de processos para gerar os registros em paralelo'
+    )
     parser.add_argument(
         '--with-labels',
         action='store_true',
@@ -417,6 +872,9 @@ def main():
     
     args = parser.parse_args()
     
+    if args.format != 'json' and not PYARROW_AVAILABLE:
+        parser.error(f"--format {args.format} requer pyarrow (pip install pyarrow)")
+    
     print("=" * 60)
     print("PIIGuardian - Gerador de Dados Sintéticos")
     print("=" * 60)
@@ -424,8 +882,7 @@ def main():
     
     # Gera dados
     print(f"🔄 Gerando {args.size} registros (PII ratio: {args.pii_ratio})...")
-    generator = SyntheticDataGenerator(seed=args.seed)
-    records = generator.generate_dataset(args.size, args.pii_ratio)
+    records = generate_dataset_parallel(args.size, args.pii_ratio, args.seed, args.workers)
     print(f"   ✓ {len(records)} registros gerados")
     
     # Estatísticas
@@ -454,12 +911,14 @@ def main():
             'records_without_pii': len(records) - with_pii,
             'total_entities': total_entities
         },
-        'data': [r.to_dict() for r in records]
+        'data': records
     }
     
     Path(args.output).parent.mkdir(parents=True, exist_ok=True)
-    with open(args.output, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, ensure_ascii=False, indent=2)
+    if args.format == 'json':
+        write_json(args.output, output_data)
+    else:
+        write_arrow(args.output, output_data, args.format)
     
     print("   ✓ Arquivo salvo com sucesso")
     print()
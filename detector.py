@@ -18,11 +18,25 @@ Autor: Aviahub
 Versão: 1.0.0
 """
 
-# Re-exporta do módulo principal
-from src.detector import PIIGuardian, DetectionMode, DetectionResult, detect_pii
-from src.validators import CPFValidator, CNPJValidator, PhoneValidator, EmailValidator
-from src.patterns import BrazilianPatterns, PIIType
-from src.utils import mask_pii, anonymize_text, normalize_text
+import importlib
+
+# Re-exporta do módulo principal, importando sob demanda (PEP 562): assim
+# `python detector.py --help`/`--version` não carrega o pipeline de detecção
+_LAZY_EXPORTS = {
+    'PIIGuardian': 'src.detector',
+    'DetectionMode': 'src.detector',
+    'DetectionResult': 'src.detector',
+    'detect_pii': 'src.detector',
+    'CPFValidator': 'src.validators',
+    'CNPJValidator': 'src.validators',
+    'PhoneValidator': 'src.validators',
+    'EmailValidator': 'src.validators',
+    'BrazilianPatterns': 'src.patterns',
+    'PIIType': 'src.patterns',
+    'mask_pii': 'src.utils',
+    'anonymize_text': 'src.utils',
+    'normalize_text': 'src.utils',
+}
 
 __all__ = [
     'PIIGuardian',
@@ -43,6 +57,20 @@ __all__ = [
 __version__ = "1.0.0"
 
 
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
 def main():
     """Execução via linha de comando."""
     import sys
@@ -82,6 +110,8 @@ Exemplos:
     
     args = parser.parse_args()
     
+    from src.detector import PIIGuardian
+    
     # Se não foi passado texto, mostra demo
     if not args.text:
         print("=" * 60)
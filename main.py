@@ -17,13 +17,24 @@ USO:
 
 import argparse
 import json
+import mmap
 import sys
+import threading
 from pathlib import Path
 
+# orjson é opcional: leitura mais rápida dos arquivos de pedidos
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    pass
+
 # Adiciona o diretório atual ao path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.detector import PIIGuardian
+# src.detector é importado dentro das funções que o usam: --help e --api
+# não pagam a importação do pipeline de detecção (regex, spaCy, torch)
 
 
 def detectar_texto(texto: str, modo: str = "balanced", verbose: bool = False) -> dict:
@@ -38,6 +49,8 @@ def detectar_texto(texto: str, modo: str = "balanced", verbose: bool = False) ->
     Returns:
         Dicionário com resultado da detecção
     """
+    from src.detector import PIIGuardian
+    
     detector = PIIGuardian(mode=modo)
     resultado = detector.detect(texto)
     
@@ -64,31 +77,56 @@ def detectar_texto(texto: str, modo: str = "balanced", verbose: bool = False) ->
     return output
 
 
-def processar_arquivo(caminho: str, modo: str = "balanced") -> list:
+def carregar_json(caminho: str):
+    """
+    Lê um arquivo JSON (UTF-8).
+    
+    Com orjson, o arquivo é mapeado em memória e analisado direto do
+    mapeamento, sem ler uma cópia dos bytes antes.
+    """
+    if ORJSON_AVAILABLE and Path(caminho).stat().st_size > 0:
+        with open(caminho, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as dados:
+                    return orjson.loads(dados)
+    
+    with open(caminho, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def processar_arquivo(caminho: str, modo: str = "balanced", workers: int = 1) -> list:
     """
     Processa um arquivo JSON com múltiplos pedidos.
     
+    Os pedidos são detectados em lote (detect_batch), ou distribuídos
+    entre processos (detect_many) quando workers > 1.
+    
     Args:
         caminho: Caminho do arquivo JSON
         modo: Modo de detecção
+        workers: Número de processos para a detecção
     
     Returns:
         Lista de resultados
     """
-    with open(caminho, 'r', encoding='utf-8') as f:
-        dados = json.load(f)
+    from src.detector import PIIGuardian
+    
+    dados = carregar_json(caminho)
     
     detector = PIIGuardian(mode=modo)
     resultados = []
     
     pedidos = dados if isinstance(dados, list) else dados.get('pedidos', [dados])
     
-    for i, item in enumerate(pedidos):
-        texto = item.get('texto', item.get('text', str(item)))
+    textos = [item.get('texto', item.get('text', str(item))) for item in pedidos]
+    if workers > 1:
+        deteccoes = detector.detect_many(textos, workers=workers)
+    else:
+        deteccoes = detector.detect_batch(textos)
+    
+    for i, (item, resultado) in enumerate(zip(pedidos, deteccoes)):
         id_pedido = item.get('id', i + 1)
         
-        resultado = detector.detect(texto)
-        
         resultados.append({
             "id": id_pedido,
             "tem_dados_pessoais": resultado.has_pii,
@@ -114,7 +152,20 @@ def modo_interativo():
     print("=" * 60)
     print("\nDigite 'sair' para encerrar.\n")
     
-    detector = PIIGuardian(mode="balanced")
+    # O detector (importação e modelos) é carregado em segundo plano
+    # enquanto o usuário digita o primeiro texto
+    carregado = {}
+    
+    def carregar_detector():
+        try:
+            from src.detector import PIIGuardian
+            carregado['detector'] = PIIGuardian(mode="balanced")
+        except Exception as e:
+            carregado['erro'] = e
+    
+    carregamento = threading.Thread(target=carregar_detector, daemon=True)
+    carregamento.start()
+    detector = None
     
     while True:
         try:
@@ -128,6 +179,12 @@ def modo_interativo():
                 print("⚠️  Texto vazio. Digite algo para analisar.")
                 continue
             
+            if detector is None:
+                carregamento.join()
+                if 'erro' in carregado:
+                    raise carregado['erro']
+                detector = carregado['detector']
+            
             resultado = detector.detect(texto)
             
             print("\n" + "-" * 40)
@@ -214,6 +271,13 @@ HACKATHON: 1º Hackathon em Controle Social da CGDF
         help="Modo de detecção (default: balanced)"
     )
     
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=1,
+        help="Número de processos para processar o arquivo (default: 1)"
+    )
+    
     parser.add_argument(
         "--api",
         action="store_true",
@@ -259,7 +323,7 @@ HACKATHON: 1º Hackathon em Controle Social da CGDF
             print(f"❌ Erro: Arquivo não encontrado: {args.file}")
             sys.exit(1)
         
-        resultados = processar_arquivo(args.file, args.mode)
+        resultados = processar_arquivo(args.file, args.mode, args.workers)
         
         output_json = json.dumps(resultados, ensure_ascii=False, indent=2)
         
@@ -9,6 +9,7 @@ de dados pessoais em massa.
 Uso:
     python scripts/batch_process.py --input pedidos.csv --output classificados.csv --column texto_pedido
     python scripts/batch_process.py --input pedidos.json --output resultados.json
+    python scripts/batch_process.py --input pedidos.jsonl --output resultados.json
 
 Autor: Equipe PIIGuardian
 """
@@ -16,13 +17,17 @@ Autor: Equipe PIIGuardian
 import argparse
 import csv
 import json
+import mmap
+import queue
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Iterator
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import threading
+from collections import deque
+from concurrent.futures import Executor, FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import chain, islice
 
 # Adiciona diretório raiz ao path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -30,10 +35,18 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.detector import PIIGuardian
 from src.utils import normalize_text, save_json_file
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-# Lock para thread-safety no contador
-progress_lock = threading.Lock()
-progress_counter = 0
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 
 class BatchProcessor:
@@ -73,29 +86,32 @@ class BatchProcessor:
         """
         try:
             normalized = normalize_text(text) if text else ""
-            result = self.detector.detect(normalized)
-            
-            return {
-                'id': record_id,
-                'has_pii': result.has_pii,
-                'entities': [e.to_dict() for e in result.entities],
-                'entity_count': len(result.entities),
-                'processing_time_ms': result.metadata['processing_time_ms'],
-                'error': None
-            }
+            return _result_dict(record_id, self.detector.detect(normalized))
         except Exception as e:
-            return {
-                'id': record_id,
-                'has_pii': None,
-                'entities': [],
-                'entity_count': 0,
-                'processing_time_ms': 0,
-                'error': str(e)
-            }
+            return _error_dict(record_id, e)
+    
+    def process_group(self, items: List[Tuple[Any, str]]) -> List[Dict[str, Any]]:
+        """
+        Processa um grupo de pares (id, texto) com uma chamada a detect_batch.
+        
+        O BERT roda em um único forward para o grupo. Se a chamada falhar,
+        o grupo é refeito texto a texto, para que o erro fique só no
+        registro que o causou.
+        """
+        try:
+            texts = [normalize_text(text) if text else "" for _, text in items]
+            detections = self.detector.detect_batch(texts, batch_size=DETECT_BATCH_SIZE)
+        except Exception:
+            return [self.process_text(text, record_id) for record_id, text in items]
+        
+        return [
+            _result_dict(record_id, detection)
+            for (record_id, _), detection in zip(items, detections)
+        ]
     
     def process_batch(
         self,
-        records: List[Dict[str, Any]],
+        records: Iterable[Dict[str, Any]],
         text_column: str = 'text',
         id_column: str = 'id'
     ) -> List[Dict[str, Any]]:
@@ -103,53 +119,78 @@ class BatchProcessor:
         Processa um lote de registros.
         
         Args:
-            records: Lista de registros
+            records: Registros (lista ou iterável lido em streaming)
             text_column: Nome da coluna com o texto
             id_column: Nome da coluna com o ID
             
         Returns:
             Lista de resultados
         """
-        global progress_counter
-        progress_counter = 0
+        items = (
+            (record.get(id_column, str(i)), record.get(text_column, ''))
+            for i, record in enumerate(records)
+        )
+        if isinstance(records, list):
+            items = list(items)
+        return self.process_items(items)
+    
+    def process_items(self, items: Iterable[Tuple[Any, str]]) -> List[Dict[str, Any]]:
+        """
+        Processa um lote de pares (id, texto).
         
+        Args:
+            items: Pares (id do registro, texto); um iterável que não seja
+                lista é consumido em grupos, sem ser materializado
+            
+        Returns:
+            Lista de resultados
+        """
         results = []
         start_time = time.time()
-        total = len(records)
+        total = len(items) if isinstance(items, list) else None
+        progress_total = f"/{total}" if total is not None else ""
         
         if self.workers > 1:
-            # Processamento paralelo
-            with ThreadPoolExecutor(max_workers=self.workers) as executor:
-                futures = {}
-                for record in records:
-                    text = record.get(text_column, '')
-                    record_id = record.get(id_column, str(len(futures)))
-                    future = executor.submit(self.process_text, text, record_id)
-                    futures[future] = record
-                
-                for future in as_completed(futures):
-                    result = future.result()
-                    results.append(result)
-                    
-                    with progress_lock:
-                        progress_counter += 1
-                        if self.verbose and progress_counter % 100 == 0:
-                            print(f"  Processado: {progress_counter}/{total}")
+            # Processamento paralelo: a detecção é CPU-bound em Python, então
+            # usa processos (threads ficariam presas no GIL), com os
+            # registros divididos em fatias para diluir a comunicação
+            if total is not None:
+                bounds = _chunk_bounds(total, self.workers)
+                chunks = [items[start:end] for start, end in bounds]
+            else:
+                # Sem o total (streaming), fatias de tamanho fixo vão para o
+                # pool à medida que são lidas: os processos já trabalham
+                # enquanto o restante da entrada é lido
+                chunks = _iter_chunks(items, STREAM_CHUNK_SIZE)
+            
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker_processor,
+                initargs=(self.mode,)
+            ) as executor:
+                if total is not None:
+                    chunk_results = executor.map(_process_chunk, chunks)
+                else:
+                    # executor.map submeteria a entrada inteira de uma vez
+                    chunk_results = _map_bounded(
+                        executor, _process_chunk, chunks, STREAM_WINDOW_FACTOR * self.workers
+                    )
+                for chunk_result in chunk_results:
+                    for result in chunk_result:
+                        results.append(result)
+                        self._update_stats(result)
                     
-                    self._update_stats(result)
+                    if self.verbose:
+                        print(f"  Processado: {len(results)}{progress_total}")
         else:
-            # Processamento sequencial
-            for i, record in enumerate(records):
-                text = record.get(text_column, '')
-                record_id = record.get(id_column, str(i))
-                
-                result = self.process_text(text, record_id)
-                results.append(result)
-                
-                self._update_stats(result)
+            # Processamento sequencial, em grupos de DETECT_BATCH_SIZE textos
+            for group in _iter_chunks(items, DETECT_BATCH_SIZE):
+                for result in self.process_group(group):
+                    results.append(result)
+                    self._update_stats(result)
                 
-                if self.verbose and (i + 1) % 100 == 0:
-                    print(f"  Processado: {i + 1}/{total}")
+                if self.verbose:
+                    print(f"  Processado: {len(results)}{progress_total}")
         
         self.stats['total_time_ms'] = (time.time() - start_time) * 1000
         
@@ -187,8 +228,232 @@ class BatchProcessor:
         }
 
 
+# Textos por chamada a detect_batch (e por forward do BERT)
+DETECT_BATCH_SIZE = 64
+
+# Menor fatia de registros enviada a um processo do pool
+MIN_CHUNK_SIZE = 16
+
+# Fatia enviada ao pool quando a entrada chega em streaming (total desconhecido)
+STREAM_CHUNK_SIZE = 256
+
+# Fatias pendentes no pool, por worker, quando a entrada chega em streaming
+STREAM_WINDOW_FACTOR = 2
+
+# Leitura antecipada: registros por bloco e blocos mantidos na fila
+PREFETCH_CHUNK_SIZE = 1024
+PREFETCH_DEPTH = 4
+
+# Intervalo (s) em que a thread de leitura, com a fila cheia, verifica se
+# o consumidor parou
+PREFETCH_POLL_INTERVAL = 0.1
+
+
+def _iter_chunks(items: Iterable, size: int) -> Iterator[list]:
+    """Divide um iterável em listas de até ``size`` itens."""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _map_bounded(executor: Executor, fn, iterable: Iterable, window: int) -> Iterator:
+    """
+    Como executor.map, mas com no máximo ``window`` tarefas pendentes.
+    
+    Um item só é lido do iterável e submetido quando outra tarefa termina,
+    então a entrada é consumida no ritmo do pool. Os resultados saem na
+    ordem de entrada.
+    """
+    iterator = iter(iterable)
+    futures = deque(executor.submit(fn, item) for item in islice(iterator, window))
+    
+    while futures:
+        wait([f for f in futures if not f.done()], return_when=FIRST_COMPLETED)
+        
+        while futures and futures[0].done():
+            yield futures.popleft().result()
+        
+        for item in islice(iterator, window - len(futures)):
+            futures.append(executor.submit(fn, item))
+
+
+def prefetch(
+    iterable: Iterable,
+    chunk_size: int = PREFETCH_CHUNK_SIZE,
+    depth: int = PREFETCH_DEPTH
+) -> Iterator:
+    """
+    Consome um iterável em uma thread de leitura, à frente de quem o usa.
+    
+    A thread lê blocos de ``chunk_size`` itens para uma fila limitada a
+    ``depth`` blocos: a leitura do disco do próximo bloco acontece enquanto
+    o atual é processado. Um erro na leitura é relançado no consumidor.
+    Se o consumidor parar antes do fim (ou fechar o gerador), a thread
+    para e fecha o iterável (por exemplo, o arquivo de iter_jsonl).
+    """
+    chunks = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    
+    def put(item) -> bool:
+        """Enfileira um item; False se o consumidor parou."""
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=PREFETCH_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+    
+    def reader():
+        try:
+            for chunk in _iter_chunks(iterable, chunk_size):
+                if not put(chunk):
+                    return
+        except Exception as e:
+            put(e)
+        else:
+            put(None)
+        finally:
+            # Fechado na própria thread, que é quem avança o gerador
+            close = getattr(iterable, 'close', None)
+            if close is not None:
+                close()
+    
+    threading.Thread(target=reader, daemon=True).start()
+    
+    try:
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                return
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield from chunk
+    finally:
+        stop.set()
+
+
+def _result_dict(record_id: Any, result) -> Dict[str, Any]:
+    """Monta o resultado de um registro a partir do DetectionResult."""
+    return {
+        'id': record_id,
+        'has_pii': result.has_pii,
+        'entities': [e.to_dict() for e in result.entities],
+        'entity_count': len(result.entities),
+        'processing_time_ms': result.metadata['processing_time_ms'],
+        'error': None
+    }
+
+
+def _error_dict(record_id: Any, error: Exception) -> Dict[str, Any]:
+    """Monta o resultado de um registro cujo processamento falhou."""
+    return {
+        'id': record_id,
+        'has_pii': None,
+        'entities': [],
+        'entity_count': 0,
+        'processing_time_ms': 0,
+        'error': str(error)
+    }
+
+
+def _chunk_bounds(
+    total: int,
+    workers: int,
+    min_size: int = MIN_CHUNK_SIZE
+) -> List[Tuple[int, int]]:
+    """
+    Divide [0, total) em fatias (início, fim) de tamanho decrescente.
+    
+    Cada fatia tem metade do restante dividido entre os workers: as
+    primeiras são grandes (pouca comunicação) e as últimas pequenas, para
+    que os processos que ficam livres no fim peguem o que sobra e terminem
+    juntos, mesmo com textos de tamanhos muito diferentes.
+    """
+    bounds = []
+    start = 0
+    while start < total:
+        size = max(min_size, (total - start) // (2 * workers))
+        bounds.append((start, min(total, start + size)))
+        start += size
+    return bounds
+
+
+# Processador de cada processo do pool (criado uma vez pelo initializer)
+_WORKER_PROCESSOR: Optional[BatchProcessor] = None
+
+
+def _init_worker_processor(mode: str):
+    """Initializer do pool: constrói o processador (e o detector) do processo."""
+    global _WORKER_PROCESSOR
+    _WORKER_PROCESSOR = BatchProcessor(mode=mode)
+
+
+def _process_chunk(items: List[Tuple[Any, str]]) -> List[Dict[str, Any]]:
+    """Processa uma fatia de pares (id, texto) em um processo do pool."""
+    results = []
+    for start in range(0, len(items), DETECT_BATCH_SIZE):
+        results.extend(_WORKER_PROCESSOR.process_group(items[start:start + DETECT_BATCH_SIZE]))
+    return results
+
+
+def load_csv_table(file_path: str) -> Optional['pa.Table']:
+    """
+    Carrega um arquivo CSV como tabela colunar do Arrow.
+    
+    O arquivo é mapeado em memória (pa.memory_map) e o parsing é feito em
+    C direto do mapeamento, sem criar um dict por linha. Todas as colunas
+    são lidas como texto, como no csv.DictReader (sem inferência de tipos
+    nem células vazias virando nulo).
+    
+    Returns:
+        Tabela, ou None sem pyarrow ou quando o leitor do Arrow rejeita o
+        arquivo (vazio, linhas com número de campos diferente)
+    """
+    if not PYARROW_AVAILABLE:
+        return None
+    
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        header = next(csv.reader(f), [])
+    
+    try:
+        with pa.memory_map(file_path) as source:
+            return pv.read_csv(
+                source,
+                parse_options=pv.ParseOptions(newlines_in_values=True),
+                convert_options=pv.ConvertOptions(
+                    column_types={name: pa.string() for name in header},
+                    strings_can_be_null=False,
+                    quoted_strings_can_be_null=False
+                )
+            )
+    except pa.ArrowInvalid:
+        return None
+
+
+def table_items(table: 'pa.Table', text_column: str, id_column: str) -> List[Tuple[Any, str]]:
+    """Extrai os pares (id, texto) direto das colunas da tabela."""
+    texts = table.column(text_column).to_pylist()
+    if id_column in table.column_names:
+        ids = table.column(id_column).to_pylist()
+    else:
+        ids = [str(i) for i in range(len(texts))]
+    return list(zip(ids, texts))
+
+
 def load_csv(file_path: str) -> List[Dict[str, Any]]:
     """Carrega dados de arquivo CSV."""
+    table = load_csv_table(file_path)
+    if table is not None:
+        return table.to_pylist()
+    return _read_csv_rows(file_path)
+
+
+def _read_csv_rows(file_path: str) -> List[Dict[str, Any]]:
+    """Carrega dados de arquivo CSV com csv.DictReader."""
     records = []
     with open(file_path, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
@@ -197,6 +462,29 @@ def load_csv(file_path: str) -> List[Dict[str, Any]]:
     return records
 
 
+# Colunas de resultado acrescentadas à saída CSV
+RESULT_COLUMNS = ('pii_detected', 'pii_count', 'pii_entities')
+
+
+def save_csv_table(table: 'pa.Table', results: List[Dict[str, Any]], file_path: str):
+    """
+    Salva em CSV a tabela de entrada com as colunas de resultado.
+    
+    Gera o mesmo arquivo que save_csv sobre os registros mesclados
+    (csv.writer, aspas só quando necessário), mas as linhas saem direto
+    das colunas da tabela, sem montar um dict por registro.
+    """
+    columns = [column.to_pylist() for column in table.columns]
+    columns.append([r['has_pii'] for r in results])
+    columns.append([r['entity_count'] for r in results])
+    columns.append([json.dumps(r['entities'], ensure_ascii=False) for r in results])
+    
+    with open(file_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(table.column_names + list(RESULT_COLUMNS))
+        writer.writerows(zip(*columns))
+
+
 def save_csv(records: List[Dict[str, Any]], file_path: str, fieldnames: List[str] = None):
     """Salva dados em arquivo CSV."""
     if not records:
@@ -220,10 +508,38 @@ def save_csv(records: List[Dict[str, Any]], file_path: str, fieldnames: List[str
             writer.writerow(row)
 
 
+def iter_jsonl(file_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Lê um arquivo JSONL (um registro JSON por linha) em streaming.
+    
+    Os registros são produzidos à medida que as linhas são lidas; linhas em
+    branco são ignoradas.
+    """
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+    with open(file_path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
 def load_json(file_path: str) -> List[Dict[str, Any]]:
-    """Carrega dados de arquivo JSON."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    """
+    Carrega dados de arquivo JSON.
+    
+    Com orjson, o arquivo é mapeado em memória e analisado direto do
+    mapeamento, sem ler uma cópia dos bytes antes.
+    """
+    if ORJSON_AVAILABLE and Path(file_path).stat().st_size > 0:
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Leitura única do início ao fim: pede read-ahead agressivo
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mm) as raw:
+                    data = orjson.loads(raw)
+    else:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
     
     if isinstance(data, list):
         return data
@@ -292,17 +608,50 @@ def main():
     
     # Carrega dados
     print(f"📂 Carregando dados de: {args.input}")
-    if input_path.suffix.lower() == '.csv':
-        records = load_csv(args.input)
+    # CSV vira tabela colunar quando há pyarrow: os textos saem direto da
+    # coluna e os dicts por linha só são montados se a saída for CSV
+    table = None
+    records = None
+    stream = None
+    input_suffix = input_path.suffix.lower()
+    if input_suffix == '.csv':
+        table = load_csv_table(args.input)
+        if table is None:
+            records = _read_csv_rows(args.input)
+    elif input_suffix == '.jsonl' and Path(args.output).suffix.lower() != '.csv':
+        # JSONL vai em streaming para o processador, sem a lista de
+        # registros em memória, lido por uma thread à frente da detecção
+        # (a saída CSV precisa dos originais)
+        stream = prefetch(iter_jsonl(args.input))
+    elif input_suffix == '.jsonl':
+        records = list(iter_jsonl(args.input))
     else:
         records = load_json(args.input)
-    print(f"   ✓ {len(records)} registros carregados")
+    
+    columns = None
+    total = None
+    if table is not None:
+        total = table.num_rows
+        columns = table.column_names
+    elif stream is not None:
+        first = next(stream, None)
+        if first is not None:
+            columns = list(first.keys())
+            stream = chain([first], stream)
+    else:
+        total = len(records)
+        if records:
+            columns = list(records[0].keys())
+    
+    if total is None:
+        print("   ✓ Registros lidos em streaming (JSONL)")
+    else:
+        print(f"   ✓ {total} registros carregados")
     
     # Verifica coluna de texto
-    if records and args.column not in records[0]:
-        available_columns = list(records[0].keys())
+    if columns is not None and args.column not in columns:
         print(f"❌ Coluna '{args.column}' não encontrada.")
-        print(f"   Colunas disponíveis: {available_columns}")
+        print(f"   Colunas disponíveis: {columns}")
         sys.exit(1)
     
     # Inicializa processador
@@ -315,14 +664,20 @@ def main():
     print("   ✓ Processador inicializado")
     
     # Processa lote
-    print(f"\n🔍 Processando {len(records)} registros...")
+    if total is None:
+        print("\n🔍 Processando registros...")
+    else:
+        print(f"\n🔍 Processando {total} registros...")
     start_time = time.time()
     
-    results = processor.process_batch(
-        records,
-        text_column=args.column,
-        id_column=args.id_column
-    )
+    if table is not None:
+        results = processor.process_items(table_items(table, args.column, args.id_column))
+    else:
+        results = processor.process_batch(
+            records if stream is None else stream,
+            text_column=args.column,
+            id_column=args.id_column
+        )
     
     elapsed = time.time() - start_time
     print(f"   ✓ Processamento concluído em {elapsed:.2f}s")
@@ -332,17 +687,24 @@ def main():
     output_path = Path(args.output)
     
     if output_path.suffix.lower() == '.csv':
-        # Para CSV, mescla dados originais com resultados
-        merged = []
-        for record, result in zip(records, results):
-            merged_record = dict(record)
-            merged_record['pii_detected'] = result['has_pii']
-            merged_record['pii_count'] = result['entity_count']
-            merged_record['pii_entities'] = result['entities']
-            merged.append(merged_record)
-        
-        fieldnames = list(records[0].keys()) + ['pii_detected', 'pii_count', 'pii_entities']
-        save_csv(merged, args.output, fieldnames)
+        # Para CSV, mescla dados originais com resultados (entrada em
+        # tabela Arrow é escrita pelo Arrow, salvo se já tiver as colunas
+        # de resultado, que a mescla por dict sobrescreve)
+        if table is not None and not set(RESULT_COLUMNS) & set(table.column_names):
+            save_csv_table(table, results, args.output)
+        else:
+            if records is None:
+                records = table.to_pylist()
+            merged = []
+            for record, result in zip(records, results):
+                merged_record = dict(record)
+                merged_record['pii_detected'] = result['has_pii']
+                merged_record['pii_count'] = result['entity_count']
+                merged_record['pii_entities'] = result['entities']
+                merged.append(merged_record)
+            
+            fieldnames = (list(records[0].keys()) if records else []) + list(RESULT_COLUMNS)
+            save_csv(merged, args.output, fieldnames)
     else:
         # Para JSON, salva estrutura completa
         output_data = {
@@ -15,10 +15,11 @@ Autor: Equipe PIIGuardian
 
 import argparse
 import json
+import re
 import sys
 import time
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 
@@ -29,6 +30,20 @@ from src.detector import PIIGuardian
 from src.utils import load_json_file, save_json_file, normalize_text
 
 
+# Formatação ignorada ao comparar valores de entidades
+_ENTITY_STRIP = re.compile(r'[\s\.\-\/\(\)]')
+
+
+def _normalize_pair(entity_type: str, value: str) -> Tuple[str, str]:
+    """Normaliza (tipo, valor) de uma entidade para comparação."""
+    entity_type = entity_type.replace('_CONTEXTUAL', '')
+    
+    # Remove formatação para comparação
+    value_normalized = _ENTITY_STRIP.sub('', value.strip().lower())
+    
+    return (entity_type, value_normalized)
+
+
 @dataclass
 class EvaluationMetrics:
     """Métricas de avaliação."""
@@ -84,6 +99,23 @@ class TestCase:
     expected_entities: List[Dict[str, Any]]
     expected_has_pii: bool
     
+    # Entidades esperadas já normalizadas (uma chave por entidade, na ordem
+    # original) e o conjunto delas, calculados uma vez na criação do caso
+    expected_keys: Tuple[Tuple[str, str], ...] = field(init=False, repr=False, compare=False)
+    normalized: FrozenSet[Tuple[str, str]] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Tipos internados: as comparações com os tipos do detector (também
+        # internados) resolvem por identidade
+        self.expected_keys = tuple(
+            (sys.intern(entity_type), value)
+            for entity_type, value in (
+                _normalize_pair(e.get('type', 'UNKNOWN'), e.get('value', ''))
+                for e in self.expected_entities
+            )
+        )
+        self.normalized = frozenset(self.expected_keys)
+    
     @classmethod
     def from_dict(cls, data: Dict) -> 'TestCase':
         return cls(
@@ -136,9 +168,13 @@ class Evaluator:
         # Executa detecção
         result = self.detector.detect(normalize_text(test_case.text))
         
-        # Extrai entidades detectadas
-        detected = {self._normalize_entity(e.to_dict()) for e in result.entities}
-        expected = {self._normalize_entity(e) for e in test_case.expected_entities}
+        # Normaliza cada entidade detectada uma única vez: as chaves servem
+        # para o conjunto e para a contagem por tipo (sem to_dict); as
+        # esperadas já vêm normalizadas do TestCase
+        detected_keys = [_normalize_pair(e.type, e.value) for e in result.entities]
+        expected_keys = test_case.expected_keys
+        detected = set(detected_keys)
+        expected = test_case.normalized
         
         # Calcula TP, FP, FN
         tp = len(detected & expected)
@@ -155,26 +191,26 @@ class Evaluator:
             self.metrics.true_negatives += 1
         
         # Atualiza métricas por tipo
-        for entity in test_case.expected_entities:
+        by_type = self.metrics.by_type
+        for entity, normalized in zip(test_case.expected_entities, expected_keys):
             entity_type = entity.get('type', 'UNKNOWN')
-            if entity_type not in self.metrics.by_type:
-                self.metrics.by_type[entity_type] = {'tp': 0, 'fp': 0, 'fn': 0}
+            if entity_type not in by_type:
+                by_type[entity_type] = {'tp': 0, 'fp': 0, 'fn': 0}
             
             # Verifica se foi detectado
-            normalized = self._normalize_entity(entity)
             if normalized in detected:
-                self.metrics.by_type[entity_type]['tp'] += 1
+                by_type[entity_type]['tp'] += 1
             else:
-                self.metrics.by_type[entity_type]['fn'] += 1
+                by_type[entity_type]['fn'] += 1
         
-        for entity in result.entities:
-            entity_type = entity.type.replace('_CONTEXTUAL', '')
-            if entity_type not in self.metrics.by_type:
-                self.metrics.by_type[entity_type] = {'tp': 0, 'fp': 0, 'fn': 0}
+        for normalized in detected_keys:
+            # O tipo normalizado já vem sem o sufixo _CONTEXTUAL
+            entity_type = normalized[0]
+            if entity_type not in by_type:
+                by_type[entity_type] = {'tp': 0, 'fp': 0, 'fn': 0}
             
-            normalized = self._normalize_entity(entity.to_dict())
             if normalized not in expected:
-                self.metrics.by_type[entity_type]['fp'] += 1
+                by_type[entity_type]['fp'] += 1
         
         # Registra erros (falsos negativos)
         if fn > 0:
@@ -199,14 +235,7 @@ class Evaluator:
     
     def _normalize_entity(self, entity: Dict) -> Tuple:
         """Normaliza entidade para comparação."""
-        entity_type = entity.get('type', 'UNKNOWN').replace('_CONTEXTUAL', '')
-        value = entity.get('value', '').strip()
-        
-        # Remove formatação para comparação
-        import re
-        value_normalized = re.sub(r'[\s\.\-\/\(\)]', '', value.lower())
-        
-        return (entity_type, value_normalized)
+        return _normalize_pair(entity.get('type', 'UNKNOWN'), entity.get('value', ''))
     
     def get_report(self) -> str:
         """Gera relatório de avaliação."""
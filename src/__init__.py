@@ -31,7 +31,7 @@ __author__ = "Aviahub"
 __license__ = "MIT"
 
 from .detector import PIIGuardian
-from .validators import CPFValidator, CNPJValidator, PhoneValidator
+from .validators import CPFValidator, CNPJValidator, PhoneValidator, validate_cpf, validate_cnpj
 from .patterns import BrazilianPatterns
 
 __all__ = [
@@ -39,5 +39,7 @@ __all__ = [
     "CPFValidator",
     "CNPJValidator",
     "PhoneValidator",
+    "validate_cpf",
+    "validate_cnpj",
     "BrazilianPatterns",
 ]
@@ -19,11 +19,18 @@ Pipeline de Detecção:
 """
 
 import re
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, field
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, List, Optional, Any, Pattern, Set, Tuple
+from dataclasses import dataclass, field, replace
+from collections import OrderedDict
 from enum import Enum
+import hashlib
 import logging
-from datetime import datetime
+import sys
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from time import perf_counter_ns
 
 # Imports locais
 from .patterns import BrazilianPatterns, ContextualPatterns, PIIType
@@ -33,8 +40,10 @@ from .validators import (
     PhoneValidator,
     EmailValidator,
     CEPValidator,
-    ValidationResult
+    ValidationResult,
+    validate_all
 )
+from .utils import get_placeholder, mask_value, replace_spans
 
 # Configuração de logging
 logging.basicConfig(level=logging.INFO)
@@ -52,6 +61,115 @@ except ImportError:
         "Detecção BERT desabilitada. Instale com: pip install torch transformers"
     )
 
+# Flag para verificar se Intel Extension for PyTorch está disponível (opcional)
+IPEX_AVAILABLE = False
+if TRANSFORMERS_AVAILABLE:
+    try:
+        import intel_extension_for_pytorch as ipex
+        IPEX_AVAILABLE = True
+    except ImportError:
+        pass
+
+# __slots__ nos dataclasses criados em grande número (Python 3.10+)
+_DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Padrões regex adicionais, compilados uma única vez na importação do módulo
+_CPF_AGGRESSIVE_RE = re.compile(r'\b(?:\d{3}[\.\-\s]?){2}\d{3}[\.\-\s]?\d{2}?\b')
+_PHONE_AGGRESSIVE_RE = re.compile(
+    r'\b(?:\d{4,5}[-\s]?\d{4}|\d{2}[\)]\s?\d{4,5}[-\s]?\d{4})\b'
+)
+_PHONE_CONTEXT_RE = re.compile(
+    r'\b(número|telefone|celular|fone|contato)[\s:]+(\d{4,5}[-\s]?\d{4})\b',
+    re.IGNORECASE
+)
+_CPF_CONTEXT_RE = re.compile(
+    r'\b(CPF|c\.p\.f\.?|cadastro)[\s:]+([0-9\.\-\s]{8,18})\b',
+    re.IGNORECASE
+)
+_NAME_KEYWORDS_RE = re.compile(
+    r'\b(sr\.?|sra\.?|senhor[a]?|doutor[a]?|dr\.?|dra\.?)\s+'
+    r'([A-Z][a-záàâãéèêíïóôõöúçñ]+(?:\s+[A-Z][a-záàâãéèêíïóôõöúçñ]+){1,4})\b'
+)
+
+# Marcadores de tratamento e de endereço que antecedem nomes e endereços
+_BERT_TITLE_MARKERS = (
+    'sr', 'sra', 'srta', 'dr', 'dra', 'dona', 'senhor', 'senhora',
+    'rua', 'av', 'avenida', 'travessa', 'alameda', 'praça', 'rodovia',
+    'quadra', 'qd', 'bairro', 'lote',
+)
+
+# Pré-filtro da fase BERT: o modelo só roda em textos com marcador de
+# tratamento/endereço ou palavra-chave de PII em qualquer caixa (textos todo
+# em minúsculas, como "meu nome é joão silva" ou "moro na rua x"), dígito,
+# "@" ou palavra capitalizada com 3+ letras. A última alternativa já cobre
+# bigramas capitalizados ("Maria Souza") e nomes curtos ("Ana") e é a rede
+# de segurança do recall para nomes sem marcador.
+_BERT_PRESCREEN_RE = re.compile(
+    r'(?i:\b(?:' + '|'.join(_BERT_TITLE_MARKERS) + r')\b)'
+    r'|(?i:\b(?:cpf|rg|cep|cnpj|telefone|celular|e-?mail|nome)\b)'
+    r'|[0-9@]'
+    r'|\b[A-ZÀ-ÖØ-Þ][a-zß-öø-ÿ]{2,}'
+)
+
+# Padrões e validadores compartilhados por todas as instâncias do detector.
+# São objetos sem estado mutável; compilá-los uma vez evita o custo de
+# compilação a cada PIIGuardian criado (ex.: um detector por requisição).
+_SHARED_PATTERNS = BrazilianPatterns()
+_SHARED_CONTEXTUAL = ContextualPatterns()
+_SHARED_VALIDATORS = {
+    'CPF': CPFValidator(),
+    'CNPJ': CNPJValidator(),
+    'TELEFONE': PhoneValidator(),
+    'EMAIL': EmailValidator(),
+    'CEP': CEPValidator(),
+}
+
+# Validador padrão de cada tipo de entidade: só estes passam por validate_all
+_STOCK_VALIDATORS = {
+    'CPF': _SHARED_VALIDATORS['CPF'],
+    'CNPJ': _SHARED_VALIDATORS['CNPJ'],
+    'TELEFONE': _SHARED_VALIDATORS['TELEFONE'],
+    'CELULAR': _SHARED_VALIDATORS['TELEFONE'],
+    'EMAIL': _SHARED_VALIDATORS['EMAIL'],
+    'CEP': _SHARED_VALIDATORS['CEP'],
+}
+
+# Tabela de tradução que remove dígitos ASCII (contagem de dígitos em C)
+_ASCII_DIGITS_DEL = str.maketrans('', '', '0123456789')
+
+
+def _count_digits(value: str) -> int:
+    """Conta os dígitos de um valor sem laço Python por caractere."""
+    if value.isascii():
+        return len(value) - len(value.translate(_ASCII_DIGITS_DEL))
+    # \d também casa dígitos Unicode; mantém a contagem de str.isdigit
+    return sum(map(str.isdigit, value))
+
+
+# Bytes que não são dígitos ASCII; em UTF-8, bytes de caracteres
+# multibyte nunca caem em 0x30-0x39
+_NON_DIGIT_BYTES = bytes(c for c in range(256) if not 0x30 <= c <= 0x39)
+
+
+def _count_text_digits(text: str) -> int:
+    """
+    Versão de _count_digits para textos longos.
+    
+    Conta os dígitos ASCII sobre os bytes UTF-8 (em C); só percorre o
+    texto caractere a caractere se houver algum dígito não ASCII.
+    """
+    if not text.isascii() and any(
+        char.isdigit() for char in set(text) if not char.isascii()
+    ):
+        return _count_digits(text)
+    return len(text.encode('utf-8', 'surrogatepass').translate(None, _NON_DIGIT_BYTES))
+
+# Faixas de comprimento (em tokens) usadas para agrupar os lotes do BERT
+BERT_LENGTH_BUCKETS = (16, 32, 64, 128, 512)
+
+# Tipos de entidade produzidos pelo BERT (índice 0 = label ignorado)
+BERT_ENTITY_TYPES = (None, 'NOME_PESSOA', 'ENDERECO', 'ORGANIZACAO')
+
 
 class DetectionMode(Enum):
     """Modos de operação do detector."""
@@ -60,15 +178,23 @@ class DetectionMode(Enum):
     PRECISE = "precise"     # Foco em precisão
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DetectionConfig:
     """Configuração do detector."""
     mode: DetectionMode = DetectionMode.BALANCED
     use_bert: bool = True
+    # Pula o BERT em textos sem marcador, palavra-chave ou palavra
+    # capitalizada (_BERT_PRESCREEN_RE); False força o BERT em todo texto
+    bert_prescreen: bool = True
+    # Quantiza as camadas lineares do BERT para INT8 quando não há IPEX (BF16)
+    bert_quantized: bool = False
     use_contextual: bool = True
     validate_documents: bool = True
     min_confidence: float = 0.5
     
+    # Número máximo de resultados mantidos em cache (0 desabilita)
+    result_cache_size: int = 1024
+    
     # Thresholds dinâmicos por tipo de dado
     thresholds: Dict[str, float] = field(default_factory=lambda: {
         'CPF': 0.3,          # Baixo - captura TUDO que parecer CPF
@@ -84,7 +210,7 @@ class DetectionConfig:
     })
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Entity:
     """Representa uma entidade de dado pessoal detectada."""
     type: str
@@ -96,23 +222,48 @@ class Entity:
     validation_message: str = ""
     detection_method: str = "regex"
     explanation: str = ""
+    # Tipo sem o sufixo _CONTEXTUAL, calculado uma vez na criação
+    base_type: str = field(default='', init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if self.type.endswith('_CONTEXTUAL'):
+            self.base_type = self.type[:-len('_CONTEXTUAL')]
+        else:
+            self.base_type = self.type
     
     def to_dict(self) -> Dict[str, Any]:
         """Converte entidade para dicionário."""
-        return {
-            'type': self.type,
-            'value': self.value,
-            'start': self.start,
-            'end': self.end,
-            'confidence': self.confidence,
-            'validation': self.validation_status,
-            'validation_message': self.validation_message,
-            'detection_method': self.detection_method,
-            'explanation': self.explanation
-        }
+        return dict(zip(_ENTITY_DICT_KEYS, _ENTITY_DICT_GETTER(self)))
+
+
+# Chaves de Entity.to_dict() e os atributos correspondentes, lidos de uma
+# só vez por um attrgetter (busca múltipla feita em C)
+_ENTITY_DICT_KEYS = (
+    'type', 'value', 'start', 'end', 'confidence', 'validation',
+    'validation_message', 'detection_method', 'explanation'
+)
+_ENTITY_DICT_GETTER = attrgetter(
+    'type', 'value', 'start', 'end', 'confidence', 'validation_status',
+    'validation_message', 'detection_method', 'explanation'
+)
 
 
 @dataclass
+class RegexRule:
+    """Regra regex adicional aplicada diretamente pelo detector."""
+    pattern: Pattern
+    entity_type: str
+    confidence: float
+    detection_method: str
+    explanation: str
+    group: int = 0
+    strip_value: bool = False
+    min_digits: int = 0
+    max_digits: Optional[int] = None
+    accept: Optional[Callable[[str], bool]] = None
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class DetectionResult:
     """Resultado da detecção de dados pessoais."""
     has_pii: bool
@@ -130,6 +281,11 @@ class DetectionResult:
         }
 
 
+# Argumentos de PIIGuardian._run_pipeline para um texto: texto, entidades
+# do BERT, tempo do BERT (ms) e pré-filtro dos padrões contextuais
+_PipelineJob = Tuple[str, List[Entity], float, Optional[Set[Pattern]]]
+
+
 class PIIGuardian:
     """
     Detector de Dados Pessoais para o Participa DF.
@@ -154,7 +310,7 @@ class PIIGuardian:
     """
     
     # Lista de nomes brasileiros comuns (top 1000)
-    BRAZILIAN_NAMES: set = {
+    BRAZILIAN_NAMES: frozenset = frozenset({
         # Sobrenomes mais comuns
         "silva", "santos", "oliveira", "souza", "rodrigues", "ferreira",
         "alves", "pereira", "lima", "gomes", "costa", "ribeiro", "martins",
@@ -167,7 +323,7 @@ class PIIGuardian:
         "francisco", "pedro", "lucas", "luiz", "marcos", "gabriel",
         "rafael", "daniel", "fernanda", "juliana", "camila", "amanda",
         "patricia", "aline", "bruna", "jessica", "leticia", "larissa",
-    }
+    })
     
     def __init__(
         self,
@@ -190,31 +346,35 @@ class PIIGuardian:
             mode_enum = DetectionMode(mode)
             self.config = self._get_config_for_mode(mode_enum)
         
-        # Inicializa padrões
-        self.patterns = BrazilianPatterns()
-        self.contextual = ContextualPatterns()
+        # Padrões compilados compartilhados (ver _SHARED_PATTERNS)
+        self.patterns = _SHARED_PATTERNS
+        self.contextual = _SHARED_CONTEXTUAL
         
         # Adiciona padrões extras se fornecidos
         if extra_patterns:
             self._add_extra_patterns(extra_patterns)
         
-        # Inicializa validadores
-        self.validators = {
-            'CPF': CPFValidator(),
-            'CNPJ': CNPJValidator(),
-            'TELEFONE': PhoneValidator(),
-            'CELULAR': PhoneValidator(),
-            'EMAIL': EmailValidator(),
-            'CEP': CEPValidator(),
-        }
+        # Monta as regras regex adicionais (padrões já compilados no módulo)
+        self._aggressive_rules = self._build_aggressive_rules()
+        self._anti_fn_rules = self._build_anti_fn_rules()
+        
+        # Validadores compartilhados; o dicionário é próprio da instância
+        self.validators = dict(_STOCK_VALIDATORS)
         
         # Inicializa modelo BERT se disponível e configurado
         self.bert_model = None
         self.bert_tokenizer = None
+        self._bert_autocast = False
+        self._bert_label_tables = None
+        
+        # Cache LRU de resultados por texto (chave inclui a configuração)
+        self._result_cache: "OrderedDict[Tuple[tuple, bytes], DetectionResult]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        
         if self.config.use_bert and TRANSFORMERS_AVAILABLE:
             self._initialize_bert()
         
-        logger.info(f"PIIGuardian inicializado no modo: {self.config.mode.value}")
+        logger.info("PIIGuardian inicializado no modo: %s", self.config.mode.value)
     
     def _get_config_for_mode(self, mode: DetectionMode) -> DetectionConfig:
         """Retorna configuração baseada no modo."""
@@ -240,7 +400,29 @@ class PIIGuardian:
             )
         else:  # BALANCED
             return DetectionConfig(mode=mode)
-    
+
+    def with_mode(self, mode: str) -> 'PIIGuardian':
+        """
+        Cria um detector em outro modo reaproveitando o modelo BERT já carregado.
+
+        Útil para servir vários modos (ex.: API) sem carregar uma cópia
+        do modelo por modo.
+
+        Args:
+            mode: Modo de operação ('strict', 'balanced', 'precise')
+        """
+        config = self._get_config_for_mode(DetectionMode(mode))
+
+        # Constrói sem BERT e compartilha o modelo desta instância
+        detector = PIIGuardian(config=replace(config, use_bert=False))
+        detector.config = config
+        detector.bert_model = self.bert_model
+        detector.bert_tokenizer = self.bert_tokenizer
+        detector._bert_autocast = self._bert_autocast
+        detector._bert_label_tables = self._bert_label_tables
+
+        return detector
+
     def _initialize_bert(self):
         """Inicializa modelo BERT para detecção contextual."""
         try:
@@ -253,8 +435,8 @@ class PIIGuardian:
             
             # Tenta carregar modelo de NER, senão usa o base
             try:
-                self.bert_model = AutoModelForTokenClassification.from_pretrained(
-                    "pucpr/clinicalnerpt-ner"
+                self.bert_model = self._optimize_bert_model(
+                    AutoModelForTokenClassification.from_pretrained("pucpr/clinicalnerpt-ner")
                 )
             except Exception:
                 # Fallback para modelo base (será usado apenas para embeddings)
@@ -264,14 +446,170 @@ class PIIGuardian:
             logger.info("Modelo BERT carregado com sucesso")
             
         except Exception as e:
-            logger.error(f"Erro ao carregar modelo BERT: {e}")
+            logger.error("Erro ao carregar modelo BERT: %s", e)
             self.bert_model = None
             self.bert_tokenizer = None
     
+    def _optimize_bert_model(self, model):
+        """
+        Prepara o modelo BERT para inferência.
+        
+        Coloca o modelo em modo de avaliação e, se o Intel Extension for
+        PyTorch estiver instalado, aplica ``ipex.fast_bert`` em BF16
+        (fusão de camadas e uso de AMX/AVX-512 BF16 em CPUs Xeon). Sem
+        IPEX, ``config.bert_quantized`` aplica quantização dinâmica INT8
+        nas camadas lineares (pesos 4x menores, com pequena perda de precisão).
+        """
+        model = model.eval()
+        
+        if IPEX_AVAILABLE:
+            try:
+                model = ipex.fast_bert(model, dtype=torch.bfloat16)
+                self._bert_autocast = True
+                logger.info("Modelo BERT otimizado com IPEX (BF16)")
+                return model
+            except Exception as e:
+                logger.warning("Falha ao otimizar BERT com IPEX, usando FP32: %s", e)
+        
+        if self.config.bert_quantized:
+            try:
+                model = torch.ao.quantization.quantize_dynamic(
+                    model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                logger.info("Modelo BERT quantizado (INT8 dinâmico)")
+            except Exception as e:
+                logger.warning("Falha ao quantizar BERT, usando FP32: %s", e)
+        
+        return model
+    
+    def _build_aggressive_rules(self) -> List[RegexRule]:
+        """Monta as regras agressivas da Fase 1 (CPF e telefone)."""
+        return [
+            RegexRule(
+                pattern=_CPF_AGGRESSIVE_RE,
+                entity_type='CPF',
+                confidence=0.7,
+                detection_method='regex_aggressive',
+                explanation='Padrão agressivo de CPF detectado',
+                min_digits=9,
+                max_digits=11
+            ),
+            RegexRule(
+                pattern=_PHONE_AGGRESSIVE_RE,
+                entity_type='TELEFONE',
+                confidence=0.75,
+                detection_method='regex_aggressive',
+                explanation='Padrão agressivo de telefone detectado',
+                min_digits=8,
+                max_digits=11
+            ),
+        ]
+    
+    def _build_anti_fn_rules(self) -> List[RegexRule]:
+        """Monta as regras anti-falsos-negativos da Fase 4."""
+        return [
+            # 1. Captura padrões como "meu número é 9XXXX-XXXX"
+            RegexRule(
+                pattern=_PHONE_CONTEXT_RE,
+                entity_type='TELEFONE_CONTEXTUAL',
+                confidence=0.88,
+                detection_method='anti_fn',
+                explanation='Contexto explícito de telefone detectado',
+                group=2,
+                min_digits=8
+            ),
+            # 2. Captura "meu CPF é XXX" mesmo sem números completos
+            RegexRule(
+                pattern=_CPF_CONTEXT_RE,
+                entity_type='CPF_CONTEXTUAL',
+                confidence=0.85,
+                detection_method='anti_fn',
+                explanation='Menção explícita de CPF no contexto',
+                group=2,
+                strip_value=True,
+                min_digits=9
+            ),
+            # 3. Captura nomes após palavras-chave
+            RegexRule(
+                pattern=_NAME_KEYWORDS_RE,
+                entity_type='NOME_PESSOA',
+                confidence=0.75,
+                detection_method='anti_fn',
+                explanation='Nome detectado após palavra-chave de tratamento',
+                group=2,
+                accept=self._is_probable_name
+            ),
+        ]
+    
+    def _is_probable_name(self, value: str) -> bool:
+        """Verifica se o valor capturado parece um nome de pessoa."""
+        # Verifica se contém sobrenome comum
+        words = value.lower().split()
+        has_common_name = not self.BRAZILIAN_NAMES.isdisjoint(words)
+        return has_common_name or len(words) >= 2
+    
+    def _scan_rules(
+        self,
+        text: str,
+        rules: List[RegexRule],
+        entities: List[Entity]
+    ) -> List[Entity]:
+        """
+        Aplica uma tabela de regras regex, adicionando as novas entidades.
+        
+        Cada regra descreve o tipo, a confiança e os filtros do seu padrão,
+        de forma que todos os padrões adicionais compartilham o mesmo laço.
+        """
+        # Valores já capturados, para deduplicação em O(1)
+        seen_values = {e.value for e in entities}
+        
+        # Nenhum valor tem mais dígitos que o texto inteiro: regras com
+        # min_digits acima do total são puladas sem rodar o regex
+        text_digits = None
+        
+        for rule in rules:
+            if rule.min_digits:
+                if text_digits is None:
+                    text_digits = _count_text_digits(text)
+                if text_digits < rule.min_digits:
+                    continue
+            
+            for match in rule.pattern.finditer(text):
+                value = match.group(rule.group)
+                if rule.strip_value:
+                    value = value.strip()
+                
+                if rule.min_digits or rule.max_digits is not None:
+                    digits = _count_digits(value)
+                    if digits < rule.min_digits:
+                        continue
+                    if rule.max_digits is not None and digits > rule.max_digits:
+                        continue
+                
+                # Verifica se já não foi capturado
+                if value in seen_values:
+                    continue
+                
+                if rule.accept and not rule.accept(value):
+                    continue
+                
+                seen_values.add(value)
+                entities.append(Entity(
+                    type=rule.entity_type,
+                    value=value,
+                    start=match.start(rule.group),
+                    end=match.end(rule.group),
+                    confidence=rule.confidence,
+                    detection_method=rule.detection_method,
+                    explanation=rule.explanation
+                ))
+        
+        return entities
+    
     def _add_extra_patterns(self, patterns: Dict[str, str]):
         """Adiciona padrões regex customizados."""
         # Implementação para padrões extras
-        logger.info(f"Adicionados {len(patterns)} padrões customizados")
+        logger.info("Adicionados %d padrões customizados", len(patterns))
     
     def detect(self, text: str) -> DetectionResult:
         """
@@ -283,53 +621,375 @@ class PIIGuardian:
         Returns:
             DetectionResult com todas as entidades detectadas
         """
-        start_time = datetime.now()
-        
         if not text or not text.strip():
-            return DetectionResult(
-                has_pii=False,
-                entities=[],
-                summary={'total_entities': 0, 'by_type': {}},
-                metadata={'processing_time_ms': 0, 'text_length': 0}
+            return self._empty_result()
+        return self.detect_batch([text])[0]
+    
+    def detect_and_transform(
+        self,
+        text: str,
+        transform: str = 'mask',
+        mask_char: str = '*'
+    ) -> Tuple[DetectionResult, str]:
+        """
+        Detecta dados pessoais e já devolve o texto mascarado ou anonimizado.
+        
+        A substituição usa diretamente as posições das entidades detectadas,
+        sem convertê-las para dicionários, e monta o texto numa única passada.
+        
+        Args:
+            text: Texto a ser analisado
+            transform: 'mask' (mascaramento) ou 'anonymize' (placeholders)
+            mask_char: Caractere para mascaramento
+            
+        Returns:
+            Tupla (DetectionResult, texto transformado)
+        """
+        if transform not in ('mask', 'anonymize'):
+            raise ValueError("transform deve ser 'mask' ou 'anonymize'")
+        
+        result = self.detect(text)
+        
+        if transform == 'mask':
+            spans = [(e.start, e.end, mask_value(e.value, mask_char)) for e in result.entities]
+        else:
+            spans = [(e.start, e.end, get_placeholder(e.base_type)) for e in result.entities]
+        
+        return result, replace_spans(text, spans)
+    
+    def detect_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 32
+    ) -> List[DetectionResult]:
+        """
+        Detecta dados pessoais em vários textos de uma só vez.
+        
+        A fase BERT é executada em lotes (um único forward por lote de
+        até ``batch_size`` textos); as demais fases rodam texto a texto.
+        
+        Args:
+            texts: Lista de textos a serem analisados
+            batch_size: Número máximo de textos por forward do BERT
+            
+        Returns:
+            Lista de DetectionResult na mesma ordem dos textos de entrada
+        """
+        results, pending, jobs = self._prepare_batch(texts, batch_size)
+        
+        for i, job in zip(pending, jobs):
+            results[i] = self._run_pipeline(*job)
+            self._store_cached_result(texts[i], results[i])
+        
+        return results
+    
+    def detect_many(
+        self,
+        texts: List[str],
+        workers: Optional[int] = None,
+        batch_size: int = 32,
+        chunksize: int = 32,
+        executor: Optional[Executor] = None
+    ) -> List[DetectionResult]:
+        """
+        Detecta dados pessoais em muitos textos usando vários processos.
+        
+        O BERT roda em lote no processo principal (como em detect_batch);
+        as fases de regex, fusão, validação e threshold, que são CPU-bound
+        em Python puro, são distribuídas em um ProcessPoolExecutor. Vale a
+        pena para lotes grandes; para poucos textos prefira detect_batch.
+        
+        Args:
+            texts: Lista de textos a serem analisados
+            workers: Número de processos (padrão: os.cpu_count())
+            batch_size: Número máximo de textos por forward do BERT
+            chunksize: Textos enviados a cada processo por vez
+            executor: Pool já criado com create_worker_pool (reutilizado
+                entre chamadas); se omitido, um pool é criado só para esta chamada
+            
+        Returns:
+            Lista de DetectionResult na mesma ordem dos textos de entrada
+        """
+        results, pending, jobs = self._prepare_batch(texts, batch_size)
+        if not jobs:
+            return results
+        
+        # Configuração atual enviada com os textos: alterações feitas depois
+        # da criação do pool (ex.: em config.thresholds) valem nos processos
+        worker_config = replace(self.config, use_bert=False, result_cache_size=0)
+        jobs = [(worker_config, *job) for job in jobs]
+        
+        if executor is None:
+            with PIIGuardian.create_worker_pool([self], workers) as own_executor:
+                worker_results = list(
+                    own_executor.map(_run_pipeline_in_worker, jobs, chunksize=chunksize)
+                )
+        else:
+            worker_results = executor.map(_run_pipeline_in_worker, jobs, chunksize=chunksize)
+        
+        # Os processos não têm BERT; o resultado reflete o detector principal
+        bert_enabled = self.bert_model is not None
+        for i, result in zip(pending, worker_results):
+            result.metadata['bert_enabled'] = bert_enabled
+            results[i] = result
+            self._store_cached_result(texts[i], result)
+        
+        return results
+    
+    @staticmethod
+    def create_worker_pool(
+        detectors: Iterable['PIIGuardian'],
+        workers: Optional[int] = None
+    ) -> ProcessPoolExecutor:
+        """
+        Cria um pool de processos para detect_many, reutilizável entre chamadas.
+        
+        Cada processo constrói, uma única vez, um detector sem BERT para o
+        modo de cada detector informado (ex.: um pool compartilhado pelos
+        modos servidos pela API). A configuração vigente é enviada com cada
+        lote em detect_many; validadores substituídos em ``validators`` e
+        padrões extras não chegam aos processos.
+        
+        Args:
+            detectors: Detectores que usarão o pool (um por modo)
+            workers: Número de processos (padrão: os.cpu_count())
+        """
+        # Os processos não carregam o BERT nem mantêm cache próprio
+        worker_configs = [
+            replace(detector.config, use_bert=False, result_cache_size=0)
+            for detector in detectors
+        ]
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker_detectors,
+            initargs=(worker_configs,)
+        )
+    
+    def _prepare_batch(
+        self,
+        texts: List[str],
+        batch_size: int
+    ) -> Tuple[List[Optional[DetectionResult]], List[int], List[_PipelineJob]]:
+        """
+        Resolve textos vazios e em cache e executa a fase BERT em lote.
+        
+        Returns:
+            Tupla (resultados parciais, índices pendentes, argumentos de
+            _run_pipeline para cada índice pendente)
+        """
+        results: List[Optional[DetectionResult]] = [None] * len(texts)
+        pending: List[int] = []
+        
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                results[i] = self._empty_result()
+                continue
+            
+            cached = self._get_cached_result(text)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append(i)
+        
+        # FASE 2 (em lote): BERT para contexto (se disponível)
+        bert_matches: Dict[int, List[Entity]] = {}
+        bert_time_ms = 0.0
+        if pending and self.config.use_bert and self.bert_model:
+            # Textos sem nenhum indício de PII não passam pelo BERT
+            if self.config.bert_prescreen:
+                bert_pending = [i for i in pending if _BERT_PRESCREEN_RE.search(texts[i])]
+            else:
+                bert_pending = pending
+        else:
+            bert_pending = []
+        
+        if bert_pending:
+            start_ns = perf_counter_ns()
+            batch_matches = self._bert_contextual_detection_batch(
+                [texts[i] for i in bert_pending],
+                batch_size=batch_size
             )
+            bert_matches = dict(zip(bert_pending, batch_matches))
+            # O tempo do lote é dividido igualmente entre os textos do lote
+            bert_time_ms = (perf_counter_ns() - start_ns) / 1e6 / len(bert_pending)
+        
+        # Pré-filtro dos padrões contextuais calculado de uma vez para o lote
+        if self.config.use_contextual:
+            contextual_candidates = self.contextual.candidates_many([texts[i] for i in pending])
+        else:
+            contextual_candidates = [None] * len(pending)
+        
+        jobs = [
+            (
+                texts[i],
+                bert_matches.get(i, []),
+                bert_time_ms if i in bert_matches else 0.0,
+                candidates
+            )
+            for i, candidates in zip(pending, contextual_candidates)
+        ]
+        return results, pending, jobs
+    
+    @staticmethod
+    def _empty_result() -> DetectionResult:
+        """
+        Resultado para texto vazio, sem medir tempo.
+        
+        Um objeto novo é criado a cada chamada porque o chamador pode
+        alterar as listas e dicionários do resultado.
+        """
+        return DetectionResult(
+            has_pii=False,
+            entities=[],
+            summary={'total_entities': 0, 'by_type': {}},
+            metadata={'processing_time_ms': 0, 'text_length': 0}
+        )
+    
+    def config_fingerprint(self) -> tuple:
+        """
+        Identifica a configuração que afeta o resultado de uma detecção.
+        
+        Lida a cada chamada: alterar modo, thresholds ou fases do pipeline
+        depois de criar o detector muda o valor devolvido.
+        """
+        config = self.config
+        return (
+            config.mode.value,
+            config.use_contextual,
+            config.validate_documents,
+            config.bert_prescreen,
+            self.bert_model is not None,
+            tuple(sorted(config.thresholds.items())),
+        )
+    
+    def _cache_key(self, text: str) -> Tuple[tuple, bytes]:
+        """
+        Chave do cache: configuração em uso e digest de 16 bytes do texto.
+        
+        O cache guarda só o digest, não o documento inteiro, então o uso de
+        memória das chaves não depende do tamanho dos textos. Com a
+        configuração na chave, alterá-la depois de uma detecção não
+        reaproveita resultados calculados com a configuração anterior.
+        """
+        digest = hashlib.blake2b(
+            text.encode('utf-8', 'surrogatepass'), digest_size=16
+        ).digest()
+        return (self.config_fingerprint(), digest)
+    
+    def _get_cached_result(self, text: str) -> Optional[DetectionResult]:
+        """
+        Busca um resultado já calculado para o texto no cache LRU.
+        
+        Retorna uma cópia (entidades e dicionários novos) para que o
+        chamador possa alterá-la sem afetar o cache.
+        """
+        if self.config.result_cache_size <= 0:
+            return None
+        
+        start_ns = perf_counter_ns()
+        key = self._cache_key(text)
+        
+        with self._result_cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is None:
+                return None
+            self._result_cache.move_to_end(key)
+        
+        lookup_time = (perf_counter_ns() - start_ns) / 1e6
+        return self._copy_result(cached, round(lookup_time, 2))
+    
+    def _store_cached_result(self, text: str, result: DetectionResult):
+        """Guarda uma cópia do resultado no cache LRU, descartando o mais antigo."""
+        if self.config.result_cache_size <= 0:
+            return
+        
+        key = self._cache_key(text)
+        snapshot = self._copy_result(result, result.metadata['processing_time_ms'])
+        
+        with self._result_cache_lock:
+            self._result_cache[key] = snapshot
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.config.result_cache_size:
+                self._result_cache.popitem(last=False)
+    
+    def clear_cache(self):
+        """Remove todos os resultados mantidos em cache."""
+        with self._result_cache_lock:
+            self._result_cache.clear()
+    
+    @staticmethod
+    def _copy_result(result: DetectionResult, processing_time_ms: float) -> DetectionResult:
+        """Copia um resultado, substituindo o tempo de processamento."""
+        metadata = dict(result.metadata)
+        metadata['processing_time_ms'] = processing_time_ms
+        
+        return DetectionResult(
+            has_pii=result.has_pii,
+            entities=[replace(e) for e in result.entities],
+            summary={
+                'total_entities': result.summary['total_entities'],
+                'by_type': dict(result.summary['by_type'])
+            },
+            metadata=metadata
+        )
+    
+    def _run_pipeline(
+        self,
+        text: str,
+        bert_matches: List[Entity],
+        bert_time_ms: float = 0.0,
+        contextual_candidates: Optional[Set[Pattern]] = None
+    ) -> DetectionResult:
+        """
+        Executa as fases de detecção de um texto já com o resultado do BERT.
+        
+        Args:
+            text: Texto a ser analisado (não vazio)
+            bert_matches: Entidades detectadas pelo BERT para este texto
+            bert_time_ms: Parcela do tempo do lote BERT atribuída ao texto
+            contextual_candidates: Pré-filtro dos padrões contextuais já
+                calculado para o lote (opcional)
+            
+        Returns:
+            DetectionResult com todas as entidades detectadas
+        """
+        start_ns = perf_counter_ns()
         
         # FASE 1: Regex ULTRA sensível
         regex_matches = self._regex_detection_aggressive(text)
-        logger.debug(f"Fase 1 (Regex): {len(regex_matches)} matches")
+        logger.debug("Fase 1 (Regex): %d matches", len(regex_matches))
         
-        # FASE 2: BERT para contexto (se disponível)
-        bert_matches = []
+        # FASE 2: BERT para contexto (executado em lote por detect_batch)
         if self.config.use_bert and self.bert_model:
-            bert_matches = self._bert_contextual_detection(text)
-            logger.debug(f"Fase 2 (BERT): {len(bert_matches)} matches")
+            logger.debug("Fase 2 (BERT): %d matches", len(bert_matches))
         
         # FASE 3: Fusão INTELIGENTE (prioriza recall)
         merged = self._merge_detections(regex_matches, bert_matches)
-        logger.debug(f"Fase 3 (Fusão): {len(merged)} matches")
+        logger.debug("Fase 3 (Fusão): %d matches", len(merged))
         
         # FASE 4: Pós-processamento ANTI falsos negativos
         if self.config.use_contextual:
-            merged = self._anti_false_negative_filter(merged, text)
-            logger.debug(f"Fase 4 (Anti-FN): {len(merged)} matches")
+            merged = self._anti_false_negative_filter(merged, text, contextual_candidates)
+            logger.debug("Fase 4 (Anti-FN): %d matches", len(merged))
         
         # FASE 5: Validação de consistência
         if self.config.validate_documents:
             validated = self._validate_consistency(merged)
         else:
             validated = merged
-        logger.debug(f"Fase 5 (Validação): {len(validated)} matches")
+        logger.debug("Fase 5 (Validação): %d matches", len(validated))
         
         # FASE 6: Filtragem por threshold
         filtered = self._apply_thresholds(validated)
-        logger.debug(f"Fase 6 (Threshold): {len(filtered)} matches")
+        logger.debug("Fase 6 (Threshold): %d matches", len(filtered))
         
         # Gera resultado final
-        processing_time = (datetime.now() - start_time).total_seconds() * 1000
+        processing_time = (perf_counter_ns() - start_ns) / 1e6 + bert_time_ms
         
         # Cria sumário
         by_type: Dict[str, int] = {}
         for entity in filtered:
-            entity_type = entity.type.replace('_CONTEXTUAL', '')
+            entity_type = entity.base_type
             by_type[entity_type] = by_type.get(entity_type, 0) + 1
         
         result = DetectionResult(
@@ -348,7 +1008,7 @@ class PIIGuardian:
         )
         
         logger.info(
-            f"Detecção concluída: {len(filtered)} entidades em {processing_time:.2f}ms"
+            "Detecção concluída: %d entidades em %.2fms", len(filtered), processing_time
         )
         
         return result
@@ -377,40 +1037,8 @@ class PIIGuardian:
             )
             entities.append(entity)
         
-        # Padrões adicionais agressivos para CPF
-        cpf_aggressive = r'\b(?:\d{3}[\.\-\s]?){2}\d{3}[\.\-\s]?\d{2}?\b'
-        for match in re.finditer(cpf_aggressive, text):
-            value = match.group()
-            # Verifica se já não foi capturado
-            if not any(e.value == value for e in entities):
-                digits = sum(c.isdigit() for c in value)
-                if 9 <= digits <= 11:
-                    entities.append(Entity(
-                        type='CPF',
-                        value=value,
-                        start=match.start(),
-                        end=match.end(),
-                        confidence=0.7,
-                        detection_method='regex_aggressive',
-                        explanation='Padrão agressivo de CPF detectado'
-                    ))
-        
-        # Padrões adicionais agressivos para telefone
-        phone_aggressive = r'\b(?:\d{4,5}[-\s]?\d{4}|\d{2}[\)]\s?\d{4,5}[-\s]?\d{4})\b'
-        for match in re.finditer(phone_aggressive, text):
-            value = match.group()
-            if not any(e.value == value for e in entities):
-                digits = sum(c.isdigit() for c in value)
-                if 8 <= digits <= 11:
-                    entities.append(Entity(
-                        type='TELEFONE',
-                        value=value,
-                        start=match.start(),
-                        end=match.end(),
-                        confidence=0.75,
-                        detection_method='regex_aggressive',
-                        explanation='Padrão agressivo de telefone detectado'
-                    ))
+        # Padrões adicionais agressivos (CPF e telefone)
+        self._scan_rules(text, self._aggressive_rules, entities)
         
         return entities
     
@@ -421,88 +1049,185 @@ class PIIGuardian:
         Utiliza modelo de linguagem para detectar entidades
         nomeadas em contexto semântico.
         """
+        return self._bert_contextual_detection_batch([text])[0]
+    
+    def _bert_contextual_detection_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 32
+    ) -> List[List[Entity]]:
+        """
+        Detecção contextual com BERT para vários textos.
+        
+        Os textos são tokenizados uma vez, sem padding, e agrupados em
+        faixas de comprimento (``BERT_LENGTH_BUCKETS``). Cada lote é
+        formado dentro de uma faixa e preenchido só até o maior texto do
+        lote, evitando que um texto longo force padding em todos os outros.
+        
+        Returns:
+            Lista de entidades BERT por texto, na ordem de entrada
+        """
         if not self.bert_model or not self.bert_tokenizer:
-            return []
+            return [[] for _ in texts]
         
-        entities = []
+        all_entities: List[List[Entity]] = [[] for _ in texts]
         
         try:
-            # Tokeniza o texto
-            inputs = self.bert_tokenizer(
-                text,
-                return_tensors="pt",
+            encodings = self.bert_tokenizer(
+                texts,
                 truncation=True,
                 max_length=512,
                 return_offsets_mapping=True
             )
-            
-            # Executa inferência
-            with torch.no_grad():
-                outputs = self.bert_model(**{
-                    k: v for k, v in inputs.items() 
-                    if k != 'offset_mapping'
-                })
-            
-            # Processa predições
-            predictions = torch.argmax(outputs.logits, dim=2)[0].tolist()
-            offset_mapping = inputs['offset_mapping'][0].tolist()
-            
-            # Mapeia predições para entidades
-            current_entity = None
-            current_start = None
-            current_type = None
-            
-            for i, (pred, offset) in enumerate(zip(predictions, offset_mapping)):
-                if pred != 0 and offset[0] != offset[1]:  # É uma entidade
-                    label = self.bert_model.config.id2label.get(pred, 'O')
+        except Exception as e:
+            logger.error("Erro na detecção BERT: %s", e)
+            return all_entities
+        
+        # Offsets ficam fora do forward (o modelo não os aceita)
+        offset_mappings = encodings.pop('offset_mapping')
+        model_keys = list(encodings.keys())
+        
+        # Agrupa os índices por faixa de comprimento, preservando a ordem
+        buckets: Dict[int, List[int]] = {}
+        for i, ids in enumerate(encodings['input_ids']):
+            bucket = bisect_left(BERT_LENGTH_BUCKETS, len(ids))
+            buckets.setdefault(bucket, []).append(i)
+        
+        for indices in buckets.values():
+            for begin in range(0, len(indices), batch_size):
+                chunk = indices[begin:begin + batch_size]
+                
+                try:
+                    # Padding até o maior texto do lote (nunca além da faixa)
+                    inputs = self.bert_tokenizer.pad(
+                        {key: [encodings[key][i] for i in chunk] for key in model_keys},
+                        padding=True,
+                        return_tensors="pt"
+                    )
                     
-                    # Determina tipo de entidade
-                    if 'PER' in label or 'PERSON' in label:
-                        entity_type = 'NOME_PESSOA'
-                    elif 'LOC' in label or 'GPE' in label:
-                        entity_type = 'ENDERECO'
-                    elif 'ORG' in label:
-                        entity_type = 'ORGANIZACAO'
-                    else:
-                        continue
+                    # Executa inferência (BF16 apenas quando otimizado com IPEX)
+                    with torch.inference_mode(), torch.autocast(
+                        'cpu', dtype=torch.bfloat16, enabled=self._bert_autocast
+                    ):
+                        outputs = self.bert_model(**inputs)
+                    
+                    # Processa predições, ignorando os tokens de padding
+                    predictions = torch.argmax(outputs.logits, dim=2)
+                    label_types, label_begins = self._get_bert_label_tables(
+                        outputs.logits.shape[-1]
+                    )
                     
-                    # Inicia ou continua entidade
-                    if label.startswith('B-') or current_type != entity_type:
-                        # Salva entidade anterior
-                        if current_entity and current_start is not None:
-                            entities.append(Entity(
-                                type=current_type,
-                                value=current_entity,
-                                start=current_start,
-                                end=offset[0],
-                                confidence=0.75,
-                                detection_method='bert',
-                                explanation='Entidade detectada por análise contextual BERT'
-                            ))
-                        
-                        current_entity = text[offset[0]:offset[1]]
-                        current_start = offset[0]
-                        current_type = entity_type
-                    else:
-                        current_entity += text[offset[0]:offset[1]]
-                else:
-                    # Finaliza entidade atual
-                    if current_entity and current_start is not None:
-                        entities.append(Entity(
-                            type=current_type,
-                            value=current_entity.strip(),
-                            start=current_start,
-                            end=offset[0],
-                            confidence=0.75,
-                            detection_method='bert',
-                            explanation='Entidade detectada por análise contextual BERT'
-                        ))
-                        current_entity = None
-                        current_start = None
-                        current_type = None
+                    for row, i in enumerate(chunk):
+                        offsets = offset_mappings[i]
+                        all_entities[i] = self._decode_bert_predictions(
+                            texts[i],
+                            predictions[row, :len(offsets)],
+                            torch.tensor(offsets, dtype=torch.long).reshape(-1, 2),
+                            label_types,
+                            label_begins
+                        )
+                    
+                except Exception as e:
+                    logger.error("Erro na detecção BERT: %s", e)
+        
+        return all_entities
+    
+    def _get_bert_label_tables(self, num_labels: int):
+        """
+        Retorna as tabelas de consulta label_id -> tipo e label_id -> início (B-).
+        
+        O código de tipo é um índice em ``BERT_ENTITY_TYPES`` (0 = label
+        ignorado). As tabelas são recalculadas apenas se o modelo mudar.
+        """
+        cache_key = (id(self.bert_model), num_labels)
+        if self._bert_label_tables is not None and self._bert_label_tables[0] == cache_key:
+            return self._bert_label_tables[1]
+        
+        id2label = self.bert_model.config.id2label
+        types = []
+        begins = []
+        for label_id in range(num_labels):
+            label = id2label.get(label_id, 'O')
             
-        except Exception as e:
-            logger.error(f"Erro na detecção BERT: {e}")
+            # Determina tipo de entidade
+            if 'PER' in label or 'PERSON' in label:
+                types.append(1)
+            elif 'LOC' in label or 'GPE' in label:
+                types.append(2)
+            elif 'ORG' in label:
+                types.append(3)
+            else:
+                types.append(0)
+            begins.append(label.startswith('B-'))
+        
+        tables = (torch.tensor(types, dtype=torch.long), torch.tensor(begins, dtype=torch.bool))
+        self._bert_label_tables = (cache_key, tables)
+        return tables
+    
+    def _decode_bert_predictions(
+        self,
+        text: str,
+        predictions: "torch.Tensor",
+        offset_mapping: "torch.Tensor",
+        label_types: "torch.Tensor",
+        label_begins: "torch.Tensor"
+    ) -> List[Entity]:
+        """
+        Mapeia as predições por token de um texto para entidades.
+        
+        A classificação dos tokens e a detecção de fronteiras são feitas
+        com operações vetorizadas; o laço Python percorre apenas as
+        entidades encontradas, não todos os tokens.
+        """
+        entities = []
+        
+        types = label_types[predictions]
+        non_empty = offset_mapping[:, 0] != offset_mapping[:, 1]
+        is_entity = (predictions != 0) & non_empty & (types > 0)
+        # Tokens fora de entidade finalizam a entidade atual; tokens com
+        # label de tipo desconhecido são simplesmente ignorados
+        is_break = (predictions == 0) | ~non_empty
+        
+        kept = (is_entity | is_break).nonzero().flatten()
+        if kept.numel() == 0:
+            return entities
+        
+        entity = is_entity[kept]
+        kept_types = types[kept]
+        prev_entity = torch.cat([entity.new_zeros(1), entity[:-1]])
+        prev_types = torch.cat([kept_types.new_zeros(1), kept_types[:-1]])
+        
+        # Inicia entidade em B-, após um token de quebra ou na troca de tipo
+        starts = entity & (
+            label_begins[predictions[kept]] | ~prev_entity | (kept_types != prev_types)
+        )
+        # Uma entidade termina no próximo início ou token de quebra
+        terminators = starts | ~entity
+        
+        start_positions = starts.nonzero().flatten().tolist()
+        terminator_positions = terminators.nonzero().flatten().tolist()
+        kept_offsets = offset_mapping[kept].tolist()
+        kept_types_list = kept_types.tolist()
+        
+        for pos in start_positions:
+            # Próximo terminador após o início (entidades sem fim são descartadas)
+            t = bisect_right(terminator_positions, pos)
+            if t == len(terminator_positions):
+                continue
+            # Span do primeiro ao último token da entidade; o texto é
+            # fatiado uma única vez
+            start = kept_offsets[pos][0]
+            end = kept_offsets[terminator_positions[t] - 1][1]
+            
+            entities.append(Entity(
+                type=BERT_ENTITY_TYPES[kept_types_list[pos]],
+                value=text[start:end],
+                start=start,
+                end=end,
+                confidence=0.75,
+                detection_method='bert',
+                explanation='Entidade detectada por análise contextual BERT'
+            ))
         
         return entities
     
@@ -542,7 +1267,8 @@ class PIIGuardian:
     def _anti_false_negative_filter(
         self,
         entities: List[Entity],
-        text: str
+        text: str,
+        contextual_candidates: Optional[Set[Pattern]] = None
     ) -> List[Entity]:
         """
         Filtro especial: captura o que os outros métodos perderiam.
@@ -551,17 +1277,18 @@ class PIIGuardian:
         são mencionados explicitamente no texto.
         """
         # Busca padrões contextuais
-        contextual_matches = self.contextual.find_contextual(text)
+        contextual_matches = self.contextual.find_contextual(text, contextual_candidates)
+        seen_values = {e.value for e in entities}
         
         for match in contextual_matches:
             # Verifica se já não foi capturado
             value = match['value']
-            is_duplicate = any(
-                e.value == value or self._has_overlap_dict(match, e)
-                for e in entities
+            is_duplicate = value in seen_values or any(
+                self._has_overlap_dict(match, e) for e in entities
             )
             
             if not is_duplicate and value.strip():
+                seen_values.add(value)
                 entities.append(Entity(
                     type=match['type'],
                     value=value,
@@ -573,57 +1300,7 @@ class PIIGuardian:
                 ))
         
         # Padrões específicos anti-falsos-negativos
-        
-        # 1. Captura padrões como "meu número é 9XXXX-XXXX"
-        number_pattern = r'\b(número|telefone|celular|fone|contato)[\s:]+(\d{4,5}[-\s]?\d{4})\b'
-        for match in re.finditer(number_pattern, text, re.IGNORECASE):
-            value = match.group(2)
-            if not any(e.value == value for e in entities):
-                entities.append(Entity(
-                    type='TELEFONE_CONTEXTUAL',
-                    value=value,
-                    start=match.start(2),
-                    end=match.end(2),
-                    confidence=0.88,
-                    detection_method='anti_fn',
-                    explanation='Contexto explícito de telefone detectado'
-                ))
-        
-        # 2. Captura "meu CPF é XXX" mesmo sem números completos
-        cpf_context = r'\b(CPF|c\.p\.f\.?|cadastro)[\s:]+([0-9\.\-\s]{8,18})\b'
-        for match in re.finditer(cpf_context, text, re.IGNORECASE):
-            value = match.group(2).strip()
-            digits = sum(c.isdigit() for c in value)
-            if digits >= 9 and not any(e.value == value for e in entities):
-                entities.append(Entity(
-                    type='CPF_CONTEXTUAL',
-                    value=value,
-                    start=match.start(2),
-                    end=match.end(2),
-                    confidence=0.85,
-                    detection_method='anti_fn',
-                    explanation='Menção explícita de CPF no contexto'
-                ))
-        
-        # 3. Captura nomes após palavras-chave
-        name_keywords = r'\b(sr\.?|sra\.?|senhor[a]?|doutor[a]?|dr\.?|dra\.?)\s+([A-Z][a-záàâãéèêíïóôõöúçñ]+(?:\s+[A-Z][a-záàâãéèêíïóôõöúçñ]+){1,4})\b'
-        for match in re.finditer(name_keywords, text):
-            value = match.group(2)
-            if not any(e.value == value for e in entities):
-                # Verifica se contém sobrenome comum
-                words = value.lower().split()
-                has_common_name = any(w in self.BRAZILIAN_NAMES for w in words)
-                
-                if has_common_name or len(words) >= 2:
-                    entities.append(Entity(
-                        type='NOME_PESSOA',
-                        value=value,
-                        start=match.start(2),
-                        end=match.end(2),
-                        confidence=0.75,
-                        detection_method='anti_fn',
-                        explanation='Nome detectado após palavra-chave de tratamento'
-                    ))
+        self._scan_rules(text, self._anti_fn_rules, entities)
         
         return entities
     
@@ -635,60 +1312,74 @@ class PIIGuardian:
         atualizando a confiança baseada na validação.
         """
         validated_entities = []
+        validators = self.validators
+        is_strict = self.config.mode == DetectionMode.STRICT
+        
+        # Valida numa única chamada os candidatos cujo validador é o padrão;
+        # validadores substituídos na instância são chamados um a um
+        batched = [
+            entity.base_type in validators
+            and validators[entity.base_type] is _STOCK_VALIDATORS.get(entity.base_type)
+            for entity in entities
+        ]
+        batch_results = iter(validate_all([
+            (entity.base_type, entity.value)
+            for entity, in_batch in zip(entities, batched)
+            if in_batch
+        ]))
         
-        for entity in entities:
-            # Determina tipo base (remove sufixo _CONTEXTUAL)
-            base_type = entity.type.replace('_CONTEXTUAL', '')
+        for entity, in_batch in zip(entities, batched):
+            # Tipo base (sem sufixo _CONTEXTUAL)
+            base_type = entity.base_type
             
-            # Obtém validador apropriado
-            validator = self.validators.get(base_type)
+            if base_type not in validators:
+                # Sem validador específico (nomes, endereços...), mantém a entidade
+                entity.validation_status = 'not_applicable'
+                validated_entities.append(entity)
+                continue
             
-            if validator:
-                result = validator.validate(entity.value)
-                
-                entity.validation_status = 'valid' if result.is_valid else 'invalid'
-                entity.validation_message = result.message
-                
-                if result.is_valid:
-                    # Aumenta confiança se validação matemática passou
-                    entity.confidence = max(entity.confidence, result.confidence)
-                    entity.explanation += f" | Validação: {result.message}"
-                    validated_entities.append(entity)
-                elif base_type in ['CPF', 'CNPJ']:
-                    # Para CPF/CNPJ inválido, reduz confiança mas mantém se modo strict
-                    if self.config.mode == DetectionMode.STRICT:
-                        entity.confidence *= 0.5
-                        entity.explanation += f" | AVISO: {result.message}"
-                        validated_entities.append(entity)
-                    # Em outros modos, descarta CPF/CNPJ inválido
-                else:
-                    # Para outros tipos, mantém mesmo sem validação perfeita
+            if in_batch:
+                result = next(batch_results)
+            else:
+                result = validators[base_type].validate(entity.value)
+            
+            entity.validation_status = 'valid' if result.is_valid else 'invalid'
+            entity.validation_message = result.message
+            
+            if result.is_valid:
+                # Aumenta confiança se validação matemática passou
+                entity.confidence = max(entity.confidence, result.confidence)
+                entity.explanation += f" | Validação: {result.message}"
+                validated_entities.append(entity)
+            elif base_type in ('CPF', 'CNPJ'):
+                # Para CPF/CNPJ inválido, reduz confiança mas mantém se modo strict
+                if is_strict:
+                    entity.confidence *= 0.5
+                    entity.explanation += f" | AVISO: {result.message}"
                     validated_entities.append(entity)
+                # Em outros modos, descarta CPF/CNPJ inválido
             else:
-                # Sem validador específico, mantém a entidade
-                entity.validation_status = 'not_applicable'
+                # Para outros tipos, mantém mesmo sem validação perfeita
                 validated_entities.append(entity)
         
         return validated_entities
     
     def _apply_thresholds(self, entities: List[Entity]) -> List[Entity]:
         """Aplica thresholds de confiança por tipo."""
-        filtered = []
+        # Lido do dicionário do config a cada chamada: alterações em
+        # config.thresholds valem na próxima detecção
+        thresholds = self.config.thresholds
+        default = thresholds.get('DEFAULT', 0.5)
+        filtered = [e for e in entities if e.confidence >= thresholds.get(e.base_type, default)]
         
-        for entity in entities:
-            base_type = entity.type.replace('_CONTEXTUAL', '')
-            threshold = self.config.thresholds.get(
-                base_type,
-                self.config.thresholds.get('DEFAULT', 0.5)
-            )
-            
-            if entity.confidence >= threshold:
-                filtered.append(entity)
-            else:
-                logger.debug(
-                    f"Entidade descartada por threshold: {entity.type} "
-                    f"(conf: {entity.confidence:.2f} < {threshold})"
-                )
+        if len(filtered) < len(entities) and logger.isEnabledFor(logging.DEBUG):
+            for entity in entities:
+                threshold = thresholds.get(entity.base_type, default)
+                if entity.confidence < threshold:
+                    logger.debug(
+                        "Entidade descartada por threshold: %s (conf: %.2f < %s)",
+                        entity.type, entity.confidence, threshold
+                    )
         
         return filtered
     
@@ -732,6 +1423,30 @@ class PIIGuardian:
         return "\n".join(lines)
 
 
+# Detectores de cada processo de PIIGuardian.detect_many, por modo
+# (criados no initializer do pool)
+_WORKER_DETECTORS: Dict[DetectionMode, PIIGuardian] = {}
+
+
+def _init_worker_detectors(configs: List[DetectionConfig]):
+    """Cria os detectores do processo (sem BERT) uma única vez."""
+    for config in configs:
+        _WORKER_DETECTORS[config.mode] = PIIGuardian(config=config)
+
+
+def _run_pipeline_in_worker(
+    job: Tuple[DetectionConfig, str, List[Entity], float, Optional[Set[Pattern]]]
+) -> DetectionResult:
+    """Executa as fases não-BERT de um texto no processo atual."""
+    config, *args = job
+    detector = _WORKER_DETECTORS.get(config.mode)
+    if detector is None:
+        # Modo que não existia quando o pool foi criado
+        detector = _WORKER_DETECTORS[config.mode] = PIIGuardian(config=config)
+    detector.config = config
+    return detector._run_pipeline(*args)
+
+
 # Função de conveniência para uso direto
 def detect_pii(text: str, mode: str = 'balanced') -> Dict[str, Any]:
     """
@@ -11,11 +11,35 @@ Classes:
     - ContextualPatterns: Padrões que consideram contexto semântico
 """
 
+import hashlib
+import json
+import logging
+import os
 import re
-from typing import Dict, List, Pattern, Tuple
+import threading
+from bisect import bisect_right
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Pattern, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+# Flag para verificar se Hyperscan está disponível (opcional)
+HYPERSCAN_AVAILABLE = False
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    pass
+
+# Flag para verificar se RE2 (google-re2) está disponível (opcional)
+RE2_AVAILABLE = False
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    pass
+
 
 class PIIType(Enum):
     """Tipos de dados pessoais identificáveis."""
@@ -49,6 +73,374 @@ class PatternConfig:
     flags: int = re.IGNORECASE
 
 
+# Caracteres não-ASCII que o ``re`` (IGNORECASE) casa com letras ASCII
+_IGNORECASE_ASCII_FOLDS = {'\u0130': 'i', '\u0131': 'i', '\u017f': 's', '\u212a': 'k'}
+
+
+class _PrefilterCharMap(dict):
+    """
+    Tabela de str.translate que leva cada caractere a um representante
+    ASCII da mesma classe do ``re`` (dígito, letra, espaço ou símbolo).
+    
+    Todo padrão que casa no texto original casa no texto traduzido, o que
+    permite varrê-lo em bytes com o Hyperscan sem perder matches.
+    """
+    
+    def __missing__(self, code: int) -> str:
+        char = chr(code)
+        if char.isdecimal():
+            value = '0'  # \d (categoria Nd)
+        elif char.isspace():
+            value = ' '  # \s
+        elif char.isalnum():
+            value = _IGNORECASE_ASCII_FOLDS.get(char, 'a')  # \w
+        else:
+            value = '#'
+        self[code] = value
+        return value
+
+
+# ASCII fica como está (exceto espaços); o restante é resolvido sob demanda
+_PREFILTER_CHAR_MAP = _PrefilterCharMap(
+    (c, ' ' if chr(c).isspace() else chr(c)) for c in range(128)
+)
+
+# Texto ASCII: só os espaços (\s do re inclui \x1c-\x1f) precisam ser trocados
+_PREFILTER_ASCII_SPACES = bytes(
+    0x20 if chr(c).isspace() else c for c in range(256)
+)
+
+
+# Escapes de classe negada (\S, \D, \W)
+_NEGATED_CLASS_ESCAPES = ('S', 'D', 'W')
+
+
+def _has_negation(pattern: str) -> bool:
+    """
+    Indica se o padrão casa "qualquer caractere exceto ...": classe negada
+    ([^...], \\S, \\D, \\W) ou lookaround negativo.
+    
+    Os pré-filtros trocam caracteres por representantes ASCII (Hyperscan)
+    ou reescrevem as classes (RE2); numa negação, um caractere que casava
+    no texto original pode deixar de casar, e o match seria perdido. Esses
+    padrões ficam fora do pré-filtro e são sempre executados.
+    """
+    in_class = False
+    i, size = 0, len(pattern)
+    while i < size:
+        char = pattern[i]
+        if char == '\\':
+            if pattern[i + 1:i + 2] in _NEGATED_CLASS_ESCAPES:
+                return True
+            i += 2
+            continue
+        if in_class:
+            if char == ']':
+                in_class = False
+        elif char == '[':
+            in_class = True
+            if pattern.startswith('^', i + 1):
+                return True
+        elif pattern.startswith(('(?!', '(?<!'), i):
+            return True
+        i += 1
+    return False
+
+
+logger = logging.getLogger(__name__)
+
+# Diretório do cache em disco dos bancos Hyperscan já compilados
+HYPERSCAN_CACHE_DIR = Path(
+    os.environ.get('PIIGUARDIAN_CACHE_DIR', Path.home() / '.cache' / 'piiguardian')
+)
+
+
+class _HyperscanPrefilter:
+    """
+    Pré-filtro multi-padrão com Hyperscan.
+    
+    Os padrões são compilados num único banco em modo PREFILTER, que nunca
+    perde um match do ``re`` (pode acusar falsos positivos). Uma varredura
+    do texto indica quais padrões podem casar; só esses passam pelo
+    ``finditer``, que continua sendo quem define os matches.
+    """
+    
+    # Flags do re com equivalente direto no Hyperscan
+    _FLAG_MAP = {
+        re.IGNORECASE: 'HS_FLAG_CASELESS',
+        re.MULTILINE: 'HS_FLAG_MULTILINE',
+        re.DOTALL: 'HS_FLAG_DOTALL',
+    }
+    
+    def __init__(self, patterns: List[Pattern]):
+        self.patterns = patterns
+        
+        # A compilação leva centenas de ms; o banco fica em cache no disco
+        cache_path = HYPERSCAN_CACHE_DIR / f'prefilter_{self._cache_key(patterns)}.hs'
+        if not self._load(cache_path):
+            self._compile()
+            self._save(cache_path)
+        
+        # Scratch do Hyperscan não pode ser usado por duas threads ao mesmo tempo
+        self._local = threading.local()
+    
+    @staticmethod
+    def _cache_key(patterns: List[Pattern]) -> str:
+        """Hash dos padrões, flags e versão do Hyperscan (nome do arquivo de cache)."""
+        content = json.dumps([hyperscan.__version__] + [(p.pattern, p.flags) for p in patterns])
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()
+    
+    def _compile(self):
+        """Compila os padrões aceitos pelo Hyperscan num único banco."""
+        # Padrões que o Hyperscan não aceita, ou com negação (inseguros com
+        # o texto traduzido para ASCII), são sempre executados
+        self.always: Set[int] = set()
+        expressions, ids, flags = [], [], []
+        for index, compiled in enumerate(self.patterns):
+            hs_flags = self._translate_flags(compiled.flags)
+            if (
+                hs_flags is None
+                or _has_negation(compiled.pattern)
+                or not self._compiles(compiled.pattern, hs_flags)
+            ):
+                self.always.add(index)
+                continue
+            expressions.append(compiled.pattern.encode('ascii'))
+            ids.append(index)
+            flags.append(hs_flags)
+        
+        self.database = None
+        if expressions:
+            self.database = hyperscan.Database()
+            self.database.compile(
+                expressions=expressions, ids=ids, elements=len(ids), flags=flags
+            )
+    
+    def _load(self, path: Path) -> bool:
+        """Carrega o banco do cache (índices ``always`` + banco serializado)."""
+        try:
+            header, _, raw = path.read_bytes().partition(b'\n')
+            self.always = set(json.loads(header))
+            self.database = hyperscan.loadb(raw, hyperscan.HS_MODE_BLOCK) if raw else None
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning("Cache do Hyperscan inválido (%s), recompilando: %s", path, e)
+            return False
+        return True
+    
+    def _save(self, path: Path):
+        """Grava o banco no cache; falhas (ex.: disco somente leitura) são ignoradas."""
+        raw = hyperscan.dumpb(self.database) if self.database is not None else b''
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Grava num arquivo temporário e renomeia: leitores nunca veem
+            # um arquivo pela metade
+            tmp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+            tmp_path.write_bytes(json.dumps(sorted(self.always)).encode('ascii') + b'\n' + raw)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug("Não foi possível gravar o cache do Hyperscan: %s", e)
+    
+    @classmethod
+    def _translate_flags(cls, re_flags: int) -> Optional[int]:
+        """Converte flags do re; None se houver flag sem equivalente."""
+        hs_flags = hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH
+        re_flags &= ~re.UNICODE
+        for re_flag, hs_name in cls._FLAG_MAP.items():
+            if re_flags & re_flag:
+                hs_flags |= getattr(hyperscan, hs_name)
+                re_flags &= ~re_flag
+        return None if re_flags else hs_flags
+    
+    @staticmethod
+    def _compiles(pattern: str, hs_flags: int) -> bool:
+        """Verifica se o Hyperscan aceita o padrão."""
+        if not pattern.isascii():
+            return False
+        try:
+            hyperscan.Database().compile(
+                expressions=[pattern.encode('ascii')], ids=[0], elements=1, flags=[hs_flags]
+            )
+        except hyperscan.error:
+            return False
+        return True
+    
+    def candidates(self, text: str) -> Set[Pattern]:
+        """Retorna os padrões que podem ter match no texto."""
+        found = set(self.always)
+        if self.database is None:
+            return {self.patterns[i] for i in found}
+        
+        if text.isascii():
+            data = text.encode('ascii').translate(_PREFILTER_ASCII_SPACES)
+        else:
+            data = text.translate(_PREFILTER_CHAR_MAP).encode('ascii')
+        
+        scratch = getattr(self._local, 'scratch', None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self.database)
+        
+        self.database.scan(
+            data,
+            match_event_handler=(
+                lambda pattern_id, start, end, flags, context: found.add(pattern_id)
+            ),
+            scratch=scratch
+        )
+        return {self.patterns[i] for i in found}
+
+
+# Classes do re reescritas para o RE2 (que as trata como ASCII) de forma
+# a casar ao menos os mesmos caracteres que no re
+_RE2_CLASS_ESCAPES = {
+    's': r'\s\x0b\x1c-\x1f\x85\p{Z}',  # str.isspace()
+    'd': r'\p{Nd}',
+    'w': r'\p{L}\p{N}_',
+}
+
+# Asserções do re removidas na versão RE2 (o padrão só fica mais permissivo)
+_RE2_DROPPED_ASSERTIONS = frozenset('bB')
+
+# Flags do re e o modificador inline equivalente no RE2
+_RE2_INLINE_FLAGS = {re.IGNORECASE: 'i', re.MULTILINE: 'm', re.DOTALL: 's'}
+
+# Letras que o re (IGNORECASE) casa com 'i' e que o RE2 não considera
+_RE2_DOTLESS_I = str.maketrans({'\u0130': 'i', '\u0131': 'i'})
+
+
+def _re2_superset(pattern: str, flags: int) -> Optional[str]:
+    """
+    Reescreve um padrão do re para o RE2 de forma que toda posição com
+    match no re também tenha match no RE2 (o contrário não é garantido).
+    
+    Retorna None se o padrão usa algo sem reescrita segura.
+    """
+    if _has_negation(pattern):
+        return None
+    
+    flags &= ~(re.UNICODE | re.ASCII)
+    inline = ''
+    for re_flag, letter in _RE2_INLINE_FLAGS.items():
+        if flags & re_flag:
+            inline += letter
+            flags &= ~re_flag
+    if flags:
+        return None
+    
+    parts = [f'(?{inline})' if inline else '']
+    in_class = False
+    chars = iter(pattern)
+    for char in chars:
+        if char == '\\':
+            escaped = next(chars, '')
+            if escaped in _RE2_CLASS_ESCAPES:
+                cls = _RE2_CLASS_ESCAPES[escaped]
+                parts.append(cls if in_class else f'[{cls}]')
+            elif escaped in _RE2_DROPPED_ASSERTIONS and not in_class:
+                continue
+            elif escaped in 'SDWAZ':
+                return None
+            else:
+                parts.append(char + escaped)
+        elif char == '$' and not in_class:
+            # $ do re também casa antes de um \n final
+            return None
+        elif char == '^' and not in_class:
+            # Âncora de início: não vale em textos concatenados (candidates_many)
+            return None
+        else:
+            if char == '[' and not in_class:
+                in_class = True
+            elif char == ']' and in_class:
+                in_class = False
+            parts.append(char)
+    return ''.join(parts)
+
+
+class _RE2Prefilter:
+    """
+    Pré-filtro com RE2 (tempo linear, sem backtracking).
+    
+    Cada padrão ganha uma versão RE2 mais permissiva (ver _re2_superset);
+    se ela não encontra nada no texto, o ``finditer`` do ``re`` é pulado.
+    """
+    
+    def __init__(self, patterns: List[Pattern]):
+        self.checks: List[Tuple[Pattern, Optional[object]]] = []
+        for compiled in patterns:
+            check = None
+            rewritten = _re2_superset(compiled.pattern, compiled.flags)
+            if rewritten is not None:
+                try:
+                    check = re2.compile(rewritten.encode('utf-8'))
+                except re2.error:
+                    check = None
+            self.checks.append((compiled, check))
+    
+    def candidates(self, text: str) -> Set[Pattern]:
+        """Retorna os padrões que podem ter match no texto."""
+        if not text.isascii():
+            text = text.translate(_RE2_DOTLESS_I)
+        data = text.encode('utf-8', 'surrogatepass')
+        
+        return {
+            compiled
+            for compiled, check in self.checks
+            if check is None or check.search(data) is not None
+        }
+    
+    def candidates_many(self, texts: List[str]) -> List[Set[Pattern]]:
+        """
+        Versão em lote de candidates.
+        
+        Os textos são concatenados (separados por \n) e cada padrão é
+        buscado só a partir do próximo texto ainda sem match, em vez de uma
+        chamada por texto. Um match é atribuído a todos os textos que ele
+        cobre: ao atravessar o separador, ele pode esconder o início de um
+        match do texto seguinte.
+        """
+        encoded = [
+            (text if text.isascii() else text.translate(_RE2_DOTLESS_I))
+            .encode('utf-8', 'surrogatepass')
+            for text in texts
+        ]
+        data = b'\n'.join(encoded)
+        # Offset (em bytes) do início de cada texto no buffer
+        starts = [0, *accumulate(len(chunk) + 1 for chunk in encoded[:-1])]
+        
+        found: List[Set[Pattern]] = [set() for _ in texts]
+        for compiled, check in self.checks:
+            if check is None:
+                for candidates in found:
+                    candidates.add(compiled)
+                continue
+            
+            position = 0
+            while True:
+                match = check.search(data, position)
+                if match is None:
+                    break
+                first = bisect_right(starts, match.start()) - 1
+                last = bisect_right(starts, max(match.end() - 1, match.start())) - 1
+                for index in range(first, last + 1):
+                    found[index].add(compiled)
+                if last + 1 == len(starts):
+                    break
+                position = starts[last + 1]
+        
+        return found
+
+
+def _build_prefilter(patterns: List[Pattern], use_hyperscan: bool = True):
+    """Cria o pré-filtro disponível (Hyperscan, senão RE2); None se nenhum."""
+    if use_hyperscan and HYPERSCAN_AVAILABLE:
+        return _HyperscanPrefilter(patterns)
+    if RE2_AVAILABLE:
+        return _RE2Prefilter(patterns)
+    return None
+
+
 @dataclass
 class BrazilianPatterns:
     """
@@ -334,6 +726,9 @@ class BrazilianPatterns:
         default_factory=dict, init=False
     )
     
+    # Pré-filtro Hyperscan ou RE2 (None se nenhum estiver instalado)
+    _prefilter: Optional[Any] = field(default=None, init=False, repr=False)
+    
     def __post_init__(self):
         """Compila todos os padrões após inicialização."""
         self._compile_all_patterns()
@@ -363,6 +758,12 @@ class BrazilianPatterns:
                 
                 compiled = re.compile(config.pattern, config.flags)
                 self._compiled_patterns[config.pii_type].append((compiled, config))
+        
+        self._prefilter = _build_prefilter([
+            compiled
+            for patterns in self._compiled_patterns.values()
+            for compiled, _ in patterns
+        ])
     
     def find_all(self, text: str) -> List[Dict]:
         """
@@ -376,8 +777,13 @@ class BrazilianPatterns:
         """
         matches = []
         
+        # O pré-filtro descarta de uma vez os padrões sem match
+        candidates = self._prefilter.candidates(text) if self._prefilter else None
+        
         for pii_type, patterns in self._compiled_patterns.items():
             for compiled_pattern, config in patterns:
+                if candidates is not None and compiled_pattern not in candidates:
+                    continue
                 for match in compiled_pattern.finditer(text):
                     matches.append({
                         'type': pii_type.value,
@@ -502,6 +908,10 @@ class ContextualPatterns:
     
     _compiled: Dict[str, List[Tuple[Pattern, float]]] = field(default_factory=dict, init=False)
     
+    # Pré-filtro RE2 (None se não estiver instalado); os padrões contextuais
+    # têm literais acentuados, que o pré-filtro Hyperscan não aceita
+    _prefilter: Optional[Any] = field(default=None, init=False, repr=False)
+    
     def __post_init__(self):
         """Compila padrões contextuais."""
         self._compile_patterns()
@@ -521,21 +931,43 @@ class ContextualPatterns:
                 (re.compile(p, re.IGNORECASE), conf)
                 for p, conf in patterns
             ]
+        
+        self._prefilter = _build_prefilter(
+            [compiled for patterns in self._compiled.values() for compiled, _ in patterns],
+            use_hyperscan=False
+        )
     
-    def find_contextual(self, text: str) -> List[Dict]:
+    def candidates_many(self, texts: List[str]) -> List[Optional[Set[Pattern]]]:
+        """
+        Calcula de uma vez o pré-filtro de vários textos (ver find_contextual).
+        
+        Retorna None para cada texto se não houver pré-filtro.
+        """
+        if self._prefilter is None:
+            return [None] * len(texts)
+        return self._prefilter.candidates_many(texts)
+    
+    def find_contextual(self, text: str, candidates: Optional[Set[Pattern]] = None) -> List[Dict]:
         """
         Encontra dados pessoais usando padrões contextuais.
         
         Args:
             text: Texto a ser analisado
+            candidates: Padrões que podem casar, já calculados por
+                candidates_many (opcional; senão o pré-filtro roda aqui)
             
         Returns:
             Lista de matches contextuais
         """
         matches = []
         
+        if candidates is None and self._prefilter is not None:
+            candidates = self._prefilter.candidates(text)
+        
         for pii_type, patterns in self._compiled.items():
             for compiled_pattern, confidence in patterns:
+                if candidates is not None and compiled_pattern not in candidates:
+                    continue
                 for match in compiled_pattern.finditer(text):
                     # Pega o grupo capturado (não o match completo)
                     value = match.group(1) if match.groups() else match.group()
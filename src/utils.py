@@ -12,12 +12,33 @@ Funções utilitárias para o PIIGuardian, incluindo:
 import re
 import json
 import hashlib
-from typing import Any, Dict, List, Optional, Union
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple, Union
 from pathlib import Path
 from datetime import datetime
 import logging
 from functools import wraps
 import time
+import threading
+from collections import Counter
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Opções do orjson equivalentes a json.dump(indent=2, ensure_ascii=False,
+# default=str): datetime e dataclasses passam pelo default (str) como no
+# json, e chaves não-string são aceitas
+_ORJSON_SAVE_OPTIONS = 0
+if ORJSON_AVAILABLE:
+    _ORJSON_SAVE_OPTIONS = (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
 
 
 # ============================================================================
@@ -99,6 +120,146 @@ def normalize_text(text: str) -> str:
     return text.strip()
 
 
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+
+
+class StreamingTextNormalizer:
+    """
+    normalize_text incremental, para texto recebido em partes.
+    
+    A concatenação das saídas de feed() e flush() é igual a
+    normalize_text aplicado ao texto inteiro, qualquer que seja a divisão
+    em partes. Só o estado da última linha fica guardado (um ``\r`` no fim
+    da parte, e se há espaço ou quebras de linha pendentes), então a
+    memória não cresce com o tamanho do texto.
+    """
+    
+    def __init__(self):
+        self._reset()
+    
+    def _reset(self):
+        self._started = False           # já emitiu algum caractere
+        self._line_has_content = False  # a linha atual já tem palavras
+        self._pending_space = False     # espaço entre palavras da linha
+        self._pending_newlines = 0      # quebras antes da próxima palavra
+        self._carry_cr = False          # a parte anterior terminou em \r
+    
+    def feed(self, text: str) -> str:
+        """Normaliza mais uma parte; devolve o trecho já definitivo."""
+        text = _CONTROL_CHARS_RE.sub('', text)
+        if not text:
+            return ""
+        
+        # \r\n dividido entre duas partes conta como uma quebra só
+        if self._carry_cr and text[0] == '\n':
+            text = text[1:]
+        self._carry_cr = text.endswith('\r')
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+        
+        out = []
+        for i, part in enumerate(text.split('\n')):
+            if i:
+                # Quebra de linha: espaços no fim da linha são descartados
+                if self._started:
+                    self._pending_newlines += 1
+                self._line_has_content = False
+                self._pending_space = False
+            if not part:
+                continue
+            
+            if part[0].isspace():
+                self._pending_space = True
+            
+            for word in part.split():
+                if self._started:
+                    if self._pending_newlines:
+                        out.append('\n' * self._pending_newlines)
+                    elif self._pending_space and self._line_has_content:
+                        out.append(' ')
+                out.append(word)
+                self._started = True
+                self._line_has_content = True
+                self._pending_newlines = 0
+                self._pending_space = True
+            
+            # A última palavra pode continuar na próxima parte
+            self._pending_space = part[-1].isspace()
+        
+        return ''.join(out)
+    
+    def flush(self) -> str:
+        """Fim do texto: espaços e quebras pendentes são descartados (strip)."""
+        self._reset()
+        return ""
+
+
+# Placeholders de anonimização por tipo de dado
+ANONYMIZATION_PLACEHOLDERS: Dict[str, str] = {
+    'CPF': '[CPF_REMOVIDO]',
+    'CNPJ': '[CNPJ_REMOVIDO]',
+    'TELEFONE': '[TELEFONE_REMOVIDO]',
+    'CELULAR': '[CELULAR_REMOVIDO]',
+    'EMAIL': '[EMAIL_REMOVIDO]',
+    'CEP': '[CEP_REMOVIDO]',
+    'NOME_PESSOA': '[NOME_REMOVIDO]',
+    'ENDERECO': '[ENDERECO_REMOVIDO]',
+    'RG': '[RG_REMOVIDO]',
+    'DATA_NASCIMENTO': '[DATA_REMOVIDA]',
+}
+
+
+def mask_value(value: str, mask_char: str = '*') -> str:
+    """Mascara um valor mantendo alguns caracteres visíveis."""
+    if len(value) > 4:
+        return value[:2] + mask_char * (len(value) - 4) + value[-2:]
+    return mask_char * len(value)
+
+
+def get_placeholder(entity_type: str) -> str:
+    """Retorna o placeholder de anonimização de um tipo de dado."""
+    entity_type = entity_type.replace('_CONTEXTUAL', '')
+    return ANONYMIZATION_PLACEHOLDERS.get(entity_type, f'[{entity_type}_REMOVIDO]')
+
+
+def replace_spans(text: str, spans: List[Tuple[int, int, str]]) -> str:
+    """
+    Substitui trechos do texto.
+    
+    Quando os trechos estão dentro do texto e não se sobrepõem (caso
+    comum), o texto é montado numa única passada; caso contrário, as
+    substituições são aplicadas uma a uma, da última posição para a primeira.
+    
+    Args:
+        text: Texto original
+        spans: Tuplas (início, fim, substituto)
+        
+    Returns:
+        Texto com os trechos substituídos
+    """
+    spans = [span for span in spans if span[0] >= 0 and span[1] > span[0]]
+    if not spans:
+        return text
+    
+    text_length = len(text)
+    parts = []
+    cursor = 0
+    for start, end, replacement in sorted(spans, key=itemgetter(0)):
+        if start < cursor or end > text_length:
+            break
+        parts.append(text[cursor:start])
+        parts.append(replacement)
+        cursor = end
+    else:
+        parts.append(text[cursor:])
+        return ''.join(parts)
+    
+    # Trechos sobrepostos ou fora do texto: substitui do fim para o início
+    result = text
+    for start, end, replacement in sorted(spans, key=itemgetter(0), reverse=True):
+        result = result[:start] + replacement + result[end:]
+    return result
+
+
 def mask_pii(text: str, entities: List[Dict], mask_char: str = '*') -> str:
     """
     Mascara dados pessoais no texto.
@@ -114,25 +275,14 @@ def mask_pii(text: str, entities: List[Dict], mask_char: str = '*') -> str:
     if not entities:
         return text
     
-    # Ordena entidades por posição (decrescente) para não afetar índices
-    sorted_entities = sorted(entities, key=lambda x: x.get('start', 0), reverse=True)
-    
-    result = text
-    for entity in sorted_entities:
-        start = entity.get('start', 0)
-        end = entity.get('end', 0)
-        value = entity.get('value', '')
-        
-        if start >= 0 and end > start:
-            # Cria máscara mantendo alguns caracteres visíveis
-            if len(value) > 4:
-                masked = value[:2] + mask_char * (len(value) - 4) + value[-2:]
-            else:
-                masked = mask_char * len(value)
-            
-            result = result[:start] + masked + result[end:]
-    
-    return result
+    return replace_spans(text, [
+        (
+            entity.get('start', 0),
+            entity.get('end', 0),
+            mask_value(entity.get('value', ''), mask_char)
+        )
+        for entity in entities
+    ])
 
 
 def anonymize_text(text: str, entities: List[Dict]) -> str:
@@ -149,35 +299,14 @@ def anonymize_text(text: str, entities: List[Dict]) -> str:
     if not entities:
         return text
     
-    # Mapeamento de tipos para placeholders
-    placeholders = {
-        'CPF': '[CPF_REMOVIDO]',
-        'CNPJ': '[CNPJ_REMOVIDO]',
-        'TELEFONE': '[TELEFONE_REMOVIDO]',
-        'CELULAR': '[CELULAR_REMOVIDO]',
-        'EMAIL': '[EMAIL_REMOVIDO]',
-        'CEP': '[CEP_REMOVIDO]',
-        'NOME_PESSOA': '[NOME_REMOVIDO]',
-        'ENDERECO': '[ENDERECO_REMOVIDO]',
-        'RG': '[RG_REMOVIDO]',
-        'DATA_NASCIMENTO': '[DATA_REMOVIDA]',
-    }
-    
-    # Ordena por posição (decrescente)
-    sorted_entities = sorted(entities, key=lambda x: x.get('start', 0), reverse=True)
-    
-    result = text
-    for entity in sorted_entities:
-        start = entity.get('start', 0)
-        end = entity.get('end', 0)
-        entity_type = entity.get('type', 'UNKNOWN').replace('_CONTEXTUAL', '')
-        
-        placeholder = placeholders.get(entity_type, f'[{entity_type}_REMOVIDO]')
-        
-        if start >= 0 and end > start:
-            result = result[:start] + placeholder + result[end:]
-    
-    return result
+    return replace_spans(text, [
+        (
+            entity.get('start', 0),
+            entity.get('end', 0),
+            get_placeholder(entity.get('type', 'UNKNOWN'))
+        )
+        for entity in entities
+    ])
 
 
 def extract_numbers(text: str) -> List[str]:
@@ -424,6 +553,17 @@ def save_json_file(data: Dict, file_path: Union[str, Path], indent: int = 2):
     path = Path(file_path)
     path.parent.mkdir(parents=True, exist_ok=True)
     
+    # orjson só indenta com 2 espaços; valores que ele não serializa
+    # (inteiros acima de 64 bits, por exemplo) caem no json
+    if ORJSON_AVAILABLE and indent == 2:
+        try:
+            content = orjson.dumps(data, default=str, option=_ORJSON_SAVE_OPTIONS)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            path.write_bytes(content)
+            return
+    
     with open(path, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=indent, ensure_ascii=False, default=str)
 
@@ -467,16 +607,43 @@ class PerformanceMetrics:
             'false_positives': 0,
             'false_negatives': 0,
         }
+        self._lock = threading.Lock()
     
     def update(self, result: Dict, expected: Optional[Dict] = None):
         """Atualiza métricas com novo resultado."""
-        self.metrics['total_texts'] += 1
-        self.metrics['total_entities'] += len(result.get('entities', []))
-        self.metrics['total_time_ms'] += result.get('metadata', {}).get('processing_time_ms', 0)
+        with self._lock:
+            self.metrics['total_texts'] += 1
+            self.metrics['total_entities'] += len(result.get('entities', []))
+            self.metrics['total_time_ms'] += result.get('metadata', {}).get('processing_time_ms', 0)
+            
+            for entity in result.get('entities', []):
+                entity_type = entity.get('type', 'UNKNOWN')
+                by_type = self.metrics['by_type']
+                by_type[entity_type] = by_type.get(entity_type, 0) + 1
+    
+    def update_many(self, results: List[Dict]):
+        """
+        Atualiza métricas com vários resultados de uma vez (ex.: um lote).
         
-        for entity in result.get('entities', []):
-            entity_type = entity.get('type', 'UNKNOWN')
-            self.metrics['by_type'][entity_type] = self.metrics['by_type'].get(entity_type, 0) + 1
+        Os totais são agregados fora do lock, que é adquirido uma única vez.
+        """
+        entity_types = Counter(
+            entity.get('type', 'UNKNOWN')
+            for result in results
+            for entity in result.get('entities', [])
+        )
+        total_time_ms = sum(
+            result.get('metadata', {}).get('processing_time_ms', 0) for result in results
+        )
+        
+        with self._lock:
+            self.metrics['total_texts'] += len(results)
+            self.metrics['total_entities'] += sum(entity_types.values())
+            self.metrics['total_time_ms'] += total_time_ms
+            
+            by_type = self.metrics['by_type']
+            for entity_type, count in entity_types.items():
+                by_type[entity_type] = by_type.get(entity_type, 0) + count
     
     def calculate_scores(self) -> Dict[str, float]:
         """Calcula métricas de avaliação."""
@@ -13,19 +13,502 @@ Classes:
 """
 
 import re
-from typing import Optional, Tuple
+import sys
+from functools import lru_cache
+from operator import mul
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
+# NumPy é opcional: usado apenas na validação em lote (validate_batch)
+NUMPY_AVAILABLE = False
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    pass
 
-@dataclass
+# google-re2 é opcional: motor de regex de tempo linear (imune a ReDoS)
+RE2_AVAILABLE = False
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    pass
+
+# Numba é opcional: compila o laço da validação em lote (requer NumPy)
+NUMBA_AVAILABLE = False
+if NUMPY_AVAILABLE:
+    try:
+        from numba import njit
+        NUMBA_AVAILABLE = True
+    except ImportError:
+        pass
+
+
+# Número máximo de resultados guardados no cache LRU de cada validador
+VALIDATION_CACHE_SIZE = 8192
+
+
+# Pesos dos dígitos verificadores do CPF (tuplas criadas uma única vez)
+CPF_WEIGHTS_FIRST = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+CPF_WEIGHTS_SECOND = (11, 10, 9, 8, 7, 6, 5, 4, 3, 2)
+
+# Pesos dos dígitos verificadores do CNPJ
+CNPJ_WEIGHTS_FIRST = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+CNPJ_WEIGHTS_SECOND = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+
+
+# Remoção de caracteres não numéricos: tabela de str.translate para ASCII
+# (caso comum, sem motor de regex) e regex compilada para o restante
+_ASCII_NON_DIGITS_DEL = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if not chr(c).isdigit()
+))
+_NON_DIGIT_RE = re.compile(r'\D')
+
+
+def _only_digits(value: str) -> str:
+    """Remove caracteres não numéricos (equivalente a ``re.sub(r'\\D', '', value)``)."""
+    if value.isascii():
+        return value.translate(_ASCII_NON_DIGITS_DEL)
+    return _NON_DIGIT_RE.sub('', value)
+
+
+# Mesma tabela, mas preservando o separador NUL usado em _only_digits_batch
+_ASCII_NON_DIGITS_DEL_KEEP_NUL = {code: None for code in _ASCII_NON_DIGITS_DEL if code != 0}
+
+
+def _only_digits_batch(values: Sequence[str]) -> List[str]:
+    """
+    Versão em lote de _only_digits.
+    
+    Quando todos os valores são ASCII (e sem NUL), eles são unidos por
+    NUL, limpos com um único ``str.translate`` e separados de volta, em
+    vez de uma chamada por valor.
+    """
+    if not values:
+        return []
+    joined = '\x00'.join(values)
+    if joined.isascii() and joined.count('\x00') == len(values) - 1:
+        return joined.translate(_ASCII_NON_DIGITS_DEL_KEEP_NUL).split('\x00')
+    return [_only_digits(value) for value in values]
+
+
+# Bytes que não são dígitos ASCII, para limpar entradas em bytes
+_NON_DIGIT_BYTES = bytes(c for c in range(256) if not 0x30 <= c <= 0x39)
+
+
+def _only_digits_bytes(value: bytes) -> str:
+    """
+    Versão de _only_digits para bytes (ASCII/UTF-8).
+    
+    A limpeza é feita com ``bytes.translate`` sobre a entrada original e
+    só os dígitos restantes são decodificados para ``str``.
+    """
+    return value.translate(None, _NON_DIGIT_BYTES).decode('ascii')
+
+
+# Tabela de tradução byte ASCII -> valor do dígito (b'0'..b'9' -> 0..9)
+_ASCII_DIGIT_VALUES = bytes((i - 0x30) & 0xFF for i in range(256))
+
+
+def _parse_digits(cleaned: str) -> Optional[Sequence[int]]:
+    """
+    Converte uma string nos valores inteiros de cada dígito.
+    
+    Retorna None se houver algum caractere que não seja dígito decimal.
+    No caso comum (ASCII) a conversão é um único ``bytes.translate`` e a
+    verificação um único ``max``, ambos em C; dígitos Unicode usam ``int()``.
+    """
+    if cleaned.isascii():
+        digits = cleaned.encode('ascii').translate(_ASCII_DIGIT_VALUES)
+        return digits if not digits or max(digits) < 10 else None
+    return [int(d) for d in cleaned] if cleaned.isdecimal() else None
+
+
+def _cpf_check_digit(digits: Sequence[int], weights: Sequence[int]) -> int:
+    """
+    Calcula um dígito verificador de CPF.
+    
+    A soma ponderada usa ``map(mul, ...)``, que percorre os dígitos em C;
+    apenas os ``len(weights)`` primeiros dígitos são considerados.
+    """
+    return _cpf_check_digit_from_sum(sum(map(mul, digits, weights)))
+
+
+def _cpf_check_digit_from_sum(total: int) -> int:
+    """Dígito verificador de CPF a partir da soma ponderada."""
+    return total * 10 % 11 % 10
+
+
+def _cnpj_check_digit(digits: Sequence[int], weights: Sequence[int]) -> int:
+    """Calcula um dígito verificador de CNPJ (módulo 11)."""
+    return _cnpj_check_digit_from_sum(sum(map(mul, digits, weights)))
+
+
+def _cnpj_check_digit_from_sum(total: int) -> int:
+    """Dígito verificador de CNPJ a partir da soma ponderada."""
+    remainder = total % 11
+    return 0 if remainder < 2 else 11 - remainder
+
+
+def _pack_weights(weights: Sequence[int]) -> Tuple[int, int, int]:
+    """
+    Empacota pesos para a soma ponderada SWAR (ver _check_digits_swar).
+    
+    Retorna (multiplicador, deslocamento, correção): os pesos ficam em
+    faixas de 16 bits em ordem inversa, de modo que a faixa
+    ``len(weights) - 1`` do produto com os dígitos seja a soma ponderada.
+    """
+    multiplier = sum(w << (16 * i) for i, w in enumerate(reversed(weights)))
+    return multiplier, 16 * (len(weights) - 1), ord('0') * sum(weights)
+
+
+def _check_digits_swar(
+    value: str,
+    packed_first: Tuple[int, int, int],
+    packed_second: Tuple[int, int, int],
+    cnpj_rule: bool
+) -> bool:
+    """
+    Valida um documento ASCII (apenas dígitos) sem laço por dígito.
+    
+    Os caracteres viram faixas de 16 bits de um único inteiro (UTF-16-LE)
+    e cada soma ponderada sai de uma multiplicação e um deslocamento: as
+    somas parciais não passam de 16 bits, então não há "vai um" entre faixas.
+    """
+    if value.count(value[0]) == len(value):
+        return False
+    
+    packed = int.from_bytes(value.encode('utf-16-le'), 'little')
+    check_digit = _cnpj_check_digit_from_sum if cnpj_rule else _cpf_check_digit_from_sum
+    
+    multiplier, shift, offset = packed_first
+    total = ((packed * multiplier >> shift) & 0xFFFF) - offset
+    if check_digit(total) != ord(value[-2]) - 0x30:
+        return False
+    
+    multiplier, shift, offset = packed_second
+    total = ((packed * multiplier >> shift) & 0xFFFF) - offset
+    return check_digit(total) == ord(value[-1]) - 0x30
+
+
+def _validate_check_digits_batch(
+    cleaned: List[str],
+    length: int,
+    weights_first: Tuple[int, ...],
+    weights_second: Tuple[int, ...],
+    cnpj_rule: bool,
+    validate_one: Callable[[str], "ValidationResult"]
+) -> List[bool]:
+    """
+    Valida em bloco documentos com dígitos verificadores (CPF/CNPJ).
+    
+    Os valores ASCII com o comprimento esperado são empilhados em uma
+    matriz (N, length) de dígitos e validados de uma só vez: por um
+    kernel Numba, se disponível, ou por operações vetorizadas NumPy. Sem
+    NumPy, esses valores usam a soma ponderada SWAR em Python puro. Os
+    demais valores passam pela validação individual.
+    """
+    results = [False] * len(cleaned)
+    
+    if not NUMPY_AVAILABLE:
+        packed_first = _pack_weights(weights_first)
+        packed_second = _pack_weights(weights_second)
+        for i, value in enumerate(cleaned):
+            if len(value) == length and value.isascii() and value.isdigit():
+                results[i] = _check_digits_swar(value, packed_first, packed_second, cnpj_rule)
+            else:
+                results[i] = validate_one(value).is_valid
+        return results
+    
+    block = [i for i, value in enumerate(cleaned) if len(value) == length and value.isascii()]
+    
+    if block:
+        raw = ''.join(cleaned[i] for i in block).encode('ascii')
+        digits = np.frombuffer(raw, dtype=np.uint8).reshape(-1, length) - 48
+        
+        if NUMBA_AVAILABLE:
+            valid = _check_digits_matrix_numba(
+                digits,
+                np.array(weights_first, dtype=np.int64),
+                np.array(weights_second, dtype=np.int64),
+                cnpj_rule
+            )
+        else:
+            valid = _check_digits_matrix_numpy(digits, weights_first, weights_second, cnpj_rule)
+        
+        for i, is_valid in zip(block, valid.tolist()):
+            results[i] = is_valid
+    
+    in_block = set(block)
+    for i, value in enumerate(cleaned):
+        if i not in in_block:
+            results[i] = validate_one(value).is_valid
+    
+    return results
+
+
+def _check_digits_matrix_numpy(
+    digits: "np.ndarray",
+    weights_first: Tuple[int, ...],
+    weights_second: Tuple[int, ...],
+    cnpj_rule: bool
+) -> "np.ndarray":
+    """Valida uma matriz (N, length) de dígitos com duas multiplicações matriz-vetor."""
+    length = digits.shape[1]
+    digits = digits.astype(np.int64)
+    check_digits = _cnpj_check_digits_array if cnpj_rule else _cpf_check_digits_array
+    
+    expected_first = check_digits(digits[:, :length - 2] @ np.array(weights_first))
+    expected_second = check_digits(digits[:, :length - 1] @ np.array(weights_second))
+    repeated = (digits == digits[:, :1]).all(axis=1)
+    
+    return (
+        ~repeated
+        & (expected_first == digits[:, length - 2])
+        & (expected_second == digits[:, length - 1])
+    )
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, boundscheck=False)
+    def _check_digits_matrix_numba(digits, weights_first, weights_second, cnpj_rule):
+        """
+        Valida uma matriz (N, length) de dígitos em um único laço compilado.
+        
+        Equivalente a _check_digits_matrix_numpy, sem matrizes temporárias:
+        cada linha é percorrida uma vez e descartada no primeiro erro.
+        """
+        rows, length = digits.shape
+        valid = np.zeros(rows, dtype=np.bool_)
+        
+        for row in range(rows):
+            repeated = True
+            for col in range(1, length):
+                if digits[row, col] != digits[row, 0]:
+                    repeated = False
+                    break
+            if repeated:
+                continue
+            
+            total = 0
+            for col in range(length - 2):
+                total += digits[row, col] * weights_first[col]
+            if cnpj_rule:
+                remainder = total % 11
+                expected = 0 if remainder < 2 else 11 - remainder
+            else:
+                expected = total * 10 % 11 % 10
+            if expected != digits[row, length - 2]:
+                continue
+            
+            total = 0
+            for col in range(length - 1):
+                total += digits[row, col] * weights_second[col]
+            if cnpj_rule:
+                remainder = total % 11
+                expected = 0 if remainder < 2 else 11 - remainder
+            else:
+                expected = total * 10 % 11 % 10
+            valid[row] = expected == digits[row, length - 1]
+        
+        return valid
+
+
+def _cpf_check_digits_array(sums: "np.ndarray") -> "np.ndarray":
+    """Versão vetorizada de _cpf_check_digit a partir das somas ponderadas."""
+    return sums * 10 % 11 % 10
+
+
+def _cnpj_check_digits_array(sums: "np.ndarray") -> "np.ndarray":
+    """Versão vetorizada de _cnpj_check_digit a partir das somas ponderadas."""
+    remainder = sums % 11
+    return np.where(remainder < 2, 0, 11 - remainder)
+
+
+# __slots__ no ValidationResult (Python 3.10+)
+_DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ValidationResult:
-    """Resultado de uma validação."""
+    """
+    Resultado de uma validação.
+    
+    Imutável: a mesma instância é devolvida pelo cache dos validadores.
+    """
     is_valid: bool
     confidence: float
     message: str
     cleaned_value: Optional[str] = None
 
 
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _validate_cpf_cleaned(cleaned: str) -> ValidationResult:
+    """Valida um CPF já limpo (apenas dígitos)."""
+    # Verifica comprimento
+    if len(cleaned) != 11:
+        return ValidationResult(
+            is_valid=False,
+            confidence=0.0,
+            message=f"CPF deve ter 11 dígitos, encontrado: {len(cleaned)}"
+        )
+    
+    # Converte os dígitos numa única passada, rejeitando não-dígitos
+    digits = _parse_digits(cleaned)
+    if digits is None:
+        return ValidationResult(
+            is_valid=False,
+            confidence=0.0,
+            message="CPF deve conter apenas dígitos"
+        )
+    
+    # Verifica sequências inválidas (todos os dígitos iguais)
+    if min(digits) == max(digits):
+        return ValidationResult(
+            is_valid=False,
+            confidence=0.0,
+            message="CPF com sequência inválida (dígitos repetidos)"
+        )
+    
+    # Calcula primeiro dígito verificador
+    expected_first = _cpf_check_digit(digits, CPF_WEIGHTS_FIRST)
+    
+    if expected_first != digits[9]:
+        return ValidationResult(
+            is_valid=False,
+            confidence=0.3,
+            message=(
+                f"Primeiro dígito verificador inválido: esperado {expected_first}, "
+                f"encontrado {digits[9]}"
+            ),
+            cleaned_value=cleaned
+        )
+    
+    # Calcula segundo dígito verificador
+    expected_second = _cpf_check_digit(digits, CPF_WEIGHTS_SECOND)
+    
+    if expected_second != digits[10]:
+        return ValidationResult(
+            is_valid=False,
+            confidence=0.3,
+            message=(
+                f"Segundo dígito verificador inválido: esperado {expected_second}, "
+                f"encontrado {digits[10]}"
+            ),
+            cleaned_value=cleaned
+        )
+    
+    return ValidationResult(
+        is_valid=True,
+        confidence=0.98,
+        message="CPF válido - dígitos verificadores conferem",
+        cleaned_value=cleaned
+    )
+
+
+def validate_cpf(cpf: str) -> ValidationResult:
+    """
+    Valida um CPF usando o algoritmo oficial.
+    
+    Args:
+        cpf: String contendo o CPF (com ou sem formatação)
+        
+    Returns:
+        ValidationResult com o resultado da validação
+    """
+    # O cache é indexado pelo valor limpo
+    return _validate_cpf_cleaned(_only_digits(cpf))
+
+
+def validate_cpf_bytes(cpf: bytes) -> ValidationResult:
+    """
+    Valida um CPF recebido em bytes (ex.: trecho de um arquivo lido em modo binário).
+    
+    Evita decodificar o documento inteiro: apenas os dígitos do CPF
+    são convertidos para ``str``. Usa o mesmo cache de validate_cpf.
+    """
+    return _validate_cpf_cleaned(_only_digits_bytes(cpf))
+
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _validate_cnpj_cleaned(cleaned: str) -> ValidationResult:
+    """Valida um CNPJ já limpo (apenas dígitos)."""
+    # Verifica comprimento
+    if len(cleaned) != 14:
+        return ValidationResult(
+            is_valid=False,
+            confidence=0.0,
+            message=f"CNPJ deve ter 14 dígitos, encontrado: {len(cleaned)}"
+        )
+    
+    # Converte os dígitos numa única passada, rejeitando não-dígitos
+    digits = _parse_digits(cleaned)
+    if digits is None:
+        return ValidationResult(
+            is_valid=False,
+            confidence=0.0,
+            message="CNPJ deve conter apenas dígitos"
+        )
+    
+    # Verifica sequências inválidas (todos os dígitos iguais)
+    if min(digits) == max(digits):
+        return ValidationResult(
+            is_valid=False,
+            confidence=0.0,
+            message="CNPJ com sequência inválida (dígitos repetidos)"
+        )
+    
+    # Calcula primeiro dígito verificador
+    expected_first = _cnpj_check_digit(digits, CNPJ_WEIGHTS_FIRST)
+    
+    if expected_first != digits[12]:
+        return ValidationResult(
+            is_valid=False,
+            confidence=0.3,
+            message=f"Primeiro dígito verificador inválido",
+            cleaned_value=cleaned
+        )
+    
+    # Calcula segundo dígito verificador
+    expected_second = _cnpj_check_digit(digits, CNPJ_WEIGHTS_SECOND)
+    
+    if expected_second != digits[13]:
+        return ValidationResult(
+            is_valid=False,
+            confidence=0.3,
+            message=f"Segundo dígito verificador inválido",
+            cleaned_value=cleaned
+        )
+    
+    return ValidationResult(
+        is_valid=True,
+        confidence=0.98,
+        message="CNPJ válido - dígitos verificadores conferem",
+        cleaned_value=cleaned
+    )
+
+
+def validate_cnpj(cnpj: str) -> ValidationResult:
+    """
+    Valida um CNPJ usando o algoritmo oficial.
+    
+    Args:
+        cnpj: String contendo o CNPJ (com ou sem formatação)
+        
+    Returns:
+        ValidationResult com o resultado da validação
+    """
+    return _validate_cnpj_cleaned(_only_digits(cnpj))
+
+
+def validate_cnpj_bytes(cnpj: bytes) -> ValidationResult:
+    """
+    Valida um CNPJ recebido em bytes (ver validate_cpf_bytes).
+    """
+    return _validate_cnpj_cleaned(_only_digits_bytes(cnpj))
+
+
 class CPFValidator:
     """
     Validador matemático de CPF brasileiro.
@@ -48,17 +531,14 @@ class CPFValidator:
         True
     """
     
-    # CPFs conhecidamente inválidos (sequências repetidas)
-    INVALID_CPFS = {
-        "00000000000", "11111111111", "22222222222", "33333333333",
-        "44444444444", "55555555555", "66666666666", "77777777777",
-        "88888888888", "99999999999"
-    }
+    # Pesos para cálculo dos dígitos verificadores
+    WEIGHTS_FIRST = CPF_WEIGHTS_FIRST
+    WEIGHTS_SECOND = CPF_WEIGHTS_SECOND
     
     @staticmethod
     def clean(cpf: str) -> str:
         """Remove caracteres não numéricos do CPF."""
-        return re.sub(r'\D', '', cpf)
+        return _only_digits(cpf)
     
     @staticmethod
     def format(cpf: str) -> str:
@@ -78,63 +558,29 @@ class CPFValidator:
         Returns:
             ValidationResult com o resultado da validação
         """
-        cleaned = self.clean(cpf)
-        
-        # Verifica comprimento
-        if len(cleaned) != 11:
-            return ValidationResult(
-                is_valid=False,
-                confidence=0.0,
-                message=f"CPF deve ter 11 dígitos, encontrado: {len(cleaned)}"
-            )
-        
-        # Verifica se são todos dígitos
-        if not cleaned.isdigit():
-            return ValidationResult(
-                is_valid=False,
-                confidence=0.0,
-                message="CPF deve conter apenas dígitos"
-            )
-        
-        # Verifica sequências inválidas
-        if cleaned in self.INVALID_CPFS:
-            return ValidationResult(
-                is_valid=False,
-                confidence=0.0,
-                message="CPF com sequência inválida (dígitos repetidos)"
-            )
-        
-        # Calcula primeiro dígito verificador
-        digits = [int(d) for d in cleaned]
-        
-        sum_first = sum(d * w for d, w in zip(digits[:9], range(10, 1, -1)))
-        expected_first = (sum_first * 10 % 11) % 10
-        
-        if expected_first != digits[9]:
-            return ValidationResult(
-                is_valid=False,
-                confidence=0.3,
-                message=f"Primeiro dígito verificador inválido: esperado {expected_first}, encontrado {digits[9]}",
-                cleaned_value=cleaned
-            )
-        
-        # Calcula segundo dígito verificador
-        sum_second = sum(d * w for d, w in zip(digits[:10], range(11, 1, -1)))
-        expected_second = (sum_second * 10 % 11) % 10
-        
-        if expected_second != digits[10]:
-            return ValidationResult(
-                is_valid=False,
-                confidence=0.3,
-                message=f"Segundo dígito verificador inválido: esperado {expected_second}, encontrado {digits[10]}",
-                cleaned_value=cleaned
-            )
+        return validate_cpf(cpf)
+    
+    # Mantido no namespace da classe (validation_cache_info, validate_batch)
+    _validate_cleaned = staticmethod(_validate_cpf_cleaned)
+    
+    @classmethod
+    def validate_batch(cls, cpfs: Sequence[str]) -> List[bool]:
+        """
+        Valida vários CPFs de uma vez (ex.: todos os candidatos de um documento).
         
-        return ValidationResult(
-            is_valid=True,
-            confidence=0.98,
-            message="CPF válido - dígitos verificadores conferem",
-            cleaned_value=cleaned
+        Args:
+            cpfs: CPFs com ou sem formatação
+            
+        Returns:
+            Lista indicando, na ordem de entrada, se cada CPF é válido
+        """
+        return _validate_check_digits_batch(
+            _only_digits_batch(cpfs),
+            11,
+            CPF_WEIGHTS_FIRST,
+            CPF_WEIGHTS_SECOND,
+            False,
+            cls._validate_cleaned
         )
     
     def calculate_check_digits(self, cpf_base: str) -> Tuple[int, int]:
@@ -151,16 +597,13 @@ class CPFValidator:
         if len(cleaned) != 9:
             raise ValueError("Base do CPF deve ter 9 dígitos")
         
-        digits = [int(d) for d in cleaned]
+        digits = _parse_digits(cleaned)
         
         # Primeiro dígito
-        sum_first = sum(d * w for d, w in zip(digits, range(10, 1, -1)))
-        first_digit = (sum_first * 10 % 11) % 10
+        first_digit = _cpf_check_digit(digits, CPF_WEIGHTS_FIRST)
         
         # Segundo dígito
-        digits.append(first_digit)
-        sum_second = sum(d * w for d, w in zip(digits, range(11, 1, -1)))
-        second_digit = (sum_second * 10 % 11) % 10
+        second_digit = _cpf_check_digit((*digits, first_digit), CPF_WEIGHTS_SECOND)
         
         return first_digit, second_digit
 
@@ -176,21 +619,13 @@ class CNPJValidator:
     """
     
     # Pesos para cálculo dos dígitos verificadores
-    WEIGHTS_FIRST = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-    WEIGHTS_SECOND = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-    
-    # CNPJs conhecidamente inválidos
-    INVALID_CNPJS = {
-        "00000000000000", "11111111111111", "22222222222222",
-        "33333333333333", "44444444444444", "55555555555555",
-        "66666666666666", "77777777777777", "88888888888888",
-        "99999999999999"
-    }
+    WEIGHTS_FIRST = CNPJ_WEIGHTS_FIRST
+    WEIGHTS_SECOND = CNPJ_WEIGHTS_SECOND
     
     @staticmethod
     def clean(cnpj: str) -> str:
         """Remove caracteres não numéricos do CNPJ."""
-        return re.sub(r'\D', '', cnpj)
+        return _only_digits(cnpj)
     
     @staticmethod
     def format(cnpj: str) -> str:
@@ -210,65 +645,29 @@ class CNPJValidator:
         Returns:
             ValidationResult com o resultado da validação
         """
-        cleaned = self.clean(cnpj)
-        
-        # Verifica comprimento
-        if len(cleaned) != 14:
-            return ValidationResult(
-                is_valid=False,
-                confidence=0.0,
-                message=f"CNPJ deve ter 14 dígitos, encontrado: {len(cleaned)}"
-            )
-        
-        # Verifica se são todos dígitos
-        if not cleaned.isdigit():
-            return ValidationResult(
-                is_valid=False,
-                confidence=0.0,
-                message="CNPJ deve conter apenas dígitos"
-            )
-        
-        # Verifica sequências inválidas
-        if cleaned in self.INVALID_CNPJS:
-            return ValidationResult(
-                is_valid=False,
-                confidence=0.0,
-                message="CNPJ com sequência inválida (dígitos repetidos)"
-            )
-        
-        digits = [int(d) for d in cleaned]
-        
-        # Calcula primeiro dígito verificador
-        sum_first = sum(d * w for d, w in zip(digits[:12], self.WEIGHTS_FIRST))
-        remainder = sum_first % 11
-        expected_first = 0 if remainder < 2 else 11 - remainder
-        
-        if expected_first != digits[12]:
-            return ValidationResult(
-                is_valid=False,
-                confidence=0.3,
-                message=f"Primeiro dígito verificador inválido",
-                cleaned_value=cleaned
-            )
-        
-        # Calcula segundo dígito verificador
-        sum_second = sum(d * w for d, w in zip(digits[:13], self.WEIGHTS_SECOND))
-        remainder = sum_second % 11
-        expected_second = 0 if remainder < 2 else 11 - remainder
-        
-        if expected_second != digits[13]:
-            return ValidationResult(
-                is_valid=False,
-                confidence=0.3,
-                message=f"Segundo dígito verificador inválido",
-                cleaned_value=cleaned
-            )
+        return validate_cnpj(cnpj)
+    
+    # Mantido no namespace da classe (validation_cache_info, validate_batch)
+    _validate_cleaned = staticmethod(_validate_cnpj_cleaned)
+    
+    @classmethod
+    def validate_batch(cls, cnpjs: Sequence[str]) -> List[bool]:
+        """
+        Valida vários CNPJs de uma vez.
         
-        return ValidationResult(
-            is_valid=True,
-            confidence=0.98,
-            message="CNPJ válido - dígitos verificadores conferem",
-            cleaned_value=cleaned
+        Args:
+            cnpjs: CNPJs com ou sem formatação
+            
+        Returns:
+            Lista indicando, na ordem de entrada, se cada CNPJ é válido
+        """
+        return _validate_check_digits_batch(
+            _only_digits_batch(cnpjs),
+            14,
+            CNPJ_WEIGHTS_FIRST,
+            CNPJ_WEIGHTS_SECOND,
+            True,
+            cls._validate_cleaned
         )
 
 
@@ -305,10 +704,13 @@ class PhoneValidator:
         91, 92, 93, 94, 95, 96, 97, 98, 99
     }
     
+    # Mesmos DDDs como bitmap (bit d ligado = DDD d válido)
+    VALID_DDD_MASK = sum(1 << d for d in VALID_DDDS)
+    
     @staticmethod
     def clean(phone: str) -> str:
         """Remove caracteres não numéricos do telefone."""
-        return re.sub(r'\D', '', phone)
+        return _only_digits(phone)
     
     def validate(self, phone: str) -> ValidationResult:
         """
@@ -320,8 +722,12 @@ class PhoneValidator:
         Returns:
             ValidationResult com o resultado da validação
         """
-        cleaned = self.clean(phone)
-        
+        return self._validate_cleaned(self.clean(phone))
+    
+    @staticmethod
+    @lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+    def _validate_cleaned(cleaned: str) -> ValidationResult:
+        """Valida um telefone já limpo (apenas dígitos)."""
         # Remove DDI se presente
         if cleaned.startswith('55') and len(cleaned) > 11:
             cleaned = cleaned[2:]
@@ -334,11 +740,14 @@ class PhoneValidator:
                 message=f"Telefone deve ter 10 ou 11 dígitos, encontrado: {len(cleaned)}"
             )
         
-        # Extrai DDD
-        ddd = int(cleaned[:2])
+        # Extrai DDD (aritmética sobre ord para ASCII, sem int())
+        if cleaned.isascii():
+            ddd = ord(cleaned[0]) * 10 + ord(cleaned[1]) - 528  # 528 = 48 * 10 + 48
+        else:
+            ddd = int(cleaned[:2])
         
-        # Valida DDD
-        if ddd not in self.VALID_DDDS:
+        # Valida DDD (um shift e um AND no bitmap)
+        if not (PhoneValidator.VALID_DDD_MASK >> ddd) & 1:
             return ValidationResult(
                 is_valid=False,
                 confidence=0.4,
@@ -356,8 +765,9 @@ class PhoneValidator:
                     cleaned_value=cleaned
                 )
         
-        # Verifica se não são todos iguais
-        if len(set(cleaned[2:])) == 1:
+        # Verifica se não são todos iguais (um count em C, sem montar set)
+        number = cleaned[2:]
+        if number.count(number[0]) == len(number):
             return ValidationResult(
                 is_valid=False,
                 confidence=0.2,
@@ -392,8 +802,13 @@ class EmailValidator:
         'br', 'pt', 'us', 'uk', 'de', 'fr', 'es', 'it', 'jp', 'cn'
     }
     
-    # Regex para validação básica de email
-    EMAIL_PATTERN = re.compile(
+    # Sufixos '.tld' para um único str.endswith(tupla), feito em C
+    COMMON_TLD_SUFFIXES = tuple(f'.{tld}' for tld in COMMON_TLDS)
+    
+    # Regex para validação básica de email (RE2, se disponível, evita
+    # backtracking; o email chega sem espaços, então ``$`` tem o mesmo
+    # significado nos dois motores)
+    EMAIL_PATTERN = (re2 if RE2_AVAILABLE else re).compile(
         r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
     )
     
@@ -407,10 +822,23 @@ class EmailValidator:
         Returns:
             ValidationResult com o resultado da validação
         """
-        email = email.strip().lower()
+        return self._validate_normalized(email.strip().lower())
+    
+    def validate_many(self, emails: Sequence[str]) -> List[ValidationResult]:
+        """
+        Valida vários emails, na ordem de entrada.
         
+        Emails repetidos (após normalização) são validados uma única vez.
+        """
+        validate = self._validate_normalized
+        return [validate(email.strip().lower()) for email in emails]
+    
+    @staticmethod
+    @lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+    def _validate_normalized(email: str) -> ValidationResult:
+        """Valida um email já normalizado (sem espaços, minúsculo)."""
         # Verifica formato básico
-        if not self.EMAIL_PATTERN.match(email):
+        if not EmailValidator.EMAIL_PATTERN.match(email):
             return ValidationResult(
                 is_valid=False,
                 confidence=0.0,
@@ -453,7 +881,7 @@ class EmailValidator:
             )
         
         # Verifica domínios brasileiros comuns
-        confidence = 0.95 if any(domain.endswith(f'.{t}') for t in self.COMMON_TLDS) else 0.85
+        confidence = 0.95 if domain.endswith(EmailValidator.COMMON_TLD_SUFFIXES) else 0.85
         
         return ValidationResult(
             is_valid=True,
@@ -481,10 +909,24 @@ class CEPValidator:
     - 9: Rio Grande do Sul
     """
     
+    # Região indicada pelo primeiro dígito (índice = dígito)
+    REGIONS = (
+        "São Paulo - Capital",
+        "São Paulo - Interior",
+        "Rio de Janeiro / Espírito Santo",
+        "Minas Gerais",
+        "Bahia / Sergipe",
+        "Nordeste (PE, AL, PB, RN)",
+        "Norte/Nordeste (CE, PI, MA, PA, AM, AC, AP, RR)",
+        "Centro-Oeste (GO, TO, MT, MS, DF)",
+        "Sul (PR, SC)",
+        "Rio Grande do Sul",
+    )
+    
     @staticmethod
     def clean(cep: str) -> str:
         """Remove caracteres não numéricos do CEP."""
-        return re.sub(r'\D', '', cep)
+        return _only_digits(cep)
     
     @staticmethod
     def format(cep: str) -> str:
@@ -504,8 +946,12 @@ class CEPValidator:
         Returns:
             ValidationResult com o resultado da validação
         """
-        cleaned = self.clean(cep)
-        
+        return self._validate_cleaned(self.clean(cep))
+    
+    @staticmethod
+    @lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+    def _validate_cleaned(cleaned: str) -> ValidationResult:
+        """Valida um CEP já limpo (apenas dígitos)."""
         # Verifica comprimento
         if len(cleaned) != 8:
             return ValidationResult(
@@ -522,8 +968,8 @@ class CEPValidator:
                 message="CEP deve conter apenas dígitos"
             )
         
-        # Verifica sequências inválidas
-        if len(set(cleaned)) == 1:
+        # Verifica sequências inválidas (todos os dígitos iguais)
+        if cleaned == cleaned[0] * 8:
             return ValidationResult(
                 is_valid=False,
                 confidence=0.0,
@@ -531,21 +977,9 @@ class CEPValidator:
             )
         
         # Verifica faixa válida (00000-000 a 99999-999)
-        first_digit = int(cleaned[0])
-        regions = {
-            0: "São Paulo - Capital",
-            1: "São Paulo - Interior",
-            2: "Rio de Janeiro / Espírito Santo",
-            3: "Minas Gerais",
-            4: "Bahia / Sergipe",
-            5: "Nordeste (PE, AL, PB, RN)",
-            6: "Norte/Nordeste (CE, PI, MA, PA, AM, AC, AP, RR)",
-            7: "Centro-Oeste (GO, TO, MT, MS, DF)",
-            8: "Sul (PR, SC)",
-            9: "Rio Grande do Sul"
-        }
-        
-        region = regions.get(first_digit, "Região desconhecida")
+        first_char = cleaned[0]
+        first_digit = ord(first_char) - 48 if first_char.isascii() else int(first_char)
+        region = CEPValidator.REGIONS[first_digit]
         
         return ValidationResult(
             is_valid=True,
@@ -553,3 +987,71 @@ class CEPValidator:
             message=f"CEP válido - Região: {region}",
             cleaned_value=cleaned
         )
+
+
+# Validadores com cache de resultados (ver VALIDATION_CACHE_SIZE)
+_CACHED_VALIDATORS = (CPFValidator, CNPJValidator, PhoneValidator, CEPValidator)
+
+
+def validation_cache_info() -> Dict[str, Any]:
+    """Retorna as estatísticas do cache LRU de cada validador."""
+    info = {cls.__name__: cls._validate_cleaned.cache_info() for cls in _CACHED_VALIDATORS}
+    info[EmailValidator.__name__] = EmailValidator._validate_normalized.cache_info()
+    return info
+
+
+def clear_validation_caches():
+    """Esvazia o cache LRU de todos os validadores."""
+    for cls in _CACHED_VALIDATORS:
+        cls._validate_cleaned.cache_clear()
+    EmailValidator._validate_normalized.cache_clear()
+
+
+# Tipo de entidade -> validador com cache (recebe o valor já limpo)
+_VALIDATORS_BY_TYPE: Dict[str, Callable[[str], ValidationResult]] = {
+    'CPF': _validate_cpf_cleaned,
+    'CNPJ': _validate_cnpj_cleaned,
+    'TELEFONE': PhoneValidator._validate_cleaned,
+    'CELULAR': PhoneValidator._validate_cleaned,
+    'CEP': CEPValidator._validate_cleaned,
+}
+
+
+def validate_all(items: Sequence[Tuple[str, str]]) -> List[Optional[ValidationResult]]:
+    """
+    Valida candidatos de vários tipos de uma vez (ex.: as entidades de um documento).
+    
+    Os valores são agrupados por tipo e cada grupo é limpo numa única
+    passada (ver _only_digits_batch) antes de passar pelo validador em cache.
+    
+    Args:
+        items: Pares (tipo, valor), com tipo em CPF, CNPJ, TELEFONE,
+            CELULAR, EMAIL ou CEP
+            
+    Returns:
+        ValidationResult de cada item, na ordem de entrada
+        (None para tipos sem validador)
+    """
+    results: List[Optional[ValidationResult]] = [None] * len(items)
+    
+    # Agrupa por tipo guardando a posição original de cada valor
+    groups: Dict[str, Tuple[List[int], List[str]]] = {}
+    for index, (item_type, value) in enumerate(items):
+        indices, values = groups.setdefault(item_type, ([], []))
+        indices.append(index)
+        values.append(value)
+    
+    for item_type, (indices, values) in groups.items():
+        if item_type == 'EMAIL':
+            validate = EmailValidator._validate_normalized
+            checked = [validate(email.strip().lower()) for email in values]
+        elif item_type in _VALIDATORS_BY_TYPE:
+            checked = map(_VALIDATORS_BY_TYPE[item_type], _only_digits_batch(values))
+        else:
+            continue
+        
+        # Devolve cada resultado à posição original
+        for index, result in zip(indices, checked):
+            results[index] = result
+    
+    return results
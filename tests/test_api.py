@@ -0,0 +1,501 @@
+"""
+Testes da API REST do PIIGuardian
+=================================
+
+Testes dos endpoints da API FastAPI usando o TestClient do Starlette.
+
+Executar:
+    pytest tests/test_api.py -v
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("httpx")
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+import api
+from src.detector import PIIGuardian
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture(scope="module")
+def base_detector():
+    """Detector no modo balanceado, compartilhado pelos testes do módulo."""
+    return PIIGuardian(mode='balanced')
+
+
+@pytest.fixture
+def client(base_detector, monkeypatch):
+    """Cliente de testes com os detectores da API já construídos (sem startup)."""
+    detectors = {
+        mode: base_detector if mode == 'balanced' else base_detector.with_mode(mode)
+        for mode in api.DETECTION_MODES
+    }
+    monkeypatch.setattr(api, 'detector', base_detector)
+    monkeypatch.setattr(api, 'detectors', detectors)
+    monkeypatch.setattr(api, 'worker_pool', None)
+    api._normalize_cache.clear()
+    return TestClient(api.app)
+
+
+def _ndjson(response):
+    """Lista de entidades de uma resposta NDJSON."""
+    import json
+    return [json.loads(line) for line in response.text.splitlines() if line]
+
+
+def _asgi_stream(chunks, headers=()):
+    """
+    Envia o corpo ao /detect/stream em partes, direto pela interface ASGI.
+    
+    O TestClient junta o corpo em uma única mensagem; aqui cada parte é
+    uma mensagem ``http.request``. Devolve os eventos na ordem em que
+    ocorreram: ('chunk', partes restantes), ('status', código) e
+    ('body', bytes).
+    """
+    import asyncio
+    events = []
+    
+    async def run():
+        pending = list(chunks)
+        done = asyncio.Event()
+        
+        async def receive():
+            if pending:
+                chunk = pending.pop(0)
+                events.append(('chunk', len(pending)))
+                return {'type': 'http.request', 'body': chunk, 'more_body': bool(pending)}
+            await done.wait()
+            return {'type': 'http.disconnect'}
+        
+        async def send(message):
+            if message['type'] == 'http.response.start':
+                events.append(('status', message['status']))
+            elif message['type'] == 'http.response.body':
+                if message.get('body'):
+                    events.append(('body', message['body']))
+                if not message.get('more_body'):
+                    done.set()
+        
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1',
+            'method': 'POST', 'scheme': 'http', 'path': '/detect/stream',
+            'raw_path': b'/detect/stream', 'root_path': '', 'query_string': b'',
+            'headers': list(headers), 'client': ('test', 1), 'server': ('test', 80),
+        }
+        await api.app(scope, receive, send)
+    
+    asyncio.run(run())
+    return events
+
+
+def _stream_entities(events):
+    """Entidades das mensagens de corpo registradas por _asgi_stream."""
+    import json
+    body = b''.join(data for kind, data in events if kind == 'body')
+    return [json.loads(line) for line in body.splitlines() if line]
+
+
+# ============================================================================
+# TESTES DO /detect/stream
+# ============================================================================
+
+class TestDetectStream:
+    """Testes do endpoint de detecção em streaming."""
+    
+    CPF = "123.456.789-09"
+    
+    def test_short_text_matches_detect(self, client):
+        """Testa que um texto menor que a janela gera as mesmas entidades do /detect."""
+        text = f"Meu CPF é {self.CPF} e meu email é joao.silva@email.com"
+        
+        streamed = _ndjson(client.post("/detect/stream", content=text.encode('utf-8')))
+        detected = client.post("/detect", json={'text': text}).json()['entities']
+        
+        assert streamed == detected
+    
+    def test_text_is_normalized(self, client):
+        """Testa que as posições se referem ao texto normalizado, como no /detect."""
+        text = f"  Meu   CPF\r\né   {self.CPF}  "
+        normalized = api.normalize_text(text)
+        
+        entities = _ndjson(client.post("/detect/stream", content=text.encode('utf-8')))
+        cpfs = [e for e in entities if e['type'] == 'CPF']
+        
+        assert len(cpfs) == 1
+        assert normalized[cpfs[0]['start']:cpfs[0]['end']] == self.CPF
+    
+    def test_windows_overlap_without_duplicates(self, client, monkeypatch):
+        """Testa que dados nas bordas das janelas são emitidos uma única vez."""
+        monkeypatch.setattr(api, 'STREAM_WINDOW_SIZE', 256)
+        monkeypatch.setattr(api, 'STREAM_WINDOW_OVERLAP', 32)
+        
+        # Frases de tamanhos variados deslocam o CPF em relação aos cortes
+        sentences = [
+            "Solicito informações sobre o processo administrativo" + " em andamento" * (i % 7)
+            + f". O documento é {self.CPF}."
+            for i in range(40)
+        ]
+        text = ' '.join(sentences)
+        
+        response = client.post("/detect/stream", content=text.encode('utf-8'))
+        assert response.status_code == 200
+        assert response.headers['content-type'].startswith('application/x-ndjson')
+        
+        cpfs = [e for e in _ndjson(response) if e['type'] == 'CPF']
+        expected = [i for i in range(len(text)) if text.startswith(self.CPF, i)]
+        
+        assert [e['start'] for e in cpfs] == expected
+        assert all(text[e['start']:e['end']] == self.CPF for e in cpfs)
+    
+    def test_disconnected_client_stops_detection(self, client, monkeypatch):
+        """Testa que nenhuma janela é analisada depois de o cliente desconectar."""
+        async def disconnected(self):
+            return True
+        
+        monkeypatch.setattr(Request, 'is_disconnected', disconnected)
+        
+        response = client.post("/detect/stream", content=f"CPF {self.CPF}".encode('utf-8'))
+        
+        assert response.status_code == 200
+        assert response.text == ""
+    
+    def test_invalid_mode(self, client):
+        """Testa que modo inválido retorna 400."""
+        response = client.post("/detect/stream?mode=invalid", content=b"texto")
+        assert response.status_code == 400
+    
+    def test_chunked_body_matches_whole_body(self, client, monkeypatch):
+        """Testa que o corpo em partes (cortando \\r\\n e acentos) dá o mesmo resultado."""
+        monkeypatch.setattr(api, 'STREAM_WINDOW_SIZE', 256)
+        monkeypatch.setattr(api, 'STREAM_WINDOW_OVERLAP', 32)
+        text = ''.join(
+            f"  Solicitação  nº {i}\r\n\tCPF   {self.CPF} ,  email  joão{i}@email.com\r\n\n"
+            for i in range(30)
+        )
+        body = text.encode('utf-8')
+        
+        whole = _ndjson(client.post("/detect/stream", content=body))
+        events = _asgi_stream([body[i:i + 37] for i in range(0, len(body), 37)])
+        
+        assert ('status', 200) in events
+        assert _stream_entities(events) == whole
+        normalized = api.normalize_text(text)
+        assert all(normalized[e['start']:e['end']] == e['value'] for e in whole)
+    
+    def test_entities_stream_before_body_ends(self, client):
+        """Testa que as entidades da primeira janela saem antes do fim do corpo."""
+        first = f"Meu CPF é {self.CPF}. ".encode('utf-8')
+        filler = ("Solicito informações sobre o processo administrativo. " * 100).encode('utf-8')
+        
+        events = _asgi_stream([first + filler, filler, filler, filler])
+        
+        first_body = next(i for i, (kind, _) in enumerate(events) if kind == 'body')
+        last_chunk = events.index(('chunk', 0))
+        assert first_body < last_chunk
+        assert _stream_entities(events)[0]['value'] == self.CPF
+    
+    def test_content_length_over_limit(self, client, monkeypatch):
+        """Testa que um corpo acima do limite (Content-Length) retorna 413."""
+        monkeypatch.setattr(api, 'STREAM_MAX_BYTES', 100)
+        
+        response = client.post("/detect/stream", content=b"x" * 101)
+        
+        assert response.status_code == 413
+    
+    def test_chunked_body_over_limit(self, client, monkeypatch):
+        """Testa que um corpo sem Content-Length é interrompido ao passar do limite."""
+        monkeypatch.setattr(api, 'STREAM_MAX_BYTES', 100)
+        
+        # A resposta já começou: o 413 aborta a conexão em vez de virar status
+        with pytest.raises(RuntimeError) as error:
+            _asgi_stream([b"x" * 60, b"x" * 60])
+        
+        assert isinstance(error.value.__context__, api.HTTPException)
+        assert error.value.__context__.status_code == 413
+    
+    def test_streaming_normalizer_matches_normalize_text(self):
+        """Testa que a normalização incremental equivale à do texto inteiro."""
+        import random
+        rng = random.Random(0)
+        alphabet = [
+            'a', 'Z', 'é', '.', ' ', '  ', '\t', '\n', '\r', '\r\n', '\x01', '\xa0', '\x85',
+        ]
+        
+        for _ in range(2000):
+            text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+            normalizer = api.StreamingTextNormalizer()
+            parts = []
+            position = 0
+            while position < len(text):
+                step = rng.randint(0, 5)
+                parts.append(normalizer.feed(text[position:position + step]))
+                position += step
+            parts.append(normalizer.flush())
+            
+            assert ''.join(parts) == api.normalize_text(text), repr(text)
+
+
+# ============================================================================
+# TESTES DOS DETECTORES POR MODO E DO POOL
+# ============================================================================
+
+class TestModeDetectors:
+    """Testes dos detectores pré-construídos por modo."""
+    
+    TEXT = "Contato: Maria da Silva, CPF 123.456.789-09, telefone (61) 99999-8888"
+    
+    @pytest.mark.parametrize("mode", api.DETECTION_MODES)
+    def test_detect_uses_mode_detector(self, client, mode):
+        """Testa que /detect usa o detector do modo solicitado."""
+        response = client.post("/detect", json={'text': self.TEXT, 'mode': mode})
+        
+        assert response.status_code == 200
+        assert response.json()['metadata']['mode'] == mode
+        expected = api.detectors[mode].detect(api.normalize_text(self.TEXT)).to_dict()
+        assert response.json()['entities'] == expected['entities']
+    
+    def test_get_detector_builds_missing_mode(self, client, monkeypatch):
+        """Testa que um modo ausente é construído uma vez, compartilhando o BERT."""
+        monkeypatch.setattr(api, 'detectors', {})
+        
+        strict = api._get_detector('strict')
+        
+        assert strict.config.mode.value == 'strict'
+        assert strict.bert_model is api.detector.bert_model
+        assert api._get_detector('strict') is strict
+    
+    def test_batch_with_worker_pool(self, client, monkeypatch):
+        """Testa que /detect/batch no pool de processos equivale à detecção sequencial."""
+        texts = [self.TEXT, "Sem dados pessoais aqui.", "Email: joao@email.com"] * 4
+        pool = PIIGuardian.create_worker_pool(api.detectors.values(), workers=1)
+        monkeypatch.setattr(api, 'worker_pool', pool)
+        
+        try:
+            response = client.post("/detect/batch", json={'texts': texts, 'mode': 'strict'})
+        finally:
+            pool.shutdown()
+        
+        data = response.json()
+        expected = [api.detectors['strict'].detect(api.normalize_text(t)).to_dict() for t in texts]
+        assert data['total_processed'] == len(texts)
+        assert data['total_with_pii'] == sum(r['has_pii'] for r in expected)
+        assert [r['entities'] for r in data['results']] == [r['entities'] for r in expected]
+
+
+# ============================================================================
+# TESTES DO CACHE DE NORMALIZAÇÃO
+# ============================================================================
+
+class TestNormalizeCache:
+    """Testes do cache LRU de textos normalizados."""
+    
+    def test_cache_hit_returns_same_text(self, client):
+        """Testa que o mesmo texto é normalizado uma única vez."""
+        first = api._normalize("  Texto   com\r\nespaços  ")
+        second = api._normalize("  Texto   com\r\nespaços  ")
+        
+        assert first == "Texto com\nespaços"
+        assert second is first
+        assert len(api._normalize_cache) == 1
+    
+    def test_cache_keys_are_digests(self, client):
+        """Testa que o cache guarda o digest, e não o texto recebido."""
+        text = "CPF 123.456.789-09"
+        api._normalize(text)
+        
+        (key,) = api._normalize_cache
+        assert key == api._text_digest(text)
+        assert len(key) == 16
+    
+    def test_least_recently_used_is_evicted(self, client, monkeypatch):
+        """Testa que o texto usado há mais tempo sai do cache."""
+        monkeypatch.setattr(api, 'NORMALIZE_CACHE_SIZE', 2)
+        
+        api._normalize("a")
+        api._normalize("b")
+        api._normalize("a")
+        api._normalize("c")
+        
+        assert list(api._normalize_cache) == [api._text_digest("a"), api._text_digest("c")]
+
+
+# ============================================================================
+# TESTES DO ETAG DO /detect
+# ============================================================================
+
+class TestDetectETag:
+    """Testes do ETag e do Cache-Control do /detect."""
+    
+    TEXT = "Meu CPF é 123.456.789-09"
+    
+    def test_response_has_private_etag(self, client):
+        """Testa que a resposta traz ETag e não pode ser guardada por caches compartilhados."""
+        response = client.post("/detect", json={'text': self.TEXT})
+        
+        assert response.status_code == 200
+        assert response.headers['etag'] == client.post(
+            "/detect", json={'text': self.TEXT}
+        ).headers['etag']
+        assert response.headers['cache-control'] == 'private, no-cache'
+    
+    def test_if_none_match_is_ignored_on_post(self, client):
+        """Testa que If-None-Match não gera 304 em POST: a detecção roda de novo."""
+        first = client.post("/detect", json={'text': self.TEXT})
+        
+        for header in (first.headers['etag'], '*', f'W/{first.headers["etag"]}'):
+            response = client.post(
+                "/detect", json={'text': self.TEXT}, headers={'If-None-Match': header}
+            )
+            assert response.status_code == 200
+            assert response.json()['entities'] == first.json()['entities']
+    
+    def test_etag_depends_on_mode(self, client):
+        """Testa que o mesmo texto em outro modo tem outro ETag."""
+        etag = client.post("/detect", json={'text': self.TEXT}).headers['etag']
+        
+        response = client.post("/detect", json={'text': self.TEXT, 'mode': 'strict'})
+        
+        assert response.status_code == 200
+        assert response.headers['etag'] != etag
+    
+    def test_etag_depends_on_config(self, client, monkeypatch):
+        """Testa que alterar os thresholds do detector muda o ETag do mesmo texto."""
+        etag = client.post("/detect", json={'text': self.TEXT}).headers['etag']
+        
+        monkeypatch.setitem(api.detectors['balanced'].config.thresholds, 'CPF', 1.01)
+        response = client.post("/detect", json={'text': self.TEXT})
+        
+        assert response.headers['etag'] != etag
+        assert not any('CPF' in e['type'] for e in response.json()['entities'])
+
+
+# ============================================================================
+# TESTES DA SERIALIZAÇÃO E DA VALIDAÇÃO DE MODOS
+# ============================================================================
+
+class TestResponseClass:
+    """Testes da classe de resposta JSON e da validação dos modos."""
+    
+    def test_default_response_class(self):
+        """Testa que a API usa orjson quando disponível."""
+        expected = api._ORJSONResponse if api.ORJSON_AVAILABLE else api.JSONResponse
+        assert api._JSON_RESPONSE_CLASS is expected
+        assert api.app.router.default_response_class is expected
+    
+    @pytest.mark.skipif(not api.ORJSON_AVAILABLE, reason="orjson não instalado")
+    def test_orjson_render_matches_json(self):
+        """Testa que a resposta orjson decodifica para o mesmo conteúdo do json."""
+        import json
+        content = {'texto': 'São Paulo', 'total': 2, 'by_type': {1: 'CPF'}, 'ok': True}
+        
+        body = api._ORJSONResponse(content).body
+        
+        assert json.loads(body) == json.loads(json.dumps(content))
+        assert 'São Paulo'.encode('utf-8') in body
+    
+    def test_detect_body_is_utf8_json(self, client):
+        """Testa que /detect devolve JSON em UTF-8 com o conteúdo do resultado."""
+        response = client.post("/detect", json={'text': "Endereço: Rua das Flores, 123"})
+        
+        assert response.headers['content-type'] == 'application/json'
+        assert response.json()['metadata']['text_length'] == len("Endereço: Rua das Flores, 123")
+    
+    @pytest.mark.parametrize("endpoint, payload", [
+        ("/detect", {'text': "texto", 'mode': 'invalid'}),
+        ("/detect/batch", {'texts': ["texto"], 'mode': 'invalid'}),
+    ])
+    def test_invalid_mode_rejected(self, client, endpoint, payload):
+        """Testa que modos fora de DETECTION_MODES são rejeitados."""
+        response = client.post(endpoint, json=payload)
+        assert response.status_code == 422
+
+
+# ============================================================================
+# TESTES DOS MODELOS DE RESPOSTA
+# ============================================================================
+
+class TestResponseModels:
+    """Testes de que as respostas sem revalidação seguem os modelos documentados."""
+    
+    TEXT = "Meu CPF é 123.456.789-09 e meu telefone (61) 99999-8888"
+    
+    @pytest.mark.parametrize("path, model", [
+        ("/detect", "DetectResponse"),
+        ("/detect/batch", "BatchDetectResponse"),
+        ("/mask", "MaskResponse"),
+        ("/anonymize", "AnonymizeResponse"),
+    ])
+    def test_openapi_documents_model(self, path, model):
+        """Testa que o OpenAPI continua documentando o modelo da resposta."""
+        schema = api.app.openapi()['paths'][path]['post']['responses']['200']
+        assert schema['content']['application/json']['schema']['$ref'].endswith('/' + model)
+    
+    def test_detect_matches_model(self, client):
+        """Testa que a resposta do /detect é válida para DetectResponse."""
+        data = client.post("/detect", json={'text': self.TEXT}).json()
+        
+        assert api.DetectResponse(**data).dict() == data
+    
+    def test_batch_matches_model(self, client):
+        """Testa que a resposta do /detect/batch é válida para BatchDetectResponse."""
+        data = client.post("/detect/batch", json={'texts': [self.TEXT, "sem dados"]}).json()
+        
+        assert api.BatchDetectResponse(**data).dict() == data
+    
+    def test_transform_endpoints_match_models(self, client):
+        """Testa que /mask e /anonymize seguem os modelos documentados."""
+        masked = client.post("/mask", json={'text': self.TEXT}).json()
+        anonymized = client.post("/anonymize", json={'text': self.TEXT}).json()
+        
+        assert api.MaskResponse(**masked).dict() == masked
+        assert api.AnonymizeResponse(**anonymized).dict() == anonymized
+
+
+# ============================================================================
+# TESTES DO /health
+# ============================================================================
+
+class TestHealth:
+    """Testes do endpoint de saúde e do timestamp reaproveitado."""
+    
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Relógio controlado pelo teste para api.time.time."""
+        now = [1_700_000_000.0]
+        monkeypatch.setattr(api, '_LAST_TS', (0.0, ""))
+        monkeypatch.setattr(api.time, 'time', lambda: now[0])
+        return now
+    
+    def test_health_response(self, client, clock):
+        """Testa o conteúdo da resposta do /health."""
+        data = client.get("/health").json()
+        
+        assert data['status'] == 'healthy'
+        assert data['detector_ready'] is True
+        assert data['timestamp'] == api.datetime.fromtimestamp(clock[0]).isoformat()
+    
+    def test_timestamp_reused_within_one_second(self, clock):
+        """Testa que o timestamp é reaproveitado por até 1 segundo."""
+        first = api._now_iso()
+        clock[0] += 0.5
+        
+        assert api._now_iso() is first
+    
+    def test_timestamp_refreshed_after_one_second(self, clock):
+        """Testa que o timestamp é atualizado depois de 1 segundo."""
+        first = api._now_iso()
+        clock[0] += 1.5
+        
+        refreshed = api._now_iso()
+        assert refreshed != first
+        assert refreshed == api.datetime.fromtimestamp(clock[0]).isoformat()
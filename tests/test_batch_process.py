@@ -0,0 +1,378 @@
+"""
+Testes do Processamento em Lote
+===============================
+
+Testes do BatchProcessor e da leitura/gravação dos arquivos de entrada
+e saída do script de processamento em lote.
+
+Executar:
+    pytest tests/test_batch_process.py -v
+"""
+
+import pytest
+import csv
+import json
+import sys
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts import batch_process as bp
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+TEXTS = [
+    "Meu CPF é 123.456.789-09 e meu telefone (61) 99999-8888",
+    "Solicito informações sobre o processo administrativo.",
+    "Contato: joao.silva@email.com",
+    "",
+    "Eu, Maria Souza, moro no CEP 70000-000",
+] * 8
+
+ITEMS = [(f"r{i}", text) for i, text in enumerate(TEXTS)]
+
+ENTITIES = [
+    {'type': 'CPF', 'value': '123.456.789-09', 'start': 10, 'end': 24, 'confidence': 0.95},
+    {'type': 'NOME_PESSOA', 'value': 'José Conceição', 'start': 30, 'end': 44, 'confidence': 0.8},
+]
+
+
+@pytest.fixture(scope="module")
+def processor():
+    """Processador sequencial, compartilhado pelos testes do módulo."""
+    return bp.BatchProcessor(mode='balanced')
+
+
+def _without_times(results):
+    """Resultados sem o tempo de processamento (varia entre execuções)."""
+    return [{k: v for k, v in r.items() if k != 'processing_time_ms'} for r in results]
+
+
+# ============================================================================
+# TESTES DO PROCESSADOR
+# ============================================================================
+
+class TestProcessItems:
+    """Testes do BatchProcessor.process_items nos modos sequencial, pool e streaming."""
+    
+    def test_sequential_matches_detect(self, processor):
+        """Testa que o processamento em grupos equivale a detect texto a texto."""
+        results = processor.process_items(list(ITEMS))
+        
+        assert [r['id'] for r in results] == [record_id for record_id, _ in ITEMS]
+        for result, (_, text) in zip(results, ITEMS):
+            expected = processor.detector.detect(bp.normalize_text(text))
+            assert result['has_pii'] == expected.has_pii
+            assert result['entities'] == [e.to_dict() for e in expected.entities]
+            assert result['entity_count'] == len(expected.entities)
+            assert result['error'] is None
+    
+    def test_sequential_stream_matches_list(self, processor):
+        """Testa que um iterável (streaming) gera os mesmos resultados da lista."""
+        from_list = processor.process_items(list(ITEMS))
+        from_stream = processor.process_items(iter(ITEMS))
+        
+        assert _without_times(from_stream) == _without_times(from_list)
+    
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_pool_matches_sequential(self, processor, streaming, monkeypatch):
+        """Testa que o pool de processos (lista ou streaming) mantém ordem e resultados."""
+        monkeypatch.setattr(bp, 'STREAM_CHUNK_SIZE', 6)
+        pooled = bp.BatchProcessor(mode='balanced', workers=2)
+        
+        results = pooled.process_items(iter(ITEMS) if streaming else list(ITEMS))
+        
+        assert _without_times(results) == _without_times(processor.process_items(list(ITEMS)))
+        assert pooled.stats['total_processed'] == len(ITEMS)
+    
+    def test_process_batch_columns(self, processor):
+        """Testa process_batch com colunas de texto e id personalizadas."""
+        records = [{'protocolo': f"p{i}", 'pedido': text} for i, text in enumerate(TEXTS[:5])]
+        
+        results = processor.process_batch(records, text_column='pedido', id_column='protocolo')
+        
+        assert [r['id'] for r in results] == ['p0', 'p1', 'p2', 'p3', 'p4']
+        assert [r['has_pii'] for r in results] == [
+            processor.detector.detect(bp.normalize_text(t)).has_pii for t in TEXTS[:5]
+        ]
+    
+    def test_summary(self):
+        """Testa o sumário acumulado pelo processador."""
+        processor = bp.BatchProcessor(mode='balanced')
+        results = processor.process_items(list(ITEMS))
+        summary = processor.get_summary()
+        
+        assert summary['total_processed'] == len(ITEMS)
+        assert summary['total_with_pii'] == sum(bool(r['has_pii']) for r in results)
+        assert summary['total_entities'] == sum(r['entity_count'] for r in results)
+        assert sum(summary['entities_by_type'].values()) == summary['total_entities']
+
+
+# ============================================================================
+# TESTES DA SAÍDA CSV
+# ============================================================================
+
+class TestSaveCSV:
+    """Testes da gravação da saída CSV."""
+    
+    def test_entity_cells_use_json_dumps_format(self, tmp_path):
+        """Testa que as células lista/dict saem como json.dumps(ensure_ascii=False)."""
+        path = tmp_path / 'saida.csv'
+        records = [{'id': '1', 'pii_entities': ENTITIES}, {'id': '2', 'pii_entities': []}]
+        
+        bp.save_csv(records, str(path), ['id', 'pii_entities'])
+        
+        with open(path, encoding='utf-8', newline='') as f:
+            rows = list(csv.DictReader(f))
+        assert rows[0]['pii_entities'] == json.dumps(ENTITIES, ensure_ascii=False)
+        assert rows[1]['pii_entities'] == '[]'
+        assert 'José Conceição' in rows[0]['pii_entities']
+    
+    @pytest.mark.skipif(not bp.PYARROW_AVAILABLE, reason="pyarrow não instalado")
+    def test_table_output_matches_dict_output(self, tmp_path):
+        """Testa que a saída pela tabela Arrow é idêntica à da mescla por dict (save_csv)."""
+        source = tmp_path / 'entrada.csv'
+        with open(source, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['id', 'text', 'orgao'])
+            writer.writerow(['1', 'CPF 123.456.789-09, telefone "fixo"', 'SEEDF'])
+            writer.writerow(['2', 'Linha 1\nLinha 2; acentuação', ''])
+            writer.writerow(['', '', 'CLDF'])
+        results = [
+            {'has_pii': True, 'entity_count': 2, 'entities': ENTITIES},
+            {'has_pii': False, 'entity_count': 0, 'entities': []},
+            {'has_pii': None, 'entity_count': 0, 'entities': []},
+        ]
+        
+        table = bp.load_csv_table(str(source))
+        bp.save_csv_table(table, results, str(tmp_path / 'tabela.csv'))
+        
+        records = bp._read_csv_rows(str(source))
+        merged = [
+            dict(
+                record,
+                pii_detected=r['has_pii'],
+                pii_count=r['entity_count'],
+                pii_entities=r['entities']
+            )
+            for record, r in zip(records, results)
+        ]
+        bp.save_csv(merged, str(tmp_path / 'dict.csv'), list(records[0]) + list(bp.RESULT_COLUMNS))
+        
+        assert (tmp_path / 'tabela.csv').read_bytes() == (tmp_path / 'dict.csv').read_bytes()
+
+
+# ============================================================================
+# TESTES DO POOL COM ENTRADA EM STREAMING
+# ============================================================================
+
+class TestMapBounded:
+    """Testes do mapeamento com janela limitada de tarefas (_map_bounded)."""
+    
+    def test_results_in_input_order(self):
+        """Testa que os resultados saem na ordem de entrada, mesmo terminando fora de ordem."""
+        import random
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        
+        def work(i):
+            time.sleep(random.random() / 500)
+            return i * i
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(bp._map_bounded(executor, work, range(200), 8))
+        
+        assert results == [i * i for i in range(200)]
+    
+    def test_input_is_read_within_window(self):
+        """Testa que a entrada não é lida além da janela à frente do consumidor."""
+        from concurrent.futures import ThreadPoolExecutor
+        read = []
+        
+        def source():
+            for i in range(100):
+                read.append(i)
+                yield i
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for consumed, _ in enumerate(bp._map_bounded(executor, str, source(), 4), 1):
+                assert len(read) <= consumed + 4
+        
+        assert len(read) == 100
+    
+    def test_worker_error_is_raised(self):
+        """Testa que um erro em uma tarefa é relançado ao consumir o resultado."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with pytest.raises(ZeroDivisionError):
+                list(bp._map_bounded(executor, lambda i: 1 / i, [2, 1, 0, 3], 2))
+
+
+# ============================================================================
+# TESTES DA LEITURA ANTECIPADA
+# ============================================================================
+
+class TestPrefetch:
+    """Testes da leitura antecipada em thread (prefetch)."""
+    
+    def test_yields_all_items_in_order(self):
+        """Testa que todos os itens saem na ordem original."""
+        assert list(bp.prefetch(iter(range(1000)), chunk_size=7, depth=2)) == list(range(1000))
+    
+    def test_reader_error_is_raised(self):
+        """Testa que um erro na leitura é relançado no consumidor."""
+        def source():
+            yield 1
+            raise ValueError("linha inválida")
+        
+        with pytest.raises(ValueError, match="linha inválida"):
+            list(bp.prefetch(source(), chunk_size=1))
+    
+    def test_early_stop_closes_source(self):
+        """Testa que parar o consumo encerra a thread e fecha o iterável."""
+        import threading
+        closed = threading.Event()
+        
+        def source():
+            try:
+                for i in range(10**9):
+                    yield i
+            finally:
+                closed.set()
+        
+        stream = bp.prefetch(source(), chunk_size=4, depth=1)
+        assert [next(stream) for _ in range(3)] == [0, 1, 2]
+        stream.close()
+        
+        assert closed.wait(timeout=5)
+    
+    def test_early_stop_ends_reader_thread(self, tmp_path):
+        """Testa que a thread de leitura de um JSONL termina quando o consumo para no meio."""
+        import threading
+        import time
+        path = tmp_path / 'pedidos.jsonl'
+        path.write_text(''.join(f'{{"id": {i}, "text": "texto"}}\n' for i in range(5000)))
+        before = threading.active_count()
+        
+        stream = bp.prefetch(bp.iter_jsonl(str(path)), chunk_size=16, depth=1)
+        assert next(stream)['id'] == 0
+        stream.close()
+        
+        deadline = time.monotonic() + 5
+        while threading.active_count() > before and time.monotonic() < deadline:
+            time.sleep(bp.PREFETCH_POLL_INTERVAL)
+        assert threading.active_count() == before
+
+
+# ============================================================================
+# TESTES DE LEITURA E IDA E VOLTA DOS ARQUIVOS
+# ============================================================================
+
+def _run_main(monkeypatch, *args):
+    """Executa o main do script com os argumentos da linha de comando."""
+    monkeypatch.setattr(sys, 'argv', ['batch_process.py', *args])
+    bp.main()
+
+
+class TestFileRoundTrip:
+    """Testes de leitura da entrada e ida e volta pelo script (CSV, JSON, JSONL)."""
+    
+    @pytest.fixture
+    def csv_input(self, tmp_path):
+        """CSV de entrada com aspas, vírgulas, quebras de linha e célula vazia."""
+        path = tmp_path / 'pedidos.csv'
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['id', 'text', 'orgao'])
+            for record_id, text in ITEMS[:10]:
+                writer.writerow([record_id, text + '\nlinha, "final"', 'SEEDF'])
+        return path
+    
+    @pytest.fixture
+    def jsonl_input(self, tmp_path):
+        """JSONL de entrada com uma linha em branco."""
+        path = tmp_path / 'pedidos.jsonl'
+        lines = [
+            json.dumps({'id': record_id, 'text': text}, ensure_ascii=False)
+            for record_id, text in ITEMS
+        ]
+        path.write_text('\n'.join(lines[:5] + [''] + lines[5:]) + '\n', encoding='utf-8')
+        return path
+    
+    def test_load_csv_matches_dict_reader(self, csv_input):
+        """Testa que a leitura pela tabela Arrow gera os mesmos registros do DictReader."""
+        assert bp.load_csv(str(csv_input)) == bp._read_csv_rows(str(csv_input))
+    
+    def test_iter_jsonl_skips_blank_lines(self, jsonl_input):
+        """Testa a leitura do JSONL em streaming."""
+        records = list(bp.iter_jsonl(str(jsonl_input)))
+        assert [(r['id'], r['text']) for r in records] == ITEMS
+    
+    @pytest.mark.parametrize("layout", ['list', 'data', 'records'])
+    def test_load_json_layouts(self, tmp_path, layout):
+        """Testa os formatos de JSON aceitos pelo load_json."""
+        records = [{'id': record_id, 'text': text} for record_id, text in ITEMS[:3]]
+        path = tmp_path / 'pedidos.json'
+        data = records if layout == 'list' else {layout: records}
+        path.write_text(json.dumps(data), encoding='utf-8')
+        
+        assert bp.load_json(str(path)) == records
+    
+    def test_csv_round_trip(self, csv_input, tmp_path, monkeypatch, processor):
+        """Testa CSV -> CSV: colunas originais preservadas e colunas de resultado acrescentadas."""
+        output = tmp_path / 'saida.csv'
+        _run_main(monkeypatch, '-i', str(csv_input), '-o', str(output))
+        
+        source = bp._read_csv_rows(str(csv_input))
+        with open(output, encoding='utf-8', newline='') as f:
+            rows = list(csv.DictReader(f))
+        
+        assert [{k: row[k] for k in ('id', 'text', 'orgao')} for row in rows] == source
+        for row, record in zip(rows, source):
+            expected = processor.process_text(record['text'], record['id'])
+            assert row['pii_detected'] == str(expected['has_pii'])
+            assert row['pii_count'] == str(expected['entity_count'])
+            assert json.loads(row['pii_entities']) == expected['entities']
+    
+    @pytest.mark.parametrize("workers", ['1', '2'])
+    def test_jsonl_to_json(self, jsonl_input, tmp_path, monkeypatch, processor, workers):
+        """Testa JSONL -> JSON em streaming (sequencial e com pool)."""
+        output = tmp_path / 'saida.json'
+        _run_main(monkeypatch, '-i', str(jsonl_input), '-o', str(output), '-w', workers)
+        
+        data = json.loads(output.read_text(encoding='utf-8'))
+        
+        assert data['summary']['total_processed'] == len(ITEMS)
+        expected = processor.process_items(list(ITEMS))
+        assert _without_times(data['results']) == _without_times(expected)
+    
+    def test_jsonl_to_csv(self, jsonl_input, tmp_path, monkeypatch):
+        """Testa JSONL -> CSV: a saída CSV traz os campos originais de cada registro."""
+        output = tmp_path / 'saida.csv'
+        _run_main(monkeypatch, '-i', str(jsonl_input), '-o', str(output))
+        
+        with open(output, encoding='utf-8', newline='') as f:
+            rows = list(csv.DictReader(f))
+        
+        assert [(row['id'], row['text']) for row in rows] == ITEMS
+        assert list(rows[0]) == ['id', 'text', *bp.RESULT_COLUMNS]
+    
+    def test_missing_column_exits(self, csv_input, tmp_path, monkeypatch):
+        """Testa que uma coluna de texto inexistente encerra o script com erro."""
+        with pytest.raises(SystemExit):
+            _run_main(
+                monkeypatch, '-i', str(csv_input), '-o', str(tmp_path / 'x.csv'), '-c', 'texto'
+            )
+    
+    def test_header_only_csv_checks_column(self, tmp_path, monkeypatch):
+        """Testa que um CSV só com cabeçalho também tem a coluna verificada."""
+        path = tmp_path / 'vazio.csv'
+        path.write_text('id,text\n', encoding='utf-8')
+        
+        with pytest.raises(SystemExit):
+            _run_main(monkeypatch, '-i', str(path), '-o', str(tmp_path / 'x.csv'), '-c', 'texto')
@@ -10,13 +10,16 @@ Executar:
 """
 
 import pytest
+import re
 import sys
 from pathlib import Path
 
 # Adiciona diretório raiz ao path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.detector import PIIGuardian, DetectionMode, DetectionResult
+from src.detector import PIIGuardian, DetectionMode, DetectionResult, DetectionConfig
+from src.utils import mask_pii, anonymize_text
+from src import patterns as pii_patterns
 
 
 # ============================================================================
@@ -69,6 +72,14 @@ class TestInitialization:
         with pytest.raises(ValueError):
             PIIGuardian(mode='invalid_mode')
 
+    def test_instances_share_compiled_patterns(self):
+        """Testa que os padrões compilados são compartilhados entre instâncias."""
+        first = PIIGuardian(mode='strict')
+        second = PIIGuardian(mode='precise')
+        assert first.patterns is second.patterns
+        assert first.contextual is second.contextual
+        assert first.validators is not second.validators
+
 
 # ============================================================================
 # TESTES DE DETECÇÃO DE CPF
@@ -122,6 +133,23 @@ class TestCPFDetection:
         cpf_entities = [e for e in result.entities if 'CPF' in e.type]
         if cpf_entities:
             assert cpf_entities[0].confidence < 0.5
+    
+    def test_replaced_validator_is_used(self):
+        """Testa que um validador substituído na instância é respeitado."""
+        from src.validators import ValidationResult
+        
+        class RejectAll:
+            def validate(self, value):
+                return ValidationResult(is_valid=False, confidence=0.0, message="rejeitado")
+        
+        detector = PIIGuardian(config=DetectionConfig(result_cache_size=0))
+        detector.validators['CPF'] = RejectAll()
+        result = detector.detect("Meu CPF é 529.982.247-25")
+        
+        assert not any(e.base_type == 'CPF' for e in result.entities)
+        # Outras instâncias continuam com o validador padrão
+        stock = PIIGuardian(config=DetectionConfig(result_cache_size=0))
+        assert any(e.base_type == 'CPF' for e in stock.detect("CPF: 529.982.247-25").entities)
 
 
 # ============================================================================
@@ -390,6 +418,17 @@ class TestDetectionResult:
         assert 'total_entities' in result.summary
         assert 'by_type' in result.summary
         assert result.summary['total_entities'] >= 0
+    
+    def test_detect_and_transform_matches_utils(self, detector):
+        """Testa que a transformação fundida equivale a mask_pii/anonymize_text."""
+        text = "CPF: 123.456.789-09, Email: a@b.com, Tel: (61) 99999-8888"
+        entities = [e.to_dict() for e in detector.detect(text).entities]
+        
+        _, masked = detector.detect_and_transform(text, 'mask', '#')
+        _, anonymized = detector.detect_and_transform(text, 'anonymize')
+        
+        assert masked == mask_pii(text, entities, '#')
+        assert anonymized == anonymize_text(text, entities)
 
 
 # ============================================================================
@@ -424,6 +463,281 @@ class TestPerformance:
         assert result.metadata['processing_time_ms'] < 10000
 
 
+# ============================================================================
+# TESTES DE DETECÇÃO EM LOTE
+# ============================================================================
+
+class TestBatchDetection:
+    """Testes da detecção em lote."""
+    
+    def test_batch_matches_single_detection(self, detector):
+        """Testa que o lote produz as mesmas entidades que chamadas individuais."""
+        texts = [
+            "CPF: 123.456.789-09",
+            "Solicito informações sobre o processo.",
+            "Email: teste@email.com e telefone (61) 99999-8888",
+        ]
+        
+        batch_results = detector.detect_batch(texts)
+        
+        assert len(batch_results) == len(texts)
+        for text, batch_result in zip(texts, batch_results):
+            single_result = detector.detect(text)
+            assert batch_result.has_pii == single_result.has_pii
+            assert [e.to_dict() for e in batch_result.entities] == \
+                [e.to_dict() for e in single_result.entities]
+    
+    def test_batch_contextual_matches_single_detection(self):
+        """Testa o pré-filtro contextual do lote (textos vizinhos concatenados)."""
+        texts = [
+            "Favor ligar no meu telefone",
+            "9999-8888 é o número",
+            "Meu CPF:",
+            "123.456.789-09",
+            "O requerente Sr. João da Silva solicita",
+            "Solicito informações sobre o processo.",
+        ]
+        detector = PIIGuardian(config=DetectionConfig(use_bert=False, result_cache_size=0))
+
+        batch_results = detector.detect_batch(texts)
+
+        for text, batch_result in zip(texts, batch_results):
+            assert [e.to_dict() for e in batch_result.entities] == \
+                [e.to_dict() for e in detector.detect(text).entities]
+
+    def test_batch_with_empty_texts(self, detector):
+        """Testa lote com textos vazios intercalados."""
+        results = detector.detect_batch(["", "CPF: 123.456.789-09", "   "])
+        
+        assert not results[0].has_pii
+        assert results[1].has_pii
+        assert not results[2].has_pii
+    
+    def test_empty_batch(self, detector):
+        """Testa lote vazio."""
+        assert detector.detect_batch([]) == []
+
+    def test_detect_many_matches_batch(self):
+        """Testa que a detecção em vários processos equivale ao lote."""
+        texts = [
+            "CPF: 123.456.789-09",
+            "",
+            "Email: teste@email.com e telefone (61) 99999-8888",
+            "Solicito informações sobre o processo.",
+        ]
+        config = DetectionConfig(use_bert=False, result_cache_size=0)
+        detector = PIIGuardian(config=config)
+
+        many_results = detector.detect_many(texts, workers=2, chunksize=1)
+        batch_results = detector.detect_batch(texts)
+
+        assert [r.has_pii for r in many_results] == [r.has_pii for r in batch_results]
+        for many_result, batch_result in zip(many_results, batch_results):
+            assert [e.to_dict() for e in many_result.entities] == \
+                [e.to_dict() for e in batch_result.entities]
+
+    def test_detect_many_reuses_worker_pool(self):
+        """Testa que um pool criado uma vez atende detectores de vários modos."""
+        texts = ["CPF: 123.456.789-09", "Email: teste@email.com"]
+        detectors = [
+            PIIGuardian(config=DetectionConfig(mode=mode, use_bert=False, result_cache_size=0))
+            for mode in (DetectionMode.STRICT, DetectionMode.PRECISE)
+        ]
+
+        with PIIGuardian.create_worker_pool(detectors, workers=2) as pool:
+            for detector in detectors:
+                many_results = detector.detect_many(texts, executor=pool)
+                batch_results = detector.detect_batch(texts)
+                assert [[e.to_dict() for e in r.entities] for r in many_results] == \
+                    [[e.to_dict() for e in r.entities] for r in batch_results]
+
+    def test_detect_many_uses_current_config(self):
+        """Testa que alterações no config depois de criar o pool chegam aos processos."""
+        detector = PIIGuardian(config=DetectionConfig(use_bert=False, result_cache_size=0))
+        texts = ["CPF: 123.456.789-09"]
+
+        with PIIGuardian.create_worker_pool([detector], workers=1) as pool:
+            assert detector.detect_many(texts, executor=pool)[0].has_pii
+            detector.config.thresholds['CPF'] = 1.01
+            entities = detector.detect_many(texts, executor=pool)[0].entities
+
+        assert not any(e.base_type == 'CPF' for e in entities)
+
+    def test_detect_many_reports_parent_bert_flag(self):
+        """Testa que bert_enabled reflete o detector principal, não o do processo."""
+        detector = PIIGuardian(config=DetectionConfig(use_bert=False, result_cache_size=0))
+        # Modelo fictício: com use_bert=False a fase BERT não é executada
+        detector.bert_model = object()
+
+        result = detector.detect_many(["CPF: 123.456.789-09"], workers=1)[0]
+
+        assert result.metadata['bert_enabled'] is True
+
+
+# ============================================================================
+# TESTES DO PRÉ-FILTRO DOS PADRÕES REGEX
+# ============================================================================
+
+class TestRegexPrefilter:
+    """Testes dos pré-filtros (Hyperscan/RE2) da bateria de regex."""
+    
+    # Casa "é" + "x" no texto original; com "é" trocado por "a" (Hyperscan)
+    # a classe negada deixaria de casar
+    NEGATED = re.compile(r'[^a-z]x', re.IGNORECASE)
+    
+    @pytest.mark.parametrize("pattern,expected", [
+        (r'[^a-z]x', True),
+        (r'\Sx', True),
+        (r'\D{2}', True),
+        (r'\W', True),
+        (r'cpf(?!\d)', True),
+        (r'(?<!\d)\d{3}', True),
+        (r'[a-z^]x', False),
+        (r'\d{3}\.?\d{3}', False),
+        (r'\\S', False),
+    ])
+    def test_has_negation(self, pattern, expected):
+        """Testa a detecção de classes negadas e lookarounds negativos."""
+        assert pii_patterns._has_negation(pattern) is expected
+    
+    @pytest.mark.skipif(not pii_patterns.HYPERSCAN_AVAILABLE, reason="hyperscan não instalado")
+    def test_hyperscan_always_runs_negated_pattern(self, tmp_path, monkeypatch):
+        """Testa que padrão com classe negada fica fora do banco do Hyperscan."""
+        monkeypatch.setattr(pii_patterns, 'HYPERSCAN_CACHE_DIR', tmp_path)
+        plain = re.compile(r'\d{3}', re.IGNORECASE)
+        prefilter = pii_patterns._HyperscanPrefilter([plain, self.NEGATED])
+        
+        assert prefilter.always == {1}
+        assert self.NEGATED.search("éx")
+        assert self.NEGATED in prefilter.candidates("éx")
+    
+    @pytest.mark.skipif(not pii_patterns.RE2_AVAILABLE, reason="google-re2 não instalado")
+    def test_re2_always_runs_negated_pattern(self):
+        """Testa que padrão com classe negada não ganha versão RE2."""
+        assert pii_patterns._re2_superset(self.NEGATED.pattern, self.NEGATED.flags) is None
+        
+        prefilter = pii_patterns._RE2Prefilter([self.NEGATED])
+        assert self.NEGATED in prefilter.candidates("éx")
+
+
+# ============================================================================
+# TESTES DO PRÉ-FILTRO DO BERT
+# ============================================================================
+
+class TestBertPrescreen:
+    """Testes do pré-filtro que decide quais textos passam pelo BERT."""
+    
+    @pytest.fixture
+    def bert_calls(self, monkeypatch):
+        """Detector com um BERT fictício que registra os textos recebidos."""
+        detector = PIIGuardian(config=DetectionConfig(result_cache_size=0))
+        calls = []
+        
+        def fake_bert(texts, batch_size=32):
+            calls.extend(texts)
+            return [[] for _ in texts]
+        
+        monkeypatch.setattr(detector, 'bert_model', object())
+        monkeypatch.setattr(detector, '_bert_contextual_detection_batch', fake_bert)
+        return detector, calls
+    
+    def test_lowercase_name_reaches_bert(self, bert_calls):
+        """Testa que nome todo em minúsculas ainda passa pelo BERT."""
+        detector, calls = bert_calls
+        text = "meu nome é joão silva"
+        detector.detect(text)
+        
+        assert calls == [text]
+    
+    def test_lowercase_address_marker_reaches_bert(self, bert_calls):
+        """Testa que marcador de endereço em minúsculas passa pelo BERT."""
+        detector, calls = bert_calls
+        text = "moro na rua das flores"
+        detector.detect(text)
+        
+        assert calls == [text]
+    
+    def test_text_without_pii_hint_skips_bert(self, bert_calls):
+        """Testa que texto sem indício de PII não passa pelo BERT."""
+        detector, calls = bert_calls
+        detector.detect("obrigado pelo retorno")
+        
+        assert calls == []
+    
+    def test_prescreen_disabled_always_runs_bert(self, bert_calls):
+        """Testa que bert_prescreen=False envia todo texto ao BERT."""
+        detector, calls = bert_calls
+        detector.config.bert_prescreen = False
+        detector.detect("obrigado pelo retorno")
+        
+        assert calls == ["obrigado pelo retorno"]
+
+
+# ============================================================================
+# TESTES DO CACHE DE RESULTADOS
+# ============================================================================
+
+class TestResultCache:
+    """Testes do cache de resultados por texto."""
+    
+    def test_cached_result_matches_original(self, detector):
+        """Testa que a segunda chamada devolve as mesmas entidades."""
+        text = "CPF: 123.456.789-09, Email: a@b.com"
+        first = detector.detect(text)
+        second = detector.detect(text)
+        
+        assert [e.to_dict() for e in first.entities] == [e.to_dict() for e in second.entities]
+        assert first.summary == second.summary
+    
+    def test_cached_result_is_independent_copy(self, detector):
+        """Testa que alterar um resultado não afeta o cache."""
+        text = "CPF: 123.456.789-09"
+        first = detector.detect(text)
+        first.entities[0].value = "alterado"
+        first.summary['by_type'].clear()
+        
+        second = detector.detect(text)
+        assert second.entities[0].value != "alterado"
+        assert second.summary['by_type']
+    
+    def test_cache_keys_do_not_hold_text(self, detector):
+        """Testa que o cache guarda um digest de tamanho fixo, não o texto."""
+        text = "CPF: 123.456.789-09. " + "Texto longo. " * 200
+        detector.detect(text)
+        
+        for fingerprint, digest in detector._result_cache:
+            assert isinstance(digest, bytes)
+            assert len(digest) == 16
+    
+    def test_config_change_invalidates_cached_result(self):
+        """Testa que alterar thresholds depois de uma detecção vale para o mesmo texto."""
+        detector = PIIGuardian(config=DetectionConfig(use_bert=False))
+        text = "CPF: 123.456.789-09, Email: a@b.com"
+        assert detector.detect(text).has_pii
+        
+        for entity_type in detector.config.thresholds:
+            detector.config.thresholds[entity_type] = 1.01
+        
+        assert not detector.detect(text).has_pii
+    
+    def test_mode_change_invalidates_cached_result(self):
+        """Testa que trocar o modo não reaproveita o resultado do modo anterior."""
+        detector = PIIGuardian(config=DetectionConfig(use_bert=False))
+        text = "Número: 99999-8888"
+        detector.detect(text)
+        
+        detector.config.mode = DetectionMode.STRICT
+        
+        assert detector.detect(text).metadata['mode'] == 'strict'
+    
+    def test_cache_disabled(self):
+        """Testa que result_cache_size=0 desabilita o cache."""
+        detector = PIIGuardian(config=DetectionConfig(result_cache_size=0))
+        detector.detect("CPF: 123.456.789-09")
+        
+        assert len(detector._result_cache) == 0
+
+
 # ============================================================================
 # TESTES DE MODOS
 # ============================================================================
@@ -452,6 +766,16 @@ class TestDetectionModes:
         # Ambos devem detectar CPF claro
         assert result_strict.has_pii
         assert result_precise.has_pii
+    
+    def test_threshold_change_applies_to_next_detection(self):
+        """Testa que alterar config.thresholds vale para as próximas detecções."""
+        detector = PIIGuardian(config=DetectionConfig(use_bert=False, result_cache_size=0))
+        text = "CPF: 123.456.789-09"
+        assert detector.detect(text).has_pii
+        
+        detector.config.thresholds['CPF'] = 1.01
+        
+        assert not any(e.base_type == 'CPF' for e in detector.detect(text).entities)
 
 
 # ============================================================================
@@ -0,0 +1,158 @@
+"""
+Testes do Script de Avaliação
+=============================
+
+Testes das métricas calculadas pelo Evaluator sobre um conjunto pequeno
+de casos com resultado conhecido.
+
+Executar:
+    pytest tests/test_evaluate.py -v
+"""
+
+import pytest
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Adiciona diretório raiz ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts import evaluate as ev
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+# Casos de teste e o que o detector "encontra" em cada um
+CASES = [
+    {'id': 'cpf', 'text': "CPF 123.456.789-09",
+     'entities': [{'type': 'CPF', 'value': '123.456.789-09'}]},
+    {'id': 'email', 'text': "Email joao@email.com",
+     'entities': [{'type': 'EMAIL', 'value': 'joao@email.com'}]},
+    {'id': 'telefone', 'text': "Protocolo 6199998888",
+     'entities': []},
+    {'id': 'limpo', 'text': "Solicito informações.",
+     'entities': []},
+    {'id': 'nome', 'text': "Eu, Maria Souza, solicito",
+     'entities': [{'type': 'NOME_PESSOA', 'value': 'Maria Souza'}]},
+]
+
+DETECTIONS = {
+    "CPF 123.456.789-09": [('CPF', '12345678909')],
+    "Email joao@email.com": [],
+    "Protocolo 6199998888": [('TELEFONE', '(61) 9999-8888')],
+    "Solicito informações.": [],
+    "Eu, Maria Souza, solicito": [('NOME_PESSOA_CONTEXTUAL', 'maria souza')],
+}
+
+
+class FixedDetector:
+    """Detector com resultados fixos por texto (DETECTIONS)."""
+    
+    def detect(self, text):
+        entities = [SimpleNamespace(type=t, value=v) for t, v in DETECTIONS[text]]
+        return SimpleNamespace(entities=entities, has_pii=bool(entities))
+
+
+@pytest.fixture
+def evaluator():
+    """Avaliador com o detector de resultados fixos."""
+    return ev.Evaluator(FixedDetector())
+
+
+@pytest.fixture
+def test_cases():
+    """Casos de teste do conjunto fixo."""
+    return [ev.TestCase.from_dict(case) for case in CASES]
+
+
+# ============================================================================
+# TESTES DAS MÉTRICAS
+# ============================================================================
+
+class TestEvaluatorMetrics:
+    """Testes das métricas do Evaluator."""
+    
+    def test_counts(self, evaluator, test_cases):
+        """Testa TP, FP, FN e TN do conjunto fixo."""
+        metrics = evaluator.evaluate(test_cases)
+        
+        assert metrics.true_positives == 2
+        assert metrics.false_positives == 1
+        assert metrics.false_negatives == 1
+        assert metrics.true_negatives == 1
+    
+    def test_derived_metrics(self, evaluator, test_cases):
+        """Testa precisão, recall, F1 e acurácia."""
+        metrics = evaluator.evaluate(test_cases).to_dict()
+        
+        assert metrics['precision'] == pytest.approx(0.6667)
+        assert metrics['recall'] == pytest.approx(0.6667)
+        assert metrics['f1_score'] == pytest.approx(0.6667)
+        assert metrics['accuracy'] == pytest.approx(0.6)
+    
+    def test_by_type(self, evaluator, test_cases):
+        """Testa as contagens por tipo, na ordem em que os tipos aparecem."""
+        by_type = evaluator.evaluate(test_cases).by_type
+        
+        assert list(by_type) == ['CPF', 'EMAIL', 'TELEFONE', 'NOME_PESSOA']
+        assert by_type['CPF'] == {'tp': 1, 'fp': 0, 'fn': 0}
+        assert by_type['EMAIL'] == {'tp': 0, 'fp': 0, 'fn': 1}
+        assert by_type['TELEFONE'] == {'tp': 0, 'fp': 1, 'fn': 0}
+        assert by_type['NOME_PESSOA'] == {'tp': 1, 'fp': 0, 'fn': 0}
+    
+    def test_errors_and_results(self, evaluator, test_cases):
+        """Testa o registro de falsos negativos e o resultado por caso."""
+        evaluator.evaluate(test_cases)
+        
+        assert [e['id'] for e in evaluator.errors] == ['email']
+        assert evaluator.errors[0]['expected'] == [('EMAIL', 'joao@emailcom')]
+        assert [r['id'] for r in evaluator.results if r['correct']] == ['cpf', 'limpo', 'nome']
+    
+    def test_repeated_evaluate_accumulates(self, evaluator, test_cases):
+        """Testa que chamadas seguidas de evaluate acumulam as contagens."""
+        evaluator.evaluate(test_cases)
+        metrics = evaluator.evaluate(test_cases)
+        
+        assert metrics.true_positives == 4
+        assert metrics.by_type['CPF'] == {'tp': 2, 'fp': 0, 'fn': 0}
+    
+    def test_empty_set(self, evaluator):
+        """Testa que um conjunto vazio não divide por zero."""
+        metrics = evaluator.evaluate([])
+        
+        assert metrics.precision == metrics.recall == metrics.accuracy == 0.0
+        assert metrics.by_type == {}
+
+
+# ============================================================================
+# TESTES DOS CASOS DE TESTE
+# ============================================================================
+
+class TestTestCase:
+    """Testes da normalização dos casos de teste."""
+    
+    def test_normalized_keys(self):
+        """Testa que tipo e valor esperados são normalizados na criação."""
+        case = ev.TestCase.from_dict({
+            'id': '1', 'text': 'x',
+            'entities': [{'type': 'TELEFONE_CONTEXTUAL', 'value': ' (61) 9999-8888 '}]
+        })
+        
+        assert case.expected_keys == (('TELEFONE', '6199998888'),)
+        assert case.normalized == frozenset(case.expected_keys)
+        assert case.expected_has_pii
+    
+    @pytest.mark.parametrize("layout", ['list', 'test_cases', 'data'])
+    def test_load_test_data(self, tmp_path, layout):
+        """Testa os formatos aceitos pelo load_test_data."""
+        path = tmp_path / 'casos.json'
+        data = CASES if layout == 'list' else {layout: CASES}
+        path.write_text(json.dumps(data), encoding='utf-8')
+        
+        cases = ev.load_test_data(str(path))
+        
+        assert [c.id for c in cases] == [case['id'] for case in CASES]
+        assert [c.expected_has_pii for c in cases] == [True, True, False, False, True]
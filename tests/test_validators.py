@@ -20,7 +20,14 @@ from src.validators import (
     PhoneValidator,
     EmailValidator,
     CEPValidator,
-    ValidationResult
+    ValidationResult,
+    validate_cpf,
+    validate_cnpj,
+    validate_cpf_bytes,
+    validate_cnpj_bytes,
+    validate_all,
+    validation_cache_info,
+    clear_validation_caches
 )
 
 
@@ -84,6 +91,31 @@ class TestCPFValidator:
         first, second = validator.calculate_check_digits("529982247")
         assert first == 2
         assert second == 5
+    
+    def test_validate_batch_matches_validate(self, validator):
+        """Testa que a validação em lote concorda com a individual."""
+        cpfs = self.VALID_CPFS + self.INVALID_CPFS
+        
+        assert CPFValidator.validate_batch(cpfs) == \
+            [validator.validate(cpf).is_valid for cpf in cpfs]
+    
+    def test_validate_batch_without_numpy(self, validator, monkeypatch):
+        """Testa o caminho em Python puro (SWAR) da validação em lote."""
+        monkeypatch.setattr("src.validators.NUMPY_AVAILABLE", False)
+        cpfs = self.VALID_CPFS + self.INVALID_CPFS
+        
+        assert CPFValidator.validate_batch(cpfs) == \
+            [validator.validate(cpf).is_valid for cpf in cpfs]
+    
+    @pytest.mark.parametrize("cpf", VALID_CPFS + INVALID_CPFS)
+    def test_module_function_matches_class(self, validator, cpf):
+        """Testa que validate_cpf equivale a CPFValidator.validate."""
+        assert validate_cpf(cpf) == validator.validate(cpf)
+    
+    @pytest.mark.parametrize("cpf", VALID_CPFS + INVALID_CPFS)
+    def test_bytes_api_matches_str(self, cpf):
+        """Testa que validate_cpf_bytes equivale à versão em str."""
+        assert validate_cpf_bytes(cpf.encode()) == validate_cpf(cpf)
 
 
 # ============================================================================
@@ -128,6 +160,31 @@ class TestCNPJValidator:
     def test_format_cnpj(self, validator):
         """Testa formatação de CNPJ."""
         assert validator.format("11222333000181") == "11.222.333/0001-81"
+    
+    def test_validate_batch_matches_validate(self, validator):
+        """Testa que a validação em lote concorda com a individual."""
+        cnpjs = self.VALID_CNPJS + self.INVALID_CNPJS
+        
+        assert CNPJValidator.validate_batch(cnpjs) == \
+            [validator.validate(cnpj).is_valid for cnpj in cnpjs]
+    
+    def test_validate_batch_without_numpy(self, validator, monkeypatch):
+        """Testa o caminho em Python puro (SWAR) da validação em lote."""
+        monkeypatch.setattr("src.validators.NUMPY_AVAILABLE", False)
+        cnpjs = self.VALID_CNPJS + self.INVALID_CNPJS
+        
+        assert CNPJValidator.validate_batch(cnpjs) == \
+            [validator.validate(cnpj).is_valid for cnpj in cnpjs]
+    
+    @pytest.mark.parametrize("cnpj", VALID_CNPJS + INVALID_CNPJS)
+    def test_module_function_matches_class(self, validator, cnpj):
+        """Testa que validate_cnpj equivale a CNPJValidator.validate."""
+        assert validate_cnpj(cnpj) == validator.validate(cnpj)
+    
+    @pytest.mark.parametrize("cnpj", VALID_CNPJS + INVALID_CNPJS)
+    def test_bytes_api_matches_str(self, cnpj):
+        """Testa que validate_cnpj_bytes equivale à versão em str."""
+        assert validate_cnpj_bytes(cnpj.encode()) == validate_cnpj(cnpj)
 
 
 # ============================================================================
@@ -286,5 +343,64 @@ class TestValidationResult:
         assert result.cleaned_value is None
 
 
+# ============================================================================
+# TESTES DO CACHE DE VALIDAÇÃO
+# ============================================================================
+
+class TestValidationCache:
+    """Testes do cache LRU dos validadores."""
+    
+    def test_formats_share_cache_entry(self):
+        """Testa que formatos diferentes do mesmo CPF usam a mesma entrada."""
+        clear_validation_caches()
+        validator = CPFValidator()
+        
+        first = validator.validate("529.982.247-25")
+        second = validator.validate("52998224725")
+        
+        assert first == second
+        assert validation_cache_info()['CPFValidator'].hits == 1
+    
+    def test_cached_result_is_immutable(self):
+        """Testa que o resultado em cache não pode ser alterado."""
+        validator = EmailValidator()
+        
+        result = validator.validate("teste@email.com")
+        
+        with pytest.raises(AttributeError):
+            result.message = "alterado"
+        assert validator.validate(" TESTE@email.com ") is result
+
+
+# ============================================================================
+# TESTES DA VALIDAÇÃO EM LOTE
+# ============================================================================
+
+class TestValidateAll:
+    """Testes da validação em lote por tipo."""
+    
+    def test_matches_individual_validators_in_order(self):
+        """Testa que validate_all preserva a ordem e os resultados individuais."""
+        items = [
+            ('CPF', '529.982.247-25'),
+            ('EMAIL', 'usuario@exemplo.com'),
+            ('CNPJ', '12.345.678/0001-00'),
+            ('CELULAR', '(11) 99999-8888'),
+            ('CPF', '111.111.111-11'),
+            ('CEP', '70000-000'),
+            ('NOME', 'Maria Silva'),
+        ]
+        
+        results = validate_all(items)
+        
+        assert results[0] == CPFValidator().validate('529.982.247-25')
+        assert results[1] == EmailValidator().validate('usuario@exemplo.com')
+        assert results[2] == CNPJValidator().validate('12.345.678/0001-00')
+        assert results[3] == PhoneValidator().validate('(11) 99999-8888')
+        assert results[4] == CPFValidator().validate('111.111.111-11')
+        assert results[5] == CEPValidator().validate('70000-000')
+        assert results[6] is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])